@@ -1,6 +1,11 @@
 from fastapi import APIRouter, Depends, Response
+from core.config import config
 from core.exceptions import ExceptionResponseSchema, DecodeTokenException
 from core.fastapi.dependencies.permission import AllowAll, PermissionDependency
+from core.fastapi.dependencies.rate_limit import (
+    RateLimitDependency,
+    refresh_token_key,
+)
 from core.fastapi_versioning import version
 
 from api.auth.v1.request.auth import RefreshTokenRequest, UUIDSchema, VerifyTokenRequest
@@ -15,8 +20,18 @@ auth_v1_router = APIRouter()
 @auth_v1_router.post(
     "/refresh",
     response_model=TokensSchema,
-    responses={"400": {"model": ExceptionResponseSchema}},
-    dependencies=[Depends(PermissionDependency([[AllowAll]]))],
+    responses={
+        "400": {"model": ExceptionResponseSchema},
+        "429": {"model": ExceptionResponseSchema},
+    },
+    dependencies=[
+        Depends(
+            RateLimitDependency(
+                "auth_refresh", config.RATE_LIMIT_REFRESH, key=refresh_token_key
+            )
+        ),
+        Depends(PermissionDependency([[AllowAll]])),
+    ],
 )
 @version(1)
 async def refresh_token(request: RefreshTokenRequest):
@@ -0,0 +1,203 @@
+# pylint: skip-file
+import time
+import uuid
+from typing import Dict
+
+import jwt
+import pytest
+
+from httpx import AsyncClient
+
+from app.user.services.user import UserService
+from app.user.utils import PWD_CONTEXT
+from core.config import config
+from core.db.standalone_session import standalone_session
+from core.exceptions import DecodeTokenException, ExpiredTokenException
+from core.utils.token_helper import TokenHelper, verified_tokens
+
+
+async def login(client: AsyncClient) -> dict:
+    login_data = {"username": "normal_user", "password": "normal_user"}
+    res = await client.post("/api/latest/auth/login", json=login_data)
+    return res.json()
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token(client: AsyncClient):
+    tokens = await login(client)
+
+    res = await client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    rotated = res.json()
+
+    assert res.status_code == 200
+    assert rotated["refresh_token"] != tokens["refresh_token"]
+
+    res = await client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+    )
+
+    assert res.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_refresh_reuse_revokes_family(client: AsyncClient):
+    tokens = await login(client)
+
+    res = await client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    rotated = res.json()
+    assert res.status_code == 200
+
+    # Presenting the old token again revokes the tokens descending from it
+    res = await client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    assert res.status_code == 401
+
+    res = await client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": rotated["refresh_token"]}
+    )
+    assert res.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_password(client: AsyncClient):
+    user_data = {"username": "rehash_user", "password": "rehash_user"}
+    res = await client.post("/api/v1/users", json=user_data)
+    assert res.status_code == 200
+
+    # Raise the cost, the stored hash is outdated and replaced on login
+    PWD_CONTEXT.update(bcrypt__rounds=5)
+    try:
+        res = await client.post("/api/latest/auth/login", json=user_data)
+        assert res.status_code == 200
+
+        hashes = []
+
+        @standalone_session
+        async def get_hash():
+            user = await UserService().get_by_username("rehash_user")
+            hashes.append(user.account_auth.password)
+
+        await get_hash()
+        assert hashes[0].startswith("$2b$05$")
+
+        res = await client.post("/api/latest/auth/login", json=user_data)
+        assert res.status_code == 200
+    finally:
+        PWD_CONTEXT.update(bcrypt__rounds=config.PASSWORD_BCRYPT_ROUNDS)
+
+
+@pytest.mark.asyncio
+async def test_client_token_login(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    admin_token_headers = await admin_token_headers
+    ctoken = str(uuid.uuid4())
+
+    res = await client.post("/api/v1/auth/client-token-login", json={"token": ctoken})
+    assert res.status_code == 200
+    user_id = TokenHelper.decode(res.json()["access_token"])["user_id"]
+
+    # The same device logs in as the same user
+    res = await client.post("/api/v1/auth/client-token-login", json={"token": ctoken})
+    assert res.status_code == 200
+    assert TokenHelper.decode(res.json()["access_token"])["user_id"] == user_id
+
+    # A deleted user isn't served from the cache
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+    res = await client.delete(f"/api/v1/users/{user_id}", headers=headers)
+    assert res.status_code == 204
+
+    res = await client.post("/api/v1/auth/client-token-login", json={"token": ctoken})
+    assert res.status_code == 200
+    user_id = TokenHelper.decode(res.json()["access_token"])["user_id"]
+
+    res = await client.get("/api/v1/users", headers=admin_token_headers)
+    assert user_id in [user["id"] for user in res.json()]
+
+
+@pytest.mark.asyncio
+async def test_refresh_empty_body(client: AsyncClient):
+    res = await client.post(
+        "/api/v1/auth/refresh",
+        content=b"",
+        headers={"Content-Type": "application/json"},
+    )
+    assert res.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_refresh_rate_limit(client: AsyncClient):
+    budget = int(config.RATE_LIMIT_REFRESH.split("/")[0])
+
+    for _ in range(budget + 1):
+        res = await client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": "invalid"}
+        )
+        if res.status_code == 429:
+            break
+
+    assert res.status_code == 429
+    assert res.json()["error_code"] == "RATE_LIMIT__EXCEEDED"
+    assert int(res.headers["Retry-After"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_refresh_rate_limit_per_user(client: AsyncClient):
+    budget = int(config.RATE_LIMIT_REFRESH.split("/")[0])
+
+    tokens = []
+    for _ in range(2):
+        res = await client.post(
+            "/api/v1/auth/client-token-login", json={"token": str(uuid.uuid4())}
+        )
+        tokens.append(res.json()["refresh_token"])
+
+    # Both users share the client address, but not their buckets
+    for _ in range(budget + 1):
+        res = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens[0]})
+        if res.status_code == 429:
+            break
+    assert res.status_code == 429
+
+    res = await client.post("/api/v1/auth/refresh", json={"refresh_token": tokens[1]})
+    assert res.status_code == 200
+
+
+def test_expired_token_not_served_from_cache():
+    token = TokenHelper.encode({"user_id": "test"}, expire_period=2)
+    TokenHelper.verify(token)
+    assert token in verified_tokens.keys()
+
+    exp = TokenHelper.decode_expired_token(token)["exp"]
+    time.sleep(max(0, exp - time.time()) + 0.1)
+
+    with pytest.raises(ExpiredTokenException):
+        TokenHelper.verify(token)
+    assert token not in verified_tokens.keys()
+
+
+def test_bad_signature_not_cached():
+    header, payload, _ = TokenHelper.encode_access({"user_id": "test"}).split(".")
+    forged = jwt.encode({"user_id": "test"}, "not the secret", config.JWT_ALGORITHM)
+    token = ".".join([header, payload, forged.split(".")[2]])
+
+    for _ in range(2):
+        with pytest.raises(DecodeTokenException):
+            TokenHelper.verify(token)
+    assert token not in verified_tokens.keys()
+
+
+def test_token_cache_counts_hits():
+    token = TokenHelper.encode_access({"user_id": "test"})
+
+    TokenHelper.verify(token)
+    hits = TokenHelper.cache_stats()["hits"]
+    TokenHelper.verify(token)
+    TokenHelper.verify(token)
+
+    assert TokenHelper.cache_stats()["hits"] == hits + 2
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, Request
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, Request, Response
 
 from app.group.exceptions.group import GroupNotFoundException
 from app.group.schemas.group import GroupSchema, CreateGroupSchema, GroupInfoSchema
@@ -11,6 +13,7 @@ from app.swipe_session.schemas.swipe_session import (
 )
 from app.swipe_session.services.swipe_session import SwipeSessionService
 
+from core.db.enums import GroupSortEnum
 from core.exceptions import ExceptionResponseSchema
 from core.fastapi.dependencies.hashid import (
     get_path_group_id,
@@ -18,6 +21,7 @@ from core.fastapi.dependencies.hashid import (
     get_path_user_id,
 )
 from core.fastapi.dependencies.object_storage import get_object_storage
+from core.fastapi.dependencies.pagination import PageParams, set_page_headers
 from core.fastapi.dependencies.user import get_current_user
 from core.fastapi.dependencies.permission import (
     IsGroupAdmin,
@@ -35,12 +39,21 @@ group_v1_router = APIRouter()
 @group_v1_router.get(
     "",
     responses={"400": {"model": ExceptionResponseSchema}},
-    response_model=list[GroupSchema],
+    response_model=list[GroupInfoSchema],
     dependencies=[Depends(PermissionDependency([[IsAuthenticated]]))],
 )
 @version(1)
-async def get_group_list():
-    return await GroupService().get_group_list()
+async def get_group_list(
+    response: Response,
+    page: PageParams = Depends(),
+    sort: GroupSortEnum = Query(GroupSortEnum.ID),
+    name: str | None = Query(None, max_length=100),
+):
+    groups = await GroupService().get_group_list(
+        page.cursor, page.limit, page.descending, sort, name
+    )
+    set_page_headers(response, groups)
+    return groups.items
 
 
 @group_v1_router.post(
@@ -55,8 +68,7 @@ async def create_group(
     user=Depends(get_current_user),
     object_storage=Depends(get_object_storage),
 ):
-    group_id = await GroupService().create_group(request, user.id, object_storage)
-    return await GroupService().get_group_by_id(group_id)
+    return await GroupService().create_group(request, user, object_storage)
 
 
 @group_v1_router.patch(
@@ -71,8 +83,7 @@ async def edit_group(
     group_id: int = Depends(get_path_group_id),
     object_storage=Depends(get_object_storage),
 ):
-    group_id = await GroupService().edit_group(request, group_id, object_storage)
-    return await GroupService().get_group_by_id(group_id)
+    return await GroupService().edit_group(request, group_id, object_storage)
 
 
 @group_v1_router.get(
@@ -112,7 +123,7 @@ async def delete_group(group_id=Depends(get_path_group_id)):
 )
 @version(1)
 async def get_group_info(group_id: int = Depends(get_path_group_id)):
-    group = await GroupService().get_group_by_id(group_id)
+    group = await GroupService().get_group_info(group_id)
     if not group:
         raise GroupNotFoundException
 
@@ -177,10 +188,7 @@ async def create_swipe_session(
     group_id: int = Depends(get_path_group_id),
     user=Depends(get_current_user),
 ):
-    session_id = await SwipeSessionService().create_swipe_session(
-        request, user, group_id
-    )
-    return await SwipeSessionService().get_swipe_session_by_id(session_id)
+    return await SwipeSessionService().create_swipe_session(request, user, group_id)
 
 
 @group_v1_router.patch(
@@ -196,13 +204,12 @@ async def update_swipe_session(
     request: UpdateSwipeSessionSchema,
     group_id: int = Depends(get_path_group_id),
 ):
-    session_id = await SwipeSessionService().update_swipe_session(request, group_id)
-    return await SwipeSessionService().get_swipe_session_by_id(session_id)
+    return await SwipeSessionService().update_swipe_session(request, group_id)
 
 
 @group_v1_router.get(
     "/{group_id}/swipe_sessions/{session_id}/matches",
-    response_model=GetFullRecipeResponseSchema,
+    response_model=List[GetFullRecipeResponseSchema],
     dependencies=[
         Depends(PermissionDependency([[IsAdmin], [IsAuthenticated, IsGroupMember]]))
     ],
@@ -1,10 +1,18 @@
 # pylint: skip-file
 
+import uuid
 from typing import Dict
 from fastapi import Response
 from httpx import AsyncClient
 import pytest
 
+from app.group.repository.membership import MembershipRepository
+from app.recipe.services.recipe import RecipeService
+from core.db.standalone_session import standalone_session
+from core.exceptions import ForbiddenException, NotFoundException, UnauthorizedException
+from core.helpers.hashid import decode_single
+from core.helpers.permission import QUERIES, TOKEN_ONLY, CompiledPermissions
+
 
 @pytest.mark.asyncio
 async def test_get_all_groups_unauthorized(client: AsyncClient):
@@ -33,6 +41,8 @@ async def test_get_all_groups_authorized(
     assert groups[2].get("name") == "group_3"
     assert len(groups[2].get("users")) == 1
 
+    assert "swipe_sessions" not in groups[0]
+
 
 @pytest.fixture()
 async def groups(
@@ -166,3 +176,196 @@ async def test_get_group_authorized_part_of_group(
     )
 
     assert res.status_code == 200
+    assert len(res.json().get("users")) == 2
+    assert isinstance(res.json().get("swipe_sessions"), list)
+
+
+@pytest.mark.asyncio
+async def test_leave_group_revokes_access(
+    client: AsyncClient, groups: list[Dict[str, str]]
+):
+    groups = await groups
+    group_id = groups[2].get("id")
+
+    res = await client.post(
+        "/api/v1/auth/client-token-login", json={"token": str(uuid.uuid4())}
+    )
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+    res = await client.post(f"/api/v1/groups/{group_id}/join", headers=headers)
+    assert res.status_code == 200
+
+    # Caches the membership
+    res = await client.get(f"/api/v1/groups/{group_id}/swipe_sessions", headers=headers)
+    assert res.status_code == 200
+
+    res = await client.post(f"/api/v1/groups/{group_id}/leave", headers=headers)
+    assert res.status_code == 200
+
+    res = await client.get(f"/api/v1/groups/{group_id}/swipe_sessions", headers=headers)
+    assert res.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_admin_skips_membership_query(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    headers = await admin_token_headers
+    res = await client.get("/api/v1/groups", headers=headers)
+    group_id = res.json()[0].get("id")
+
+    get_role = MembershipRepository.get_role
+    calls = []
+
+    async def counting_get_role(self, *args):
+        calls.append(args)
+        return await get_role(self, *args)
+
+    monkeypatch.setattr(MembershipRepository, "get_role", counting_get_role)
+
+    # [[IsAdmin], [IsAuthenticated, IsGroupMember]] passes on the first alternative
+    res = await client.get(f"/api/v1/groups/{group_id}/swipe_sessions", headers=headers)
+    assert res.status_code == 200
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_non_member_gets_first_alternative_exception(
+    client: AsyncClient, groups: list[Dict[str, str]]
+):
+    groups = await groups
+    group_id = groups[2].get("id")
+
+    res = await client.post(
+        "/api/v1/auth/client-token-login", json={"token": str(uuid.uuid4())}
+    )
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+    res = await client.get(f"/api/v1/groups/{group_id}/swipe_sessions", headers=headers)
+    assert res.status_code == UnauthorizedException.code
+    assert res.json().get("error_code") == UnauthorizedException.error_code
+    assert res.json().get("message") == UnauthorizedException.message
+
+
+@pytest.mark.asyncio
+async def test_compiled_permissions_reported_exception():
+    class Denied:
+        async def has_permission(self) -> bool:
+            return False
+
+    class DeniedByQuery(Denied):
+        exception = NotFoundException
+        cost = QUERIES
+
+    class DeniedByToken(Denied):
+        exception = ForbiddenException
+        cost = TOKEN_ONLY
+
+    class Allowed:
+        exception = UnauthorizedException
+        cost = TOKEN_ONLY
+
+        async def has_permission(self) -> bool:
+            return True
+
+    # The first alternative decides, its cheapest failing check is reported
+    compiled = CompiledPermissions([[DeniedByQuery, DeniedByToken], [DeniedByQuery]])
+    assert await compiled.evaluate() is ForbiddenException
+
+    compiled = CompiledPermissions([[DeniedByQuery], [DeniedByToken]])
+    assert await compiled.evaluate() is NotFoundException
+
+    compiled = CompiledPermissions([[DeniedByToken], [Allowed]])
+    assert await compiled.evaluate() is None
+
+
+async def create_member(client: AsyncClient, group_id: str, tag_ids: list[int]):
+    res = await client.post(
+        "/api/v1/auth/client-token-login", json={"token": str(uuid.uuid4())}
+    )
+    headers = {"Authorization": f"Bearer {res.json()['access_token']}"}
+
+    res = await client.post("/api/v1/me/filters", json={"tags": tag_ids}, headers=headers)
+    assert res.status_code == 201
+    res = await client.post(f"/api/v1/groups/{group_id}/join", headers=headers)
+    assert res.status_code == 200
+    return headers
+
+
+async def get_group_recipe_ids(group_id: str) -> set[int]:
+    recipe_ids = set()
+
+    @standalone_session
+    async def read():
+        recipes = await RecipeService().get_filtered_for_group(decode_single(group_id))
+        recipe_ids.update(recipe.id for recipe in recipes)
+
+    await read()
+    return recipe_ids
+
+
+@pytest.mark.asyncio
+async def test_group_filter(client: AsyncClient, admin_token_headers: Dict[str, str]):
+    admin_headers = await admin_token_headers
+    res = await client.get("/api/v1/groups", headers=admin_headers)
+    group_id = res.json()[2].get("id")
+
+    recipe_ids = {}
+    for name, tag_name, tag_type in [
+        ("Peanut stew", "Pinda", "Allergieën"),
+        ("Vegan bowl", "Veganistisch", "Dieet"),
+        ("Veggie lasagne", "Vegetarisch", "Dieet"),
+    ]:
+        res = await client.post(
+            "/api/v1/recipes",
+            json={
+                "name": name,
+                "filename": "image_1",
+                "description": "test",
+                "ingredients": [{"name": "ingredient1", "amount": 1, "unit": "g"}],
+                "instructions": ["test"],
+                "tags": [{"name": tag_name, "tag_type": tag_type}],
+                "preparation_time": 30,
+                "spiciness": 0,
+            },
+            headers=admin_headers,
+        )
+        recipe_ids[name] = res.json().get("id")
+
+    res = await client.get("/api/v1/tags", headers=admin_headers)
+    tag_ids = {tag["name"]: tag["id"] for tag in res.json()}
+
+    members = []
+    try:
+        unfiltered = await get_group_recipe_ids(group_id)
+        assert set(recipe_ids.values()) <= unfiltered
+
+        allergic = await create_member(client, group_id, [tag_ids["Pinda"]])
+        members.append(allergic)
+        vegetarian = await create_member(client, group_id, [tag_ids["Vegetarisch"]])
+        members.append(vegetarian)
+
+        # Vegan recipes are vegetarian too, nothing else is
+        assert await get_group_recipe_ids(group_id) == {
+            recipe_ids["Vegan bowl"],
+            recipe_ids["Veggie lasagne"],
+        }
+
+        res = await client.post(f"/api/v1/groups/{group_id}/leave", headers=vegetarian)
+        assert res.status_code == 200
+        assert await get_group_recipe_ids(group_id) == unfiltered - {
+            recipe_ids["Peanut stew"]
+        }
+
+        res = await client.post(f"/api/v1/groups/{group_id}/leave", headers=allergic)
+        assert res.status_code == 200
+        assert await get_group_recipe_ids(group_id) == unfiltered
+    finally:
+        for headers in members:
+            await client.delete("/api/v1/me", headers=headers)
+        for recipe_id in recipe_ids.values():
+            await client.delete(f"/api/v1/recipes/{recipe_id}", headers=admin_headers)
+        for tag_name in ["Pinda", "Veganistisch", "Vegetarisch"]:
+            await client.delete(f"/api/v1/tags/{tag_ids[tag_name]}", headers=admin_headers)
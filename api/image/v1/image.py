@@ -1,9 +1,10 @@
 from typing import List
-from fastapi import APIRouter, Depends, UploadFile
+from fastapi import APIRouter, Depends, Query, Response, UploadFile
 from core.exceptions import ExceptionResponseSchema
 from core.fastapi.dependencies.permission import IsAuthenticated, IsImageOwner
 from core.fastapi_versioning import version
 from core.fastapi.dependencies.object_storage import get_object_storage
+from core.fastapi.dependencies.pagination import PageParams, set_page_headers
 from core.fastapi.dependencies.user import get_current_user
 from core.fastapi.dependencies import (
     AllowAll,
@@ -25,8 +26,17 @@ image_v1_router = APIRouter()
     dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
 )
 @version(1)
-async def get_images(object_storage=Depends(get_object_storage)):
-    return await ImageService(object_storage).get_images()
+async def get_images(
+    response: Response,
+    page: PageParams = Depends(),
+    filename: str | None = Query(None, max_length=100),
+    object_storage=Depends(get_object_storage),
+):
+    images = await ImageService(object_storage).get_images(
+        page.cursor, page.limit, page.descending, filename
+    )
+    set_page_headers(response, images)
+    return images.items
 
 
 @image_v1_router.get(
@@ -1,9 +1,13 @@
 """Ingredient API v1."""
 
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from core.config import config
+from core.db.enums import ExportFormatEnum
 from core.exceptions import ExceptionResponseSchema
 from core.fastapi_versioning import version
+from core.helpers.etag import make_etag, etag_matches, not_modified, set_cache_headers
+from core.helpers.export import export_response
 from core.fastapi.dependencies.permission import (
     AllowAll,
     IsAuthenticated,
@@ -28,14 +32,68 @@ ingredient_v1_router = APIRouter()
     dependencies=[Depends(PermissionDependency([[AllowAll]]))],
 )
 @version(1)
-async def get_all_ingredients():
+async def get_all_ingredients(request: Request, response: Response):
     """Get all ingredients.
 
+    Supports conditional requests through `If-None-Match`.
+
     ## Returns
         List[IngredientSchema]: List of all ingredients.
     """
+    ingredients_version, ingredients = (
+        await IngredientService().get_versioned_ingredients()
+    )
+    etag = make_etag("ingredients", ingredients_version)
+    if etag_matches(request, etag):
+        return not_modified(etag, config.CACHE_CONTROL_INGREDIENTS)
+
+    set_cache_headers(response, etag, config.CACHE_CONTROL_INGREDIENTS)
+    return ingredients
+
+
+@ingredient_v1_router.get(
+    "/autocomplete",
+    response_model=List[IngredientSchema],
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[AllowAll]]))],
+)
+@version(1)
+async def autocomplete_ingredients(
+    query: str = Query(..., alias="q", max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Complete an ingredient name while typing.
+
+    ## Parameters
+        - q (str): The start of the ingredient name, or of a word in it.
+        - limit (int): The maximum amount of ingredients to return.
 
-    return await IngredientService().get_ingredients()
+    ## Returns
+        List[IngredientSchema]: The matching ingredients, names starting with `q` first.
+    """
+    return await IngredientService().autocomplete_ingredients(query, limit)
+
+
+@ingredient_v1_router.get(
+    "/export",
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
+)
+@version(1)
+async def export_ingredients(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format")
+):
+    """Stream all ingredients as NDJSON or CSV.
+
+    ## Returns
+        StreamingResponse: One ingredient per line.
+    """
+    return export_response(
+        IngredientService().stream_ingredients(),
+        export_format,
+        ["id", "name"],
+        "ingredients",
+    )
 
 
 @ingredient_v1_router.get(
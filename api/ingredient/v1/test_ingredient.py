@@ -140,3 +140,38 @@ async def test_delete_ingredient_not_found(
     admin_token_headers = await admin_token_headers
     response = await client.delete("/api/v1/ingredients/5", headers=admin_token_headers)
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_ingredients(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    admin_token_headers = await admin_token_headers
+    response = await client.post(
+        "/api/v1/ingredients",
+        headers=admin_token_headers,
+        json={"name": "Geraspte kaas"},
+    )
+    ingredient = response.json()
+
+    response = await client.get("/api/v1/ingredients/autocomplete", params={"q": "ingr"})
+    assert response.status_code == 200
+    assert [ingredient["name"] for ingredient in response.json()] == [
+        "ingredient2",
+        "ingredient3",
+        "ingredient4",
+    ]
+
+    response = await client.get(
+        "/api/v1/ingredients/autocomplete", params={"q": "ingr", "limit": 1}
+    )
+    assert response.json() == [{"id": 2, "name": "ingredient2"}]
+
+    response = await client.get("/api/v1/ingredients/autocomplete", params={"q": "KAA"})
+    assert response.json() == [ingredient]
+
+    await client.delete(
+        f"/api/v1/ingredients/{ingredient['id']}", headers=admin_token_headers
+    )
+    response = await client.get("/api/v1/ingredients/autocomplete", params={"q": "kaa"})
+    assert response.json() == []
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, status
 from fastapi.responses import JSONResponse
-from app.group.schemas.group import GroupSchema
+from app.group.schemas.group import GroupInfoSchema
 from app.group.services.group import GroupService
 from app.user.schemas.user import UpdateMeSchema, UpdateUserSchema, UserSchema
 from app.filter.schemas.filter import FilterSchema, UserCreateSchema
@@ -49,7 +49,7 @@ async def delete_me(user=Depends(get_current_user)):
 
 @me_v1_router.get(
     "/groups",
-    response_model=list[GroupSchema],
+    response_model=list[GroupInfoSchema],
     dependencies=[Depends(PermissionDependency([[IsAuthenticated]]))],
 )
 @version(1)
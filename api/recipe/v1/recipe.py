@@ -1,9 +1,14 @@
 """Endpoints for recipe.
 """
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from core.config import config
+from core.db.enums import ExportFormatEnum
 from core.exceptions import ExceptionResponseSchema
+from core.fastapi.dependencies.rate_limit import RateLimitDependency
 from core.fastapi.dependencies.user import get_current_user
 from core.fastapi_versioning import version
+from core.helpers.etag import make_etag, etag_matches, not_modified, set_cache_headers
+from core.helpers.export import export_response
 from core.fastapi.dependencies.permission import (
     AllowAll,
     IsAdmin,
@@ -16,8 +21,15 @@ from app.recipe.schemas import (
     GetFullRecipeResponseSchema,
     GetFullRecipePaginatedResponseSchema,
     CreateRecipeSchema,
+    ImportRecipesResponseSchema,
+)
+from app.recipe.services import (
+    RecipeService,
+    RecipeDocumentService,
+    RecipeExportService,
+    RecipeImportService,
+    RECIPE_EXPORT_FIELDS,
 )
-from app.recipe.services import RecipeService
 
 
 recipe_v1_router = APIRouter()
@@ -33,7 +45,53 @@ recipe_v1_router = APIRouter()
 async def get_recipe_list(
     limit: int = 10, offset: int = 0, user=Depends(get_current_user)
 ):
-    return await RecipeService().get_paginated_recipe_list(limit, offset, user)
+    return Response(
+        content=await RecipeDocumentService().get_paginated_documents(
+            limit, offset, user
+        ),
+        media_type="application/json",
+    )
+
+
+@recipe_v1_router.get(
+    "/search",
+    responses={"400": {"model": ExceptionResponseSchema}},
+    response_model=GetFullRecipePaginatedResponseSchema,
+    dependencies=[Depends(PermissionDependency([[AllowAll]]))],
+)
+@version(1)
+async def search_recipes(
+    query: str = Query(..., alias="q", min_length=1, max_length=100),
+    limit: int = 10,
+    offset: int = 0,
+    user=Depends(get_current_user),
+):
+    """Search recipes by name and description, most relevant first.
+
+    The allergen and diet filters of the current user are applied."""
+    return Response(
+        content=await RecipeDocumentService().search_documents(
+            query, limit, offset, user
+        ),
+        media_type="application/json",
+    )
+
+
+@recipe_v1_router.get(
+    "/export",
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
+)
+@version(1)
+async def export_recipes(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format")
+):
+    """Stream all recipes with their tags and ingredients as NDJSON or CSV.
+
+    NDJSON lines can be posted to the import endpoint again."""
+    return export_response(
+        RecipeExportService().get_rows(), export_format, RECIPE_EXPORT_FIELDS, "recipes"
+    )
 
 
 @recipe_v1_router.get(
@@ -42,8 +100,20 @@ async def get_recipe_list(
     response_model=GetFullRecipeResponseSchema,
 )
 @version(1)
-async def get_recipe_by_id(recipe_id: int):
-    return await RecipeService().get_recipe_by_id(recipe_id)
+async def get_recipe_by_id(recipe_id: int, request: Request):
+    document_serv = RecipeDocumentService()
+    recipe_version = await document_serv.get_version(recipe_id)
+
+    etag = make_etag("recipe", recipe_id, recipe_version)
+    if etag_matches(request, etag):
+        return not_modified(etag, config.CACHE_CONTROL_RECIPE)
+
+    response = Response(
+        content=await document_serv.get_document(recipe_id, recipe_version),
+        media_type="application/json",
+    )
+    set_cache_headers(response, etag, config.CACHE_CONTROL_RECIPE)
+    return response
 
 
 @recipe_v1_router.delete(
@@ -61,8 +131,14 @@ async def delete_recipe(recipe_id: int, user=Depends(get_current_user)):
 @recipe_v1_router.post(
     "/{recipe_id}/judge",
     response_model_exclude={"id"},
-    responses={"400": {"model": ExceptionResponseSchema}},
-    dependencies=[Depends(PermissionDependency([[IsAuthenticated]]))],
+    responses={
+        "400": {"model": ExceptionResponseSchema},
+        "429": {"model": ExceptionResponseSchema},
+    },
+    dependencies=[
+        Depends(RateLimitDependency("recipe_judge", config.RATE_LIMIT_JUDGE)),
+        Depends(PermissionDependency([[IsAuthenticated]])),
+    ],
 )
 @version(1)
 async def judge_recipe(
@@ -80,8 +156,28 @@ async def judge_recipe(
 )
 @version(1)
 async def create_recipe(request: CreateRecipeSchema, user=Depends(get_current_user)):
-    recipe_id = await RecipeService().create_recipe(request, user.id)
-    return await RecipeService().get_recipe_by_id(recipe_id)
+    return await RecipeService().create_recipe(request, user.id)
+
+
+@recipe_v1_router.post(
+    "/import",
+    response_model=ImportRecipesResponseSchema,
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+@version(1)
+async def import_recipes(request: Request, user=Depends(get_current_user)):
+    """Import recipes from newline delimited JSON, one recipe per line.
+
+    Lines have the shape of the create recipe body. Records that can't be
+    imported are reported by line number, the rest of the import continues."""
+    return await RecipeImportService().import_ndjson(request.stream(), user.id)
 
 
 # @recipe_v1_router.put(
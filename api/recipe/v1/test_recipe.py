@@ -1,9 +1,17 @@
 # pylint: skip-file
 
+import csv
+import json
+import uuid
 import pytest
 from httpx import AsyncClient
 from typing import Dict
 
+from app.recipe.repository.recipe import RecipeRepository
+from core.db import session
+from core.db.models import Recipe
+from core.db.standalone_session import standalone_session
+
 
 @pytest.mark.asyncio
 async def test_get_recipe_list(client: AsyncClient):
@@ -37,6 +45,77 @@ async def test_judge_recipe(client: AsyncClient, admin_token_headers: Dict[str,
     response = await client.get("/api/v1/recipes/1", headers=admin_token_headers)
     assert response.json().get("likes") == 1
 
+    response = await client.post(
+        "/api/v1/recipes/1/judge",
+        json={"like": True},
+        headers=admin_token_headers,
+    )
+    assert response.status_code == 200
+    response = await client.get("/api/v1/recipes/1", headers=admin_token_headers)
+    assert response.json().get("likes") == 1
+
+    response = await client.post(
+        "/api/v1/recipes/999/judge",
+        json={"like": True},
+        headers=admin_token_headers,
+    )
+    assert response.status_code == 404
+
+
+async def get_counters(recipe_id: int) -> tuple[int, int]:
+    counters = []
+
+    @standalone_session
+    async def read():
+        recipe = await RecipeRepository().get_by_id(recipe_id)
+        counters.append((recipe.likes, recipe.dislikes))
+
+    await read()
+    return counters[0]
+
+
+@pytest.mark.asyncio
+async def test_judgement_counters(client: AsyncClient):
+    """Test that the counters follow judgements and deleted judges"""
+    likes, dislikes = await get_counters(2)
+
+    response = await client.post(
+        "/api/v1/auth/client-token-login", json={"token": str(uuid.uuid4())}
+    )
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    await client.post("/api/v1/recipes/2/judge", json={"like": True}, headers=headers)
+    assert await get_counters(2) == (likes + 1, dislikes)
+    response = await client.get("/api/v1/recipes/2")
+    assert response.json().get("likes") == likes + 1
+
+    await client.post("/api/v1/recipes/2/judge", json={"like": False}, headers=headers)
+    assert await get_counters(2) == (likes, dislikes + 1)
+
+    response = await client.delete("/api/v1/me", headers=headers)
+    assert response.status_code == 204
+    assert await get_counters(2) == (likes, dislikes)
+
+
+@pytest.mark.asyncio
+async def test_recount_judgements():
+    """Test that drifted counters are repaired from the judgements"""
+    likes, dislikes = await get_counters(2)
+
+    @standalone_session
+    async def drift():
+        await RecipeRepository().touch(Recipe.id == 2, likes=likes + 5, dislikes=0)
+        await session.commit()
+
+    @standalone_session
+    async def recount():
+        assert await RecipeRepository().recount_judgements() == 1
+        await session.commit()
+
+    await drift()
+    await recount()
+    assert await get_counters(2) == (likes, dislikes)
+
 
 @pytest.mark.asyncio
 async def test_create_recipe(client: AsyncClient, admin_token_headers: Dict[str, str]):
@@ -56,6 +135,11 @@ async def test_create_recipe(client: AsyncClient, admin_token_headers: Dict[str,
         headers=await admin_token_headers,
     )
     assert response.status_code == 200
+    recipe = response.json()
+    assert recipe.get("image").get("filename") == "image_1"
+    assert recipe.get("creator").get("display_name") is not None
+    assert [ingredient.get("name") for ingredient in recipe.get("ingredients")] == ["test"]
+    assert [tag.get("name") for tag in recipe.get("tags")] == ["dogshit"]
 
 
 @pytest.mark.asyncio
@@ -76,3 +160,166 @@ async def test_delete_recipe_unauthorized(
         "/api/v1/recipes/2", headers=await normal_user_token_headers
     )
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_recipe_document_in_list(client: AsyncClient):
+    """Test that listings serve the same recipe document as the detail endpoint"""
+    response = await client.get("/api/v1/recipes/1")
+    recipe = response.json()
+
+    response = await client.get("/api/v1/recipes")
+    recipes = response.json().get("recipes")
+
+    assert [item for item in recipes if item.get("id") == 1] == [recipe]
+
+
+@pytest.mark.asyncio
+async def test_get_recipe_not_modified(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    """Test that a recipe is only re-sent after it changed"""
+    response = await client.get("/api/v1/recipes/1")
+    etag = response.headers.get("ETag")
+    assert etag is not None
+
+    response = await client.get("/api/v1/recipes/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await client.post(
+        "/api/v1/recipes/1/judge",
+        json={"like": False},
+        headers=await admin_token_headers,
+    )
+    response = await client.get("/api/v1/recipes/1", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers.get("ETag") != etag
+
+
+@pytest.mark.asyncio
+async def test_search_recipes(client: AsyncClient):
+    """Test that search ranks matching recipes and tolerates typos"""
+    response = await client.get("/api/v1/recipes/search", params={"q": "union pie"})
+    assert response.status_code == 200
+    assert response.json().get("total_count") == 1
+    assert response.json().get("recipes")[0].get("name") == "Union pie"
+
+    response = await client.get("/api/v1/recipes/search", params={"q": "guacamol"})
+    assert response.json().get("recipes")[0].get("name") == "Guacamole"
+
+    response = await client.get("/api/v1/recipes/search", params={"q": "sauce"})
+    assert [recipe.get("name") for recipe in response.json().get("recipes")] == [
+        "Guacamole"
+    ]
+
+    response = await client.get("/api/v1/recipes/search", params={"q": "zzzz"})
+    assert response.json() == {"total_count": 0, "recipes": []}
+
+
+@pytest.mark.asyncio
+async def test_search_sees_written_recipes(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    """Test that the search index follows created recipes"""
+    headers = await admin_token_headers
+    response = await client.get("/api/v1/recipes/search", params={"q": "quokka"})
+    assert response.json().get("total_count") == 0
+
+    response = await client.post(
+        "/api/v1/recipes",
+        json={
+            "name": "Quokka casserole",
+            "filename": "image_1",
+            "description": "test",
+            "ingredients": [{"name": "test", "amount": 1, "unit": "test"}],
+            "instructions": ["test"],
+            "tags": [],
+            "preparation_time": 30,
+            "spiciness": 0,
+        },
+        headers=headers,
+    )
+    recipe_id = response.json().get("id")
+
+    response = await client.get("/api/v1/recipes/search", params={"q": "quokka"})
+    assert [recipe.get("id") for recipe in response.json().get("recipes")] == [
+        recipe_id
+    ]
+
+@pytest.mark.asyncio
+async def test_import_recipes(client: AsyncClient, admin_token_headers: Dict[str, str]):
+    """Test that an import stores valid records and reports the others"""
+    headers = await admin_token_headers
+    recipe = {
+        "name": "Imported stew",
+        "filename": "image_1",
+        "description": "test",
+        "ingredients": [
+            {"name": "ingredient1", "amount": 1, "unit": "g"},
+            {"name": "imported ingredient", "amount": 2, "unit": "g"},
+        ],
+        "instructions": ["test"],
+        "tags": [
+            {"name": "tag1", "tag_type": "Keuken"},
+            {"name": "imported tag", "tag_type": "Keuken"},
+        ],
+        "preparation_time": 30,
+        "spiciness": 0,
+    }
+    lines = [
+        json.dumps(recipe),
+        "",
+        "{not json",
+        json.dumps(recipe | {"filename": "missing"}),
+        json.dumps(recipe | {"name": "Imported soup"}),
+    ]
+    response = await client.post(
+        "/api/v1/recipes/import",
+        content="\n".join(lines).encode(),
+        headers=headers | {"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert result.get("imported") == 2
+    assert [error.get("line") for error in result.get("errors")] == [3, 4]
+
+    for recipe_id in result.get("recipe_ids"):
+        response = await client.get(f"/api/v1/recipes/{recipe_id}")
+        assert len(response.json().get("ingredients")) == 2
+        assert len(response.json().get("tags")) == 2
+        await client.delete(f"/api/v1/recipes/{recipe_id}", headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_export_recipes(client: AsyncClient, admin_token_headers: Dict[str, str]):
+    """Test that the export streams every recipe with tags and ingredients"""
+    headers = await admin_token_headers
+    response = await client.get("/api/v1/recipes/export", headers=headers)
+    assert response.status_code == 200
+    assert response.headers.get("content-type") == "application/x-ndjson"
+    recipes = [json.loads(line) for line in response.text.splitlines()]
+    assert [recipe.get("name") for recipe in recipes[:2]] == ["Union pie", "Guacamole"]
+    assert all(
+        ingredient.keys() == {"name", "amount", "unit"}
+        for recipe in recipes
+        for ingredient in recipe.get("ingredients")
+    )
+
+    response = await client.get(
+        "/api/v1/recipes/export", params={"format": "csv"}, headers=headers
+    )
+    assert response.headers.get("content-type").startswith("text/csv")
+    rows = list(csv.DictReader(response.text.splitlines()))
+    assert [row.get("name") for row in rows] == [recipe.get("name") for recipe in recipes]
+    assert json.loads(rows[0].get("tags")) == recipes[0].get("tags")
+
+
+@pytest.mark.asyncio
+async def test_export_recipes_unauthorized(
+    client: AsyncClient, normal_user_token_headers: Dict[str, str]
+):
+    """Test that only admins can export recipes"""
+    response = await client.get(
+        "/api/v1/recipes/export", headers=await normal_user_token_headers
+    )
+    assert response.status_code == 401
@@ -1,6 +1,8 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, WebSocket
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query, Response, WebSocket
 from app.swipe_session.schemas.swipe_session import (
     ActionDocsSchema,
     CreateSwipeSessionSchema,
@@ -12,7 +14,10 @@ from app.swipe_session.services.swipe_session_websocket import (
     SwipeSessionWebsocketService,
 )
 
+from core.db.enums import SwipeSessionEnum, SwipeSessionSortEnum
 from core.exceptions import ExceptionResponseSchema
+from core.fastapi.dependencies.hashid import get_query_group_id
+from core.fastapi.dependencies.pagination import PageParams, set_page_headers
 from core.fastapi.dependencies.permission import (
     IsAdmin,
     PermissionDependency,
@@ -55,8 +60,27 @@ async def get_swipe_session_actions():
     dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
 )
 @version(1)
-async def get_swipe_sessions():
-    return await SwipeSessionService().get_swipe_session_list()
+async def get_swipe_sessions(
+    response: Response,
+    page: PageParams = Depends(),
+    sort: SwipeSessionSortEnum = Query(SwipeSessionSortEnum.ID),
+    status: SwipeSessionEnum | None = None,
+    group_id: int | None = Depends(get_query_group_id),
+    date_from: date | None = None,
+    date_to: date | None = None,
+):
+    swipe_sessions = await SwipeSessionService().get_swipe_session_list(
+        page.cursor,
+        page.limit,
+        page.descending,
+        sort,
+        status,
+        group_id,
+        date_from,
+        date_to,
+    )
+    set_page_headers(response, swipe_sessions)
+    return swipe_sessions.items
 
 
 @swipe_session_v1_router.post(
@@ -72,8 +96,7 @@ async def create_swipe_session(
     """Create a personal swipe session, no group.
 
     You might want to use `/groups/{group_id}/swipe_sessions` instead."""
-    session_id = await SwipeSessionService().create_swipe_session(request, user)
-    return await SwipeSessionService().get_swipe_session_by_id(session_id)
+    return await SwipeSessionService().create_swipe_session(request, user)
 
 
 @swipe_session_v1_router.patch(
@@ -88,5 +111,4 @@ async def create_swipe_session(
 async def update_swipe_session(
     request: UpdateSwipeSessionSchema, user=Depends(get_current_user)
 ):
-    session_id = await SwipeSessionService().update_swipe_session(request, user)
-    return await SwipeSessionService().get_swipe_session_by_id(session_id)
+    return await SwipeSessionService().update_swipe_session(request, user)
@@ -2,6 +2,7 @@
 import pytest
 
 from typing import Dict
+from pydantic import ValidationError
 from httpx import AsyncClient
 from fastapi import Response
 from fastapi.testclient import TestClient
@@ -12,6 +13,13 @@ from core.db.enums import SwipeSessionEnum as sse
 from core.db.enums import SwipeSessionActionEnum as ssae
 from core.exceptions.base import UnauthorizedException
 from app.recipe.exceptions.recipe import RecipeNotFoundException
+from app.group.repository.membership import MembershipRepository
+from app.swipe_session.repository.swipe_session import SwipeSessionRepository
+from app.user.repository.user import UserRepository
+from app.swipe_session.schemas.swipe_session import SwipeSessionSummarySchema
+from core.exceptions import IncorrectHashIDException
+from core.helpers import hashid
+from core.helpers.hashid import encode
 
 
 def assert_status_code(data, exception):
@@ -24,6 +32,16 @@ def assert_status_code(data, exception):
     assert payload.get("message") == exception.message
 
 
+def count_calls(monkeypatch: pytest.MonkeyPatch, cls: type, name: str, calls: list):
+    method = getattr(cls, name)
+
+    async def counting(self, *args, **kwargs):
+        calls.append(cls.__name__)
+        return await method(self, *args, **kwargs)
+
+    monkeypatch.setattr(cls, name, counting)
+
+
 def strip_headers(header: str):
     return header.get("Authorization").split(" ")[1]
 
@@ -145,6 +163,24 @@ async def test_update_session(
     assert swipe_session.get("status") == sse.IN_PROGRESS
 
 
+@pytest.mark.asyncio
+async def test_update_swipe_session_loads_user_once(
+    client: AsyncClient,
+    admin_token_headers: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    headers = await admin_token_headers
+
+    calls = []
+    count_calls(monkeypatch, UserRepository, "get_by_id", calls)
+
+    # IsAdmin and get_current_user share the user of the request
+    res = await client.patch(
+        "/api/v1/swipe_sessions", json={"id": encode(9999)}, headers=headers
+    )
+    assert res.status_code == 404
+    assert len(calls) == 1
+
 @pytest.mark.asyncio
 async def test_websocket_invalid_id(
     fastapi_client: TestClient,
@@ -181,6 +217,23 @@ async def test_websocket_invalid_id(
         assert_status_code(data, exc.SuccessfullConnection)
 
 
+@pytest.mark.asyncio
+async def test_websocket_malformed_id(
+    fastapi_client: TestClient,
+    normal_user_token_headers: Dict[str, str],
+):
+    headers = await normal_user_token_headers
+
+    # The id is checked from the token alone, before the membership query
+    with fastapi_client.websocket_connect(
+        f"/api/v1/swipe_sessions/not-a-hashid?token={strip_headers(headers)}"
+    ) as ws:
+        ws: WebSocketTestSession
+        data = ws.receive_json()
+
+        assert_status_code(data, exc.InvalidIdException)
+
+
 @pytest.mark.asyncio
 async def test_not_in_group(
     fastapi_client: TestClient,
@@ -460,6 +513,38 @@ async def test_update_session_to_active(
     assert swipe_sessions[2].get("status") == sse.PAUSED
 
 
+@pytest.mark.asyncio
+async def test_websocket_handshake_loads_once(
+    fastapi_client: TestClient,
+    admin_token_headers: Dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    headers = await admin_token_headers
+
+    res = fastapi_client.get("/api/v1/swipe_sessions", headers=headers)
+    cur_session = res.json()[1]
+    assert cur_session.get("status") == sse.IN_PROGRESS
+
+    calls = []
+    count_calls(monkeypatch, UserRepository, "get_by_id", calls)
+    count_calls(monkeypatch, SwipeSessionRepository, "get_by_id", calls)
+    count_calls(monkeypatch, MembershipRepository, "get_role", calls)
+
+    with fastapi_client.websocket_connect(
+        f"/api/v1/swipe_sessions/{cur_session.get('id')}?token={strip_headers(headers)}"
+    ) as ws:
+        ws: WebSocketTestSession
+        data = ws.receive_json()
+
+        assert_status_code(data, exc.SuccessfullConnection)
+
+    # Shared by the four checks and the handler
+    assert sorted(calls) == [
+        "MembershipRepository",
+        "SwipeSessionRepository",
+        "UserRepository",
+    ]
+
 @pytest.mark.asyncio
 async def test_swipe_session_1(
     fastapi_client: TestClient,
@@ -779,3 +864,59 @@ async def test_swipe_session_4(
 
         assert_status_code(data_1, exc.ClosingConnection)
         assert_status_code(data_2, exc.ClosingConnection)
+
+    res = fastapi_client.get(
+        f"/api/v1/groups/{cur_session.get('group_id')}"
+        f"/swipe_sessions/{cur_session.get('id')}/matches",
+        headers=headers,
+    )
+
+    assert res.status_code == 200
+    assert [recipe.get("id") for recipe in res.json()] == [user_recipes[0]["id"]]
+
+    # The swipes of the completed session are folded into its summary
+    res = fastapi_client.get(
+        f"/api/v1/groups/{cur_session.get('group_id')}/swipe_sessions",
+        headers=headers,
+    )
+    completed = next(s for s in res.json() if s.get("id") == cur_session.get("id"))
+
+    assert completed.get("status") == sse.COMPLETED
+    assert completed.get("swipes") == []
+    assert completed.get("summary").get("swipe_count") >= 2
+    assert completed.get("summary").get("likes").get(str(user_recipes[0]["id"])) == 2
+    assert len(completed.get("summary").get("participants")) == 2
+
+
+def test_hashid_round_trip():
+    hashed_id = hashid.encode(123456)
+    assert hashid.decoded.get(hashed_id) == (123456,)
+
+    # Filled by the encode
+    hits = hashid.decoded.hits
+    assert hashid.decode_single(hashed_id) == 123456
+    assert hashid.decoded.hits == hits + 1
+
+    # Filled by the decode
+    hashid.encoded.clear()
+    hashid.decoded.clear()
+    assert hashid.decode_single(hashed_id) == 123456
+    assert hashid.encoded.get(123456) == hashed_id
+    assert hashid.encode_many([123456, 654321]) == [
+        hashed_id,
+        hashid.hashids.encode(654321),
+    ]
+
+
+def test_invalid_hashid_not_cached():
+    with pytest.raises(IncorrectHashIDException):
+        hashid.decode_single("not-a-hashid")
+    assert "not-a-hashid" not in hashid.decoded.keys()
+
+
+def test_hashid_list():
+    summary = SwipeSessionSummarySchema(participants=[1, 2], likes={}, swipe_count=0)
+    assert summary.participants == [encode(1), encode(2)]
+
+    with pytest.raises(ValidationError):
+        SwipeSessionSummarySchema(participants=[1, "2"], likes={}, swipe_count=0)
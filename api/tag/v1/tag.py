@@ -1,8 +1,12 @@
 """Tag API v1."""
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
+from core.config import config
+from core.db.enums import ExportFormatEnum
 from core.exceptions import ExceptionResponseSchema
 from core.fastapi_versioning import version
+from core.helpers.etag import make_etag, etag_matches, not_modified, set_cache_headers
+from core.helpers.export import export_response
 from app.tag.schemas import TagSchema, CreateTagSchema
 from app.tag.services import TagService
 from core.fastapi.dependencies.permission import (
@@ -24,15 +28,66 @@ tag_v1_router = APIRouter()
     dependencies=[Depends(PermissionDependency([[AllowAll]]))],
 )
 @version(1)
-async def get_all_tags():
+async def get_all_tags(request: Request, response: Response):
     """
     Retrieve a list of all tags.
 
+    Supports conditional requests through `If-None-Match`.
+
     ## Returns
         List[TagSchema]: List of all tags.
     """
+    tags_version, tags = await TagService().get_versioned_tags()
+    etag = make_etag("tags", tags_version)
+    if etag_matches(request, etag):
+        return not_modified(etag, config.CACHE_CONTROL_TAGS)
+
+    set_cache_headers(response, etag, config.CACHE_CONTROL_TAGS)
+    return tags
+
+
+@tag_v1_router.get(
+    "/autocomplete",
+    response_model=List[TagSchema],
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[AllowAll]]))],
+)
+@version(1)
+async def autocomplete_tags(
+    query: str = Query(..., alias="q", max_length=50),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Complete a tag name while typing.
+
+    ## Parameters
+        - q (str): The start of the tag name, or of a word in it.
+        - limit (int): The maximum amount of tags to return.
 
-    return await TagService().get_tags()
+    ## Returns
+        List[TagSchema]: The matching tags, names starting with `q` first.
+    """
+    return await TagService().autocomplete_tags(query, limit)
+
+
+@tag_v1_router.get(
+    "/export",
+    responses={"400": {"model": ExceptionResponseSchema}},
+    dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
+)
+@version(1)
+async def export_tags(
+    export_format: ExportFormatEnum = Query(ExportFormatEnum.NDJSON, alias="format")
+):
+    """
+    Stream all tags as NDJSON or CSV.
+
+    ## Returns
+        StreamingResponse: One tag per line.
+    """
+    return export_response(
+        TagService().stream_tags(), export_format, ["id", "name", "tag_type"], "tags"
+    )
 
 
 @tag_v1_router.post(
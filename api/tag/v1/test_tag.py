@@ -1,9 +1,13 @@
 # pylint: skip-file
 
+import time
 import pytest
 from typing import Dict
 from httpx import AsyncClient
 
+from app.tag.services.tag import tag_dictionary
+from core.repository.catalog_version import local_bumps
+
 
 @pytest.mark.asyncio
 async def test_get_tags(client: AsyncClient, admin_token_headers: Dict[str, str]):
@@ -105,3 +109,68 @@ async def test_update_tag_not_found(
         json={"name": "tag5", "tag_type":"Keuken"},
     )
     assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_get_tags_not_modified(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    response = await client.get("/api/v1/tags")
+    etag = response.headers.get("ETag")
+    assert response.status_code == 200
+    assert etag is not None
+    assert response.headers.get("Cache-Control") is not None
+
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    response = await client.post(
+        "/api/v1/tags",
+        headers=await admin_token_headers,
+        json={"name": "etag_tag", "tag_type": "Keuken"},
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers.get("ETag") != etag
+
+
+@pytest.mark.asyncio
+async def test_get_tags_written_by_other_worker(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    response = await client.get("/api/v1/tags")
+    etag = response.headers.get("ETag")
+
+    response = await client.post(
+        "/api/v1/tags",
+        headers=await admin_token_headers,
+        json={"name": "remote_tag", "tag_type": "Keuken"},
+    )
+    assert response.status_code == 200
+
+    # As if another worker wrote: the dictionary doesn't know of the bump
+    local_bumps.clear()
+    tag_dictionary.checked_at = time.monotonic()
+
+    response = await client.get("/api/v1/tags", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers.get("ETag") != etag
+    assert "remote_tag" in [tag["name"] for tag in response.json()]
+
+
+@pytest.mark.asyncio
+async def test_export_tags(client: AsyncClient, admin_token_headers: Dict[str, str]):
+    """Test that the tag export lists every tag"""
+    headers = await admin_token_headers
+    response = await client.get("/api/v1/tags", headers=headers)
+    tags = response.json()
+
+    response = await client.get(
+        "/api/v1/tags/export", params={"format": "csv"}, headers=headers
+    )
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines[0] == "id,name,tag_type"
+    assert len(lines) == len(tags) + 1
@@ -6,6 +6,9 @@ from httpx import AsyncClient
 from fastapi import Response
 from fastapi.testclient import TestClient
 
+from app.user import utils
+from app.user.utils import NameList
+
 
 @pytest.mark.asyncio
 async def test_create_user(client: AsyncClient):
@@ -64,6 +67,40 @@ async def test_get_user_list(client: AsyncClient, admin_token_headers: Dict[str,
     assert res.status_code == 200
 
 
+@pytest.mark.asyncio
+async def test_get_user_list_paginated(
+    client: AsyncClient, admin_token_headers: Dict[str, str]
+):
+    admin_token_headers = await admin_token_headers
+    res = await client.get(
+        "/api/v1/users", params={"limit": 1}, headers=admin_token_headers
+    )
+    assert [user["display_name"] for user in res.json()] == ["admin"]
+    cursor = res.headers["X-Next-Cursor"]
+
+    res = await client.get(
+        "/api/v1/users",
+        params={"limit": 1, "cursor": cursor},
+        headers=admin_token_headers,
+    )
+    assert [user["display_name"] for user in res.json()] == ["normal_user"]
+
+    res = await client.get(
+        "/api/v1/users",
+        params={"sort": "display_name", "order": "desc", "display_name": "NORMAL"},
+        headers=admin_token_headers,
+    )
+    assert [user["display_name"] for user in res.json()] == ["normal_user"]
+    assert "X-Next-Cursor" not in res.headers
+
+    res = await client.get(
+        "/api/v1/users",
+        params={"sort": "display_name", "cursor": cursor},
+        headers=admin_token_headers,
+    )
+    assert res.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_user_list_normal_user(
     client: AsyncClient, normal_user_token_headers: Dict[str, str]
@@ -109,3 +146,28 @@ async def test_get_user_groups(
         f"/api/v1/users/{users[1].get('id')}/groups", headers=normal_headers
     )
     assert res.status_code == 200
+
+
+def test_name_list_skips_blank_and_repeated_lines(tmp_path):
+    path = tmp_path / "names.txt"
+    path.write_text("Xenon\n\n  \nArgon\nXenon\n Neon \n", encoding="utf-8")
+
+    names = NameList(path)
+
+    assert len(names) == 3
+    assert [names[i] for i in range(len(names))] == ["Xenon", "Argon", "Neon"]
+
+
+def test_generate_names(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / "names.txt"
+    path.write_text("Xenon\nArgon\nNeon\n", encoding="utf-8")
+    monkeypatch.setattr(utils, "NAMES", NameList(path))
+
+    names = utils.generate_names(3)
+    assert sorted(names) == ["Argon", "Neon", "Xenon"]
+
+    names = utils.generate_names(8)
+    assert len(set(names)) == 8
+    assert set(names[:3]) == {"Argon", "Neon", "Xenon"}
+    assert set(names[3:6]) == {"Argon 2", "Neon 2", "Xenon 2"}
+    assert set(names[6:]) <= {"Argon 3", "Neon 3", "Xenon 3"}
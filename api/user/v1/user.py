@@ -1,14 +1,16 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from fastapi.responses import JSONResponse
-from app.group.schemas.group import GroupSchema
+from app.group.schemas.group import GroupInfoSchema
 from app.group.services.group import GroupService
 from app.filter.services.filter import FilterService
 from app.filter.schemas.filter import FilterSchema, UserCreateSchema
 from app.user.schemas.user import UpdateMeSchema, UpdateUserSchema
+from core.db.enums import UserSortEnum
 from core.exceptions import ExceptionResponseSchema
 from core.fastapi.dependencies.hashid import get_path_user_id
+from core.fastapi.dependencies.pagination import PageParams, set_page_headers
 from core.fastapi.dependencies.permission import IsAuthenticated, IsUserOwner
 from core.fastapi_versioning.versioning import version
 
@@ -32,8 +34,18 @@ user_v1_router = APIRouter()
     dependencies=[Depends(PermissionDependency([[IsAdmin]]))],
 )
 @version(1)
-async def get_user_list():
-    return await UserService().get_user_list()
+async def get_user_list(
+    response: Response,
+    page: PageParams = Depends(),
+    sort: UserSortEnum = Query(UserSortEnum.ID),
+    display_name: str | None = Query(None, max_length=50),
+    is_admin: bool | None = None,
+):
+    users = await UserService().get_user_list(
+        page.cursor, page.limit, page.descending, sort, display_name, is_admin
+    )
+    set_page_headers(response, users)
+    return users.items
 
 
 @user_v1_router.post(
@@ -78,7 +90,7 @@ async def delete_me(user_id=Depends(get_path_user_id)):
 
 @user_v1_router.get(
     "/{user_id}/groups",
-    response_model=list[GroupSchema],
+    response_model=list[GroupInfoSchema],
     dependencies=[
         Depends(PermissionDependency([[IsAdmin], [IsAuthenticated, IsUserOwner]]))
     ],
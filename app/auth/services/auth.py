@@ -8,7 +8,7 @@ from app.auth.exceptions.auth import BadUUIDException
 from app.auth.services.jwt import JwtService
 from app.user.exceptions.user import IncorrectPasswordException, UserNotFoundException
 from app.user.services.user import UserService
-from app.user.utils import verify_password
+from app.user.utils import verify_and_update_password
 
 
 class AuthService:
@@ -39,7 +39,7 @@ class AuthService:
     async def login(self, username: str, password: str) -> TokensSchema:
         """
         Authenticates a user by their display name and password, and returns a pair of JSON Web 
-        Tokens.
+        Tokens. A password hashed with outdated bcrypt rounds is rehashed on the way.
 
         Args:
             username (str): The user's display name.
@@ -55,14 +55,20 @@ class AuthService:
         user = await self.user_serv.get_by_username(username)
         if not user:
             raise UserNotFoundException()
-        if not verify_password(password, user.account_auth.password):
+        valid, new_hash = await verify_and_update_password(
+            password, user.account_auth.password
+        )
+        if not valid:
             raise IncorrectPasswordException()
+        if new_hash:
+            await self.user_serv.set_password_hash(user, new_hash)
 
         return await self.jwt.create_login_tokens(user_id=user.id)
 
     async def client_token_login(self, ctoken) -> TokensSchema:
         """
         Authenticates a user by their client token, and returns a pair of JSON Web Tokens.
+        A client token seen for the first time creates a new user.
 
         Args:
             ctoken (str): The user's client token.
@@ -78,13 +84,5 @@ class AuthService:
         except ValueError as exc:
             raise BadUUIDException from exc
 
-        user = await self.user_serv.get_by_client_token(ctoken=ctoken)
-
-        if not user:
-            user_id = await self.user_serv.create_user_with_client_token(
-                ctoken=ctoken, display_name=None
-            )
-        else:
-            user_id = user.id
-
+        user_id = await self.user_serv.get_id_by_client_token(ctoken)
         return await self.jwt.create_login_tokens(user_id=user_id)
@@ -3,10 +3,9 @@ Class business logic for json web tokens
 """
 
 from api.auth.v1.response.auth import TokensSchema
-from core.exceptions.base import UnauthorizedException
 from core.exceptions.token import DecodeTokenException
 from core.helpers.hashid import decode_single, encode
-from core.utils.token_checker import token_checker
+from core.utils.refresh_token_store import refresh_token_store
 from core.utils.token_helper import TokenHelper
 
 
@@ -42,8 +41,10 @@ class JwtService:
             TokensSchema: A new set of tokens containing the new access token and refresh token
 
         Raises:
-            DecodeTokenException: If the old refresh token cannot be decoded
-            UnauthorizedException: If the new token ID cannot be generated
+            DecodeTokenException: If the old refresh token cannot be decoded, or
+            is unknown to the rotation store
+            UnauthorizedException: If the old refresh token was used before, all
+            refresh tokens descending from the same login are revoked
         """
         refresh_token = TokenHelper.decode(token=refresh_token)
 
@@ -56,14 +57,7 @@ class JwtService:
         user_id = decode_single(refresh_token.get("user_id"))
         user_id = encode(user_id)
 
-        try:
-            jti = token_checker.generate_add(refresh_token.get("jti"))
-
-        except ValueError as exc:
-            raise UnauthorizedException from exc
-
-        except KeyError as exc:
-            raise DecodeTokenException from exc
+        jti = await refresh_token_store.rotate(refresh_token.get("jti"))
 
         return TokensSchema(
             access_token=TokenHelper.encode_access(payload={"user_id": user_id}),
@@ -86,5 +80,7 @@ class JwtService:
 
         return TokensSchema(
             access_token=TokenHelper.encode_access(payload={"user_id": user_id}),
-            refresh_token=TokenHelper.encode_refresh(payload={"user_id": user_id}),
+            refresh_token=TokenHelper.encode_refresh(
+                payload={"jti": await refresh_token_store.issue(), "user_id": user_id}
+            ),
         )
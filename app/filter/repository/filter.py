@@ -3,11 +3,13 @@
 from sqlalchemy import select, delete, and_, not_, or_
 from core.db import session
 from core.repository.base import BaseRepo
-from core.db.models import UserTag, Tag, User, Recipe, RecipeTag
+from core.db.enums import TagType
+from core.db.models import GroupMember, UserTag, Tag, User, Recipe, RecipeTag
 
 
 WANTED_TAG_TYPES = ["Keuken", "Dieet"]
 UNWANTED_TAG_TYPES = ["Allergieën"]
+DIET_TAG_NAMES = ["Veganistisch", "Vegetarisch"]
 
 
 class FilterRepository(BaseRepo):
@@ -42,6 +44,31 @@ class FilterRepository(BaseRepo):
         )
         await session.execute(query)
 
+    async def get_group_member_filters(self, group_id) -> list[tuple]:
+        """Get the allergen and diet filters of every member of a group.
+
+        Members without such filters are returned once with ``None`` as tag.
+        """
+        query = (
+            select(GroupMember.user_id, Tag.id, Tag.name, Tag.tag_type)
+            .select_from(GroupMember)
+            .outerjoin(UserTag, UserTag.user_id == GroupMember.user_id)
+            .outerjoin(
+                Tag,
+                and_(
+                    Tag.id == UserTag.tag_id,
+                    or_(
+                        Tag.tag_type == TagType.ALLERGIES,
+                        Tag.name.in_(DIET_TAG_NAMES),
+                    ),
+                ),
+            )
+            .where(GroupMember.group_id == group_id)
+            .distinct()
+        )
+        result = await session.execute(query)
+        return result.all()
+
     async def get_filtered_recipes_user(self, user_id) -> list[Recipe]:
         """Get all recipes filtered from the user tags for a user."""
         query = (
@@ -1,8 +1,9 @@
 from app.filter.repository.filter import FilterRepository
+from app.filter.services.group_filter import GroupFilterService
 from app.tag.repository.tag import TagRepository
 from app.user.repository.user import UserRepository
 from app.user.exceptions.user import UserNotFoundException
-from core.db import Transactional
+from core.db import Transactional, after_commit
 from core.db.models import Tag, Recipe
 
 
@@ -11,6 +12,7 @@ class FilterService:
         self.filter_repo: FilterRepository = FilterRepository()
         self.tag_repo: TagRepository = TagRepository()
         self.user_repo: UserRepository = UserRepository()
+        self.group_filter_serv: GroupFilterService = GroupFilterService()
 
     @Transactional()
     async def store_filter(self, user_id: int, user_filter: int):
@@ -19,6 +21,7 @@ class FilterService:
         if not user:
             raise UserNotFoundException()
         await self.filter_repo.store(user_id, user_filter)
+        await after_commit(self.group_filter_serv.invalidate_user, user_id)
 
     @Transactional()
     async def store_filters(self, user_id, user_filters: list[int]):
@@ -39,6 +42,7 @@ class FilterService:
         ]
 
         await self.filter_repo.store_all(user_id, new_filters)
+        await after_commit(self.group_filter_serv.invalidate_user, user_id)
 
     @Transactional()
     async def delete_filter(self, user_id, tag_id):
@@ -46,6 +50,7 @@ class FilterService:
         if not user:
             raise UserNotFoundException()
         await self.filter_repo.delete_by_ids(user_id, tag_id)
+        await after_commit(self.group_filter_serv.invalidate_user, user_id)
 
     async def get_all_filters_user(self, user_id) -> list[Tag]:
         """Get all filters for a user."""
@@ -0,0 +1,123 @@
+"""Group filter service module.
+
+A recipe queue for a group has to respect the filters of every member. The
+combined filter of a group is resolved in a single query and cached per group
+until a member joins or leaves, or a member changes their filters.
+"""
+
+from typing import FrozenSet, NamedTuple, Optional
+from app.filter.repository.filter import DIET_TAG_NAMES, FilterRepository
+from core.config import config
+from core.db.enums import TagType
+from core.helpers.cache import LRUCache
+
+
+class GroupFilter(NamedTuple):
+    """The combined filter of all members of a group.
+
+    Attributes
+    ----------
+    member_ids : FrozenSet[int]
+        The ids of the members the filter was resolved for.
+    allergen_tag_ids : FrozenSet[int]
+        The union of the allergen tags of all members.
+    diet : str, optional
+        The strictest diet of any member, ``None`` if no member has a diet.
+    """
+
+    member_ids: FrozenSet[int]
+    allergen_tag_ids: FrozenSet[int]
+    diet: Optional[str]
+
+
+# group id -> GroupFilter
+group_filters = LRUCache(
+    maxsize=config.GROUP_FILTER_CACHE_SIZE, ttl=config.GROUP_FILTER_CACHE_TTL
+)
+
+
+class GroupFilterService:
+    """Resolve and cache the combined filters of groups.
+
+    The cache is local to the process, the time-to-live bounds how long other
+    workers may serve a filter after a change.
+
+    Attributes
+    ----------
+    filter_repo : FilterRepository
+        The filter repository.
+
+    Methods
+    -------
+    get_group_filter(group_id)
+        Get the combined filter of a group.
+    invalidate_group(group_id)
+        Forget the cached filter of a group.
+    invalidate_user(user_id)
+        Forget the cached filters of all groups the user is a member of.
+    """
+
+    def __init__(self):
+        self.filter_repo = FilterRepository()
+
+    async def get_group_filter(self, group_id: int) -> GroupFilter:
+        """Get the combined filter of a group.
+
+        Parameters
+        ----------
+        group_id : int
+            The id of the group.
+
+        Returns
+        -------
+        GroupFilter
+            The allergens and the strictest diet of the members.
+        """
+        group_filter = group_filters.get(group_id)
+        if group_filter is not None:
+            return group_filter
+
+        rows = await self.filter_repo.get_group_member_filters(group_id)
+
+        member_ids = frozenset(user_id for user_id, *_ in rows)
+        allergen_tag_ids = frozenset(
+            tag_id
+            for _, tag_id, _, tag_type in rows
+            if tag_id is not None and tag_type == TagType.ALLERGIES
+        )
+        diet_names = {name for _, _, name, _ in rows if name in DIET_TAG_NAMES}
+        diet = next((name for name in DIET_TAG_NAMES if name in diet_names), None)
+
+        group_filter = GroupFilter(member_ids, allergen_tag_ids, diet)
+        group_filters.set(group_id, group_filter)
+        return group_filter
+
+    @staticmethod
+    def invalidate_group(group_id: int) -> None:
+        """Forget the cached filter of a group.
+
+        Parameters
+        ----------
+        group_id : int
+            The id of the group.
+        """
+        group_filters.pop(group_id)
+
+    @staticmethod
+    def invalidate_user(user_id: int) -> None:
+        """Forget the cached filters of all groups the user is a member of.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user whose filters or memberships changed.
+        """
+        for group_id in group_filters.keys():
+            group_filter = group_filters.get(group_id)
+            if group_filter is not None and user_id in group_filter.member_ids:
+                group_filters.pop(group_id)
+
+    @staticmethod
+    def invalidate_all() -> None:
+        """Forget every cached group filter, e.g. after tags changed."""
+        group_filters.clear()
@@ -1,4 +1,6 @@
 from core.repository.base import BaseRepo
+from core.repository.pagination import Page, paginate, sort_keys
+from core.db.enums import GroupSortEnum
 from core.db.session import session
 from core.db.models import (
     Group,
@@ -8,7 +10,7 @@ from core.db.models import (
     SwipeSession,
 )
 from sqlalchemy import delete, and_, select
-from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import joinedload, raiseload, selectinload
 
 
 class GroupRepository(BaseRepo):
@@ -16,19 +18,41 @@ class GroupRepository(BaseRepo):
         super().__init__(Group)
 
     def query_options(self, query):
+        # Every collection gets its own query, joining them all would return
+        # members x swipe sessions x swipes rows per group.
         return query.options(
-            joinedload(Group.users).joinedload(GroupMember.user).joinedload(User.account_auth),
-            joinedload(Group.users).joinedload(GroupMember.user).joinedload(User.image),
-            joinedload(Group.swipe_sessions).joinedload(SwipeSession.swipes),
-            joinedload(Group.swipe_sessions).joinedload(SwipeSession.swipe_match).joinedload(Recipe.image),
+            selectinload(Group.users).joinedload(GroupMember.user).joinedload(User.image),
+            selectinload(Group.swipe_sessions).options(
+                selectinload(SwipeSession.swipes),
+                joinedload(SwipeSession.swipe_match).joinedload(Recipe.image),
+                joinedload(SwipeSession.summary),
+            ),
             joinedload(Group.image),
         )
 
-    async def get(self) -> list[Group]:
+    def summary_options(self, query):
+        # Swipe sessions grow with the history of a group, summaries leave them out.
+        return query.options(
+            selectinload(Group.users).joinedload(GroupMember.user).joinedload(User.image),
+            raiseload(Group.swipe_sessions),
+            joinedload(Group.image),
+        )
+
+    async def get(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: GroupSortEnum = GroupSortEnum.ID,
+        name: str | None = None,
+    ) -> Page:
         query = select(Group)
-        query = self.query_options(query)
-        result = await session.execute(query)
-        return result.unique().scalars().all()
+        if name:
+            query = query.where(Group.name.icontains(name, autoescape=True))
+        query = self.summary_options(query)
+
+        columns = sort_keys(getattr(Group, sort.value), Group.id)
+        return await paginate(query, columns, cursor, limit, descending)
 
     async def get_by_user_id(self, user_id) -> list[Group]:
         query = (
@@ -36,9 +60,15 @@ class GroupRepository(BaseRepo):
             .join(Group.users)
             .where(GroupMember.user_id == user_id)
         )
-        query = self.query_options(query)
+        query = self.summary_options(query)
+        result = await session.execute(query)
+        return result.scalars().all()
+
+    async def get_summary_by_id(self, group_id) -> Group:
+        query = select(Group).where(Group.id == group_id)
+        query = self.summary_options(query)
         result = await session.execute(query)
-        return result.unique().scalars().all()
+        return result.scalars().first()
 
     async def get_member(self, user_id, group_id) -> GroupMember:
         result = await session.execute(
@@ -0,0 +1,138 @@
+"""
+Membership index of groups.
+
+Almost every group route checks whether the user is a member or the admin of
+the group. The role of a user in a group is cached per (group id, user id) in
+a per-process LRU and, when enabled, in Redis so workers share their lookups.
+Entries are invalidated whenever a membership changes.
+"""
+
+from redis.exceptions import RedisError
+from sqlalchemy import and_, select
+
+from core.config import config
+from core.db import session
+from core.db.enums import GroupRoleEnum
+from core.db.models import GroupMember
+from core.helpers.cache.lru import MISSING, LRUCache
+from core.helpers.redis import redis
+
+# (group id, user id) -> GroupRoleEnum
+memberships = LRUCache(
+    maxsize=config.MEMBERSHIP_CACHE_SIZE, ttl=config.MEMBERSHIP_CACHE_TTL
+)
+
+REDIS_PREFIX = "membership"
+
+
+def _redis_key(group_id: int | str, user_id: int | str) -> str:
+    return f"{REDIS_PREFIX}::{group_id}:{user_id}"
+
+
+class MembershipRepository:
+    """Role of users in groups, served from the membership index.
+
+    The local entries expire after ``MEMBERSHIP_CACHE_TTL`` seconds, which
+    bounds how long other workers may serve a role after a change. Redis
+    entries are removed on every change, so they are never stale. Redis being
+    unavailable only costs the query it would have saved.
+    """
+
+    async def get_role(self, group_id: int, user_id: int) -> GroupRoleEnum:
+        """Get the role of a user in a group.
+
+        :param group_id: The id of the group.
+        :param user_id: The id of the user.
+        :return: The role, ``GroupRoleEnum.NONE`` if the user isn't a member.
+        """
+        key = (group_id, user_id)
+        role = memberships.get(key, MISSING)
+        if role is not MISSING:
+            return role
+
+        role = await self._get_shared(group_id, user_id)
+        if role is None:
+            role = await self._query_role(group_id, user_id)
+            await self._set_shared(group_id, user_id, role)
+
+        memberships.set(key, role)
+        return role
+
+    async def invalidate(self, group_id: int, user_id: int) -> None:
+        """Forget the role of a user in a group, e.g. after joining or leaving.
+
+        :param group_id: The id of the group.
+        :param user_id: The id of the user.
+        """
+        memberships.pop((group_id, user_id))
+        await self._delete_shared(_redis_key(group_id, user_id))
+
+    async def invalidate_group(self, group_id: int) -> None:
+        """Forget the roles of all users in a group, e.g. after deleting it.
+
+        :param group_id: The id of the group.
+        """
+        for key in memberships.keys():
+            if key[0] == group_id:
+                memberships.pop(key)
+        await self._delete_shared(_redis_key(group_id, "*"))
+
+    async def invalidate_user(self, user_id: int) -> None:
+        """Forget the roles of a user in all groups, e.g. after deleting them.
+
+        :param user_id: The id of the user.
+        """
+        for key in memberships.keys():
+            if key[1] == user_id:
+                memberships.pop(key)
+        await self._delete_shared(_redis_key("*", user_id))
+
+    async def _query_role(self, group_id: int, user_id: int) -> GroupRoleEnum:
+        result = await session.execute(
+            select(GroupMember.is_admin).where(
+                and_(GroupMember.group_id == group_id, GroupMember.user_id == user_id)
+            )
+        )
+        is_admin = result.scalar_one_or_none()
+
+        if is_admin is None:
+            return GroupRoleEnum.NONE
+        return GroupRoleEnum.ADMIN if is_admin else GroupRoleEnum.MEMBER
+
+    async def _get_shared(self, group_id: int, user_id: int) -> GroupRoleEnum | None:
+        if not config.MEMBERSHIP_CACHE_REDIS:
+            return None
+
+        try:
+            role = await redis.get(_redis_key(group_id, user_id))
+        except RedisError:
+            return None
+        return GroupRoleEnum(role.decode()) if role else None
+
+    async def _set_shared(
+        self, group_id: int, user_id: int, role: GroupRoleEnum
+    ) -> None:
+        if not config.MEMBERSHIP_CACHE_REDIS:
+            return
+
+        try:
+            await redis.set(
+                _redis_key(group_id, user_id),
+                role.value,
+                ex=config.MEMBERSHIP_REDIS_TTL,
+            )
+        except RedisError:
+            pass
+
+    async def _delete_shared(self, pattern: str) -> None:
+        if not config.MEMBERSHIP_CACHE_REDIS:
+            return
+
+        try:
+            if "*" not in pattern:
+                await redis.delete(pattern)
+                return
+            async for key in redis.scan_iter(pattern):
+                await redis.delete(key)
+        except RedisError:
+            pass
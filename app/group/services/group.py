@@ -2,20 +2,25 @@
 Class business logic for groups
 """
 
+from sqlalchemy.orm.attributes import set_committed_value
 from app.group.schemas.group import CreateGroupSchema
+from app.filter.services.group_filter import GroupFilterService
 from app.image.interface.image import ObjectStorageInterface
 from app.image.services.image import ImageService
 from app.swipe_session.services.swipe_session import SwipeSessionService
 from app.user.services.user import UserService
 from app.group.repository.group import GroupRepository
+from app.group.repository.membership import MembershipRepository
 from app.group.exceptions.group import (
     AdminLeavingException,
     GroupNotFoundException,
     GroupJoinConflictException,
     NotInGroupException,
 )
-from core.db.models import Group, GroupMember
-from core.db import Transactional, session
+from core.db.enums import GroupRoleEnum, GroupSortEnum
+from core.db.models import Group, GroupMember, User
+from core.db import Transactional, after_commit, session
+from core.repository.pagination import Page
 
 
 class GroupService:
@@ -30,15 +35,17 @@ class GroupService:
         Checks if a given user is a member of a given group.
     is_admin(group_id: int, user_id: int) -> bool
         Checks if a given user is an admin of a given group.
-    get_group_list() -> list[Group]
-        Gets a list of all groups.
+    get_group_list(cursor, limit, descending, sort, name) -> Page
+        Gets a page of all groups, without their swipe sessions.
     get_groups_by_user(user_id) -> list[Group]
-        Gets a list of groups for a given user.
-    create_group(request: CreateGroupSchema, user_id: int, object_storage: 
-    ObjectStorageInterface) -> int
+        Gets a list of groups for a given user, without their swipe sessions.
+    create_group(request: CreateGroupSchema, user: User, object_storage: 
+    ObjectStorageInterface) -> Group
         Creates a new group with the given data and adds the user as an admin.
     get_group_by_id(group_id: int) -> Group
         Gets a group by ID.
+    get_group_info(group_id: int) -> Group
+        Gets a group by ID, without its swipe sessions.
     join_group(group_id, user_id) -> None
         Adds a user to a group.
     """
@@ -48,9 +55,11 @@ class GroupService:
         Initializes the SwipeSessionService instance.
         """
         self.repo = GroupRepository()
+        self.membership_repo = MembershipRepository()
         self.user_serv = UserService()
         self.image_serv = ImageService
         self.swipe_session_serv = SwipeSessionService()
+        self.group_filter_serv = GroupFilterService()
 
     async def is_member(self, group_id: int, user_id: int) -> bool:
         """
@@ -68,12 +77,9 @@ class GroupService:
         bool
             True if the user is a member of the group, False otherwise.
         """
-        user = await self.repo.get_member(user_id, group_id)
+        role = await self.membership_repo.get_role(group_id, user_id)
 
-        if not user:
-            return False
-
-        return True
+        return role != GroupRoleEnum.NONE
 
     async def is_admin(self, group_id: int, user_id: int) -> bool:
         """
@@ -91,29 +97,48 @@ class GroupService:
         bool
             True if the user is an admin of the group, False otherwise.
         """
-        user = await self.repo.get_member(user_id, group_id)
-
-        if not user:
-            return False
+        role = await self.membership_repo.get_role(group_id, user_id)
 
-        return user.is_admin
+        return role == GroupRoleEnum.ADMIN
 
-    async def get_group_list(self) -> list[Group]:
+    async def get_group_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: GroupSortEnum = GroupSortEnum.ID,
+        name: str | None = None,
+    ) -> Page:
         """
-        Gets a list of all groups.
+        Gets a page of all groups.
+
+        Only the members of the groups are loaded, the swipe sessions are
+        left out.
+
+        Parameters
+        ----------
+        cursor : str, optional
+            Cursor of the page, None for the first page.
+        limit : int
+            Maximum amount of groups in the page.
+        descending : bool, optional
+            Whether to sort in descending order.
+        sort : GroupSortEnum, optional
+            Column to sort by.
+        name : str, optional
+            Only groups whose name contains this, case insensitive.
 
         Returns
         -------
-        list[Group]
-            A list of all groups.
+        Page
+            The groups of the page and the cursor of the next page.
         """
-        groups: list[Group] = await self.repo.get()
-
-        return groups
+        return await self.repo.get(cursor, limit, descending, sort, name)
 
     async def get_groups_by_user(self, user_id) -> list[Group]:
         """
-        Get a list of groups that a user is a member of.
+        Get a list of groups that a user is a member of, without their swipe
+        sessions.
 
         Args:
             user_id (int): The ID of the user to get groups for.
@@ -130,39 +155,45 @@ class GroupService:
     async def create_group(
         self,
         request: CreateGroupSchema,
-        user_id: int,
+        user: User,
         object_storage: ObjectStorageInterface,
-    ) -> int:
+    ) -> Group:
         """
         Create a group
 
+        The relationships of the returned group are set from the objects at
+        hand, so it can be returned without fetching it again.
+
         Parameters
         ----------
         request : CreateGroupSchema
             The request body
-        user_id : int
-            The user id
+        user : User
+            The creating user, with its image loaded
         object_storage : ObjectStorageInterface
             The object storage interface
 
         Returns
         -------
-        int
-            The group id
+        Group
+            The created group
         """
         # Check if file exists
-        await self.image_serv(object_storage).get_image_by_name(request.filename)
-
-        db_group = Group(**request.dict())
+        image = await self.image_serv(object_storage).get_image_by_name(
+            request.filename
+        )
 
-        db_group.users.append(
-            GroupMember(
-                is_admin=True,
-                user_id=user_id,
-            )
+        db_group = Group(
+            **request.dict(),
+            users=[GroupMember(is_admin=True, user=user)],
+            swipe_sessions=[],
         )
+        # Assigning `image` would move the file away from its current owner
+        # through the one-to-one backref, only fill in the loaded value.
+        set_committed_value(db_group, "image", image)
 
-        return await self.repo.create(db_group)
+        await self.repo.create(db_group)
+        return db_group
 
     @Transactional()
     async def edit_group(
@@ -170,7 +201,7 @@ class GroupService:
         request: CreateGroupSchema,
         group_id: int,
         object_storage: ObjectStorageInterface,
-    ) -> int:
+    ) -> Group:
         """
         Edit a group
 
@@ -185,19 +216,22 @@ class GroupService:
 
         Returns
         -------
-        int
-            The group id
+        Group
+            The edited group
         """
         # Check if file exists
-        await self.image_serv(object_storage).get_image_by_name(request.filename)
+        image = await self.image_serv(object_storage).get_image_by_name(
+            request.filename
+        )
 
         db_group = await self.get_group_by_id(group_id)
         db_group.name = request.name
         db_group.filename = request.filename
+        set_committed_value(db_group, "image", image)
 
         await session.flush()
 
-        return db_group.id
+        return db_group
 
     async def get_group_by_id(self, group_id: int) -> Group:
         """
@@ -214,6 +248,18 @@ class GroupService:
 
         return group
 
+    async def get_group_info(self, group_id: int) -> Group:
+        """
+        Get a group by its ID, with its members but without swipe sessions.
+
+        Args:
+            group_id (int): The ID of the group to retrieve.
+
+        Returns:
+            Group: The Group object with the specified ID.
+        """
+        return await self.repo.get_summary_by_id(group_id)
+
     @Transactional()
     async def join_group(self, group_id, user_id) -> None:
         """
@@ -241,6 +287,8 @@ class GroupService:
                 user=await self.user_serv.get_by_id(user_id),
             )
         )
+        await after_commit(self.membership_repo.invalidate, group_id, user_id)
+        await after_commit(self.group_filter_serv.invalidate_group, group_id)
 
     @Transactional()
     async def leave_group(self, group_id, user_id) -> None:
@@ -256,7 +304,7 @@ class GroupService:
             NotInGroupException: If the specified user is not in the group.
             AdminLeavingException: If the specified user is the group admin.
         """
-        group = await self.get_group_by_id(group_id)
+        group = await self.get_group_info(group_id)
 
         if not group:
             raise GroupNotFoundException
@@ -268,6 +316,8 @@ class GroupService:
             raise AdminLeavingException
 
         await self.repo.delete_member(group_id, user_id)
+        await after_commit(self.membership_repo.invalidate, group_id, user_id)
+        await after_commit(self.group_filter_serv.invalidate_group, group_id)
 
     async def delete_group(self, group_id) -> None:
         """Delete's a group by given id.
@@ -283,3 +333,5 @@ class GroupService:
             raise GroupNotFoundException
 
         await self.repo.delete(group)
+        await after_commit(self.membership_repo.invalidate_group, group_id)
+        await after_commit(self.group_filter_serv.invalidate_group, group_id)
@@ -7,6 +7,7 @@ from sqlalchemy import select
 from core.db.models import File
 from core.db import session
 from core.repository.base import BaseRepo
+from core.repository.pagination import Page, paginate
 from app.image.exceptions.image import DuplicateFileNameException
 
 
@@ -42,16 +43,29 @@ class ImageRepository(BaseRepo):
         session.add(file)
         return file
 
-    async def get(self) -> list[File]:
+    async def get(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        filename: str | None = None,
+    ) -> Page:
         """
-        Get a list of all the image files stored in the database.
+        Get a page of the image files stored in the database, sorted by filename.
+
+        Args:
+            cursor (str | None): The cursor of the page, None for the first page.
+            limit (int): The maximum amount of files in the page.
+            descending (bool): Whether to sort in descending order.
+            filename (str | None): Only files whose name starts with this.
 
         Returns:
-            List[File]: A list of File objects representing the image files.
+            Page: The files of the page and the cursor of the next page.
         """
         query = select(File)
-        result = await session.execute(query)
-        return result.scalars().all()
+        if filename:
+            query = query.where(File.filename.startswith(filename, autoescape=True))
+        return await paginate(query, [File.filename], cursor, limit, descending)
 
     async def get_by_name(self, filename: str) -> File:
         """
@@ -67,6 +81,22 @@ class ImageRepository(BaseRepo):
         result = await session.execute(query)
         return result.scalars().first()
 
+    async def get_existing_names(self, filenames: set[str]) -> set[str]:
+        """
+        Get which of the given filenames are stored in the database.
+
+        Args:
+            filenames (set[str]): The names of the image files.
+
+        Returns:
+            set[str]: The filenames that exist.
+        """
+        if not filenames:
+            return set()
+        query = select(File.filename).where(File.filename.in_(filenames))
+        result = await session.execute(query)
+        return set(result.scalars().all())
+
     async def delete(self, model: File) -> None:
         """
         Delete the given image file from the database.
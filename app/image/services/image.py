@@ -10,6 +10,7 @@ from fastapi import UploadFile
 from core.db.models import File
 from core.db import Transactional
 from core.config import config
+from core.repository.pagination import Page
 
 from app.image.exceptions.image import (
     InvalidImageException,
@@ -104,17 +105,33 @@ class ImageService:
 
         return image
 
-    async def get_images(self) -> List[File]:
+    async def get_images(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        filename: str | None = None,
+    ) -> Page:
         """
-        Get a list of images from the repository.
+        Get a page of images from the repository, sorted by filename.
+
+        Parameters
+        ----------
+        cursor : str, optional
+            The cursor of the page, None for the first page.
+        limit : int
+            The maximum amount of images in the page.
+        descending : bool, optional
+            Whether to sort in descending order.
+        filename : str, optional
+            Only images whose filename starts with this.
 
         Returns
         -------
-        List[File]
-            A list of image files.
+        Page
+            The image files of the page and the cursor of the next page.
         """
-        images = await self.image_repo.get()
-        return images
+        return await self.image_repo.get(cursor, limit, descending, filename)
 
     @Transactional()
     async def upload_images(self, images: List[UploadFile], user_id: int) -> List[File]:
@@ -2,10 +2,11 @@
 The module contains a repository class that defines database operations for ingredients. 
 """
 
-from typing import List
-from sqlalchemy import select
+from typing import AsyncIterator, Dict, List, Tuple
+from sqlalchemy import Row, select
 from core.db import session
 from core.db.models import Ingredient
+from core.db.upsert import insert_ignore
 from core.repository.base import BaseRepo
 
 
@@ -29,6 +30,78 @@ class IngredientRepository(BaseRepo):
         session.add(ingredient)
         return ingredient
 
+    async def get_or_create_by_names(
+        self, names: set[str]
+    ) -> Tuple[Dict[str, Ingredient], bool]:
+        """Get ingredients by name, creating the missing ones
+
+        Parameters:
+        ----------
+            names (set[str]): Names of the ingredients
+        Returns:
+        -------
+            Tuple[Dict[str, Ingredient], bool]: The ingredients by name, and
+            whether any ingredient was created
+        """
+        if not names:
+            return {}, False
+
+        result = await session.scalars(
+            select(Ingredient).where(Ingredient.name.in_(names))
+        )
+        ingredients = {ingredient.name: ingredient for ingredient in result}
+        missing = names - ingredients.keys()
+        if not missing:
+            return ingredients, False
+
+        result = await session.scalars(
+            insert_ignore(Ingredient)
+            .values([{"name": name} for name in missing])
+            .returning(Ingredient)
+        )
+        created = {ingredient.name: ingredient for ingredient in result}
+        ingredients.update(created)
+
+        # Created concurrently by another transaction.
+        if missing - created.keys():
+            result = await session.scalars(
+                select(Ingredient).where(Ingredient.name.in_(missing - created.keys()))
+            )
+            ingredients.update((ingredient.name, ingredient) for ingredient in result)
+
+        return ingredients, bool(created)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """Stream all ingredients from a server-side cursor
+
+        Parameters:
+        ----------
+            batch_size (int): Amount of ingredients fetched at once
+        Yields:
+        -------
+            dict: The id and name of every ingredient, ordered by id
+        """
+        query = (
+            select(Ingredient.id, Ingredient.name)
+            .order_by(Ingredient.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await session.stream(query)
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def get_entries(self) -> List[Row]:
+        """Get the columns of all ingredients needed for lookups by id or name
+
+        Returns:
+        -------
+            List[Row]: The id and name of every ingredient, ordered by id
+        """
+        result = await session.execute(
+            select(Ingredient.id, Ingredient.name).order_by(Ingredient.id)
+        )
+        return result.all()
+
     async def get(self) -> List[Ingredient]:
         """Get all ingredients from the database
 
@@ -1,16 +1,26 @@
 """This module contains the `IngredientService` class that provides ingredients 
     related operations"""
-from typing import List
+from typing import AsyncIterator, List, Tuple
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from app.ingredient.schemas import CreateIngredientSchema
 from app.ingredient.repository.ingredient import IngredientRepository
+from app.recipe.repository.recipe import RecipeRepository
 from app.ingredient.exceptions.ingredient import (
     IngredientAlreadyExistsException,
     IngredientNotFoundException,
     IngredientDependecyException,
 )
 from core.db.models import Ingredient
+from core.config import config
 from core.db import Transactional
+from core.db.enums import CatalogEnum
+from core.helpers.catalog_dictionary import CatalogDictionary
+from core.repository.catalog_version import CatalogVersionRepository
+
+ingredient_dictionary = CatalogDictionary(
+    CatalogEnum.INGREDIENTS, IngredientRepository().get_entries
+)
 
 
 class IngredientService:
@@ -25,9 +35,18 @@ class IngredientService:
 
     Methods
     -------
-    get_ingredients() -> list[Ingredient]:
+    get_ingredients() -> list[Row]:
         Returns a list of all the ingredients.
 
+    autocomplete_ingredients(query: str, limit: int) -> list[Row]:
+        Returns the ingredients whose name starts with the query.
+
+    stream_ingredients() -> AsyncIterator[dict]:
+        Streams all ingredients for exports.
+
+    get_versioned_ingredients() -> Tuple[int, list[Row]]:
+        Returns all ingredients and the version of the ingredient collection.
+
     get_ingredient_by_id(ingredient_id: int) -> Ingredient:
         Returns an ingredient with a given ID.
 
@@ -44,10 +63,13 @@ class IngredientService:
     def __init__(self):
         """initializes the service"""
         self.ingredient_repo = IngredientRepository()
+        self.recipe_repo = RecipeRepository()
+        self.version_repo = CatalogVersionRepository()
 
-    async def get_ingredients(self) -> List[Ingredient]:
+    async def get_ingredients(self) -> List[Row]:
         """
-        Returns a list of all the ingredients.
+        Returns a list of all the ingredients, from the in-memory ingredient
+        dictionary.
 
         Parameters
         ----------
@@ -55,10 +77,63 @@ class IngredientService:
 
         Returns
         -------
-        list[Ingredient]
-            A list of all the ingredients.
+        list[Row]
+            The id and name of all the ingredients.
+        """
+        return (await ingredient_dictionary.refresh()).entries()
+
+    async def autocomplete_ingredients(self, query: str, limit: int) -> List[Row]:
+        """
+        Returns the ingredients whose name, or a word in it, starts with the
+        query.
+
+        Parameters
+        ----------
+        query : str
+            The start of the ingredient name.
+        limit : int
+            The maximum amount of ingredients to return.
+
+        Returns
+        -------
+        list[Row]
+            The id and name of the matching ingredients.
         """
-        return await self.ingredient_repo.get()
+        return (await ingredient_dictionary.refresh()).complete(query, limit)
+
+    def stream_ingredients(
+        self, batch_size: int = config.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[dict]:
+        """
+        Streams all ingredients for exports.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The amount of ingredients fetched from the database at once.
+
+        Returns
+        -------
+        AsyncIterator[dict]
+            The id and name of every ingredient.
+        """
+        return self.ingredient_repo.stream_all(batch_size)
+
+    async def get_versioned_ingredients(self) -> Tuple[int, List[Row]]:
+        """
+        Returns all ingredients and the version of the ingredient collection they
+        were loaded at. The version, bumped on every write, is checked first, so
+        the ingredients are current.
+
+        Returns
+        -------
+        int
+            The version of the ingredient collection.
+        list[Row]
+            The id and name of all the ingredients.
+        """
+        dictionary = await ingredient_dictionary.refresh(check_version=True)
+        return dictionary.version, dictionary.entries()
 
     async def get_ingredient_by_id(self, ingredient_id: int) -> Ingredient:
         """
@@ -140,6 +215,7 @@ class IngredientService:
         if ingredient:
             raise IngredientAlreadyExistsException
 
+        await self.version_repo.bump(CatalogEnum.INGREDIENTS)
         return await self.ingredient_repo.create_by_name(request.name)
 
     @Transactional()
@@ -176,11 +252,14 @@ class IngredientService:
         if not ingredient:
             raise IngredientNotFoundException
         try:
-            return await self.ingredient_repo.update(
+            ingredient = await self.ingredient_repo.update(
                 ingredient, request.name
             )
         except IntegrityError as exc:
             raise IngredientAlreadyExistsException from exc
+        await self.recipe_repo.touch_by_ingredient(ingredient_id)
+        await self.version_repo.bump(CatalogEnum.INGREDIENTS)
+        return ingredient
 
     @Transactional()
     async def delete_ingredient(self, ingredient_id: int) -> None:
@@ -209,6 +288,8 @@ class IngredientService:
         if not ingredient:
             raise IngredientNotFoundException
 
+        await self.recipe_repo.touch_by_ingredient(ingredient_id)
+        await self.version_repo.bump(CatalogEnum.INGREDIENTS)
         try:
             await self.ingredient_repo.delete(ingredient)
         except AssertionError as exc:
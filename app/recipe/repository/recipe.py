@@ -1,8 +1,22 @@
 """ Recipe repository. """
 
-from typing import List
-from sqlalchemy import select, func, and_, or_, not_
-from sqlalchemy.orm import joinedload, join
+from typing import AsyncIterator, Dict, List, Tuple
+from sqlalchemy import (
+    select,
+    func,
+    update,
+    insert,
+    case,
+    literal,
+    literal_column,
+    and_,
+    or_,
+    not_,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, selectinload, join
+from app.recipe.exceptions.recipe import RecipeNotFoundException
+from app.user.exceptions.user import UserNotFoundException
 from core.db import session
 from core.db.models import (
     Recipe,
@@ -14,6 +28,8 @@ from core.db.models import (
     User,
     UserTag,
 )
+from core.db.session import engines
+from core.db.upsert import dialect_insert, insert_ignore
 from core.repository.base import BaseRepo
 
 WANTED_TAG_TYPES = ["Keuken", "Dieet"]
@@ -51,7 +67,6 @@ class RecipeRepository(BaseRepo):
             joinedload(Recipe.ingredients).joinedload(RecipeIngredient.ingredient),
             joinedload(Recipe.creator).joinedload(User.account_auth),
             joinedload(Recipe.creator).joinedload(User.image),
-            joinedload(Recipe.judgements),
             joinedload(Recipe.image),
         )
 
@@ -188,44 +203,78 @@ class RecipeRepository(BaseRepo):
         result = await session.execute(query)
         return result.scalars().unique().all()
 
-    async def get_custom_filtered(
-        self, tags: list[Tag], limit: int, offset: int
-    ) -> list[Recipe]:
-        recipes = await self.get()
+    async def get_group_filtered(
+        self,
+        allergen_tag_ids: List[int],
+        diet: str = None,
+        limit: int = None,
+        offset: int = None,
+    ) -> List[Recipe]:
+        """Get the recipes that pass the combined filter of a group.
 
-        result = []
+        Parameters
+        ----------
+        allergen_tag_ids : List[int]
+            Recipes with any of these tags are excluded.
+        diet : str, optional
+            The strictest diet of the group, "Veganistisch" or "Vegetarisch".
+        limit : int, optional
+            Maximum amount of recipes.
+        offset : int, optional
+            Amount of recipes to skip.
 
-        if "Veganistisch" in [tag.name for tag in tags]:
-            for recipe in recipes:
-                if ("Veganistisch" in [tag.tag.name for tag in recipe.tags] or 
-                    "Vegetarisch" in [tag.tag.name for tag in recipe.tags]):
-                    result.append(recipe)
+        Returns
+        -------
+        List[Recipe]
+            The recipes, without relationships loaded.
+        """
+        query = select(Recipe).order_by(Recipe.id)
 
-        elif "Vegetarisch" in [tag.name for tag in tags]:
-            for recipe in recipes:
-                if "Vegetarisch" in [tag.tag.name for tag in recipe.tags]:
-                    result.append(recipe)
+        if allergen_tag_ids:
+            query = query.where(
+                Recipe.id.not_in(
+                    select(RecipeTag.recipe_id).where(
+                        RecipeTag.tag_id.in_(allergen_tag_ids)
+                    )
+                )
+            )
 
+        if diet == "Veganistisch":
+            diet_tag_names = ["Veganistisch"]
+        elif diet == "Vegetarisch":
+            diet_tag_names = ["Veganistisch", "Vegetarisch"]
         else:
-            result = recipes
+            diet_tag_names = None
+
+        if diet_tag_names:
+            query = query.where(
+                Recipe.id.in_(
+                    select(RecipeTag.recipe_id)
+                    .join(Tag)
+                    .where(Tag.name.in_(diet_tag_names))
+                )
+            )
 
+        if limit:
+            query = query.limit(limit)
         if offset:
-            result = result[offset:]
+            query = query.offset(offset)
 
-        if limit:
-            result = result[:limit]
+        result = await session.execute(query)
+        return result.scalars().all()
 
-        return result
+    async def get_filter_queries(self, user_id: int = None):
+        """Get the listing and count queries that apply the filters of a user.
 
-    async def get_filtered(
-        self, limit: int, offset: int, user_id: int = None
-    ) -> List[Recipe]:
-        """Get a list of recipes.
+        Parameters
+        ----------
+        user_id : int, optional
+            The id of the user whose filters should be applied.
 
         Returns
         -------
-        List[Recipe]
-            A list of recipes.
+        Tuple[Select, Select]
+            The recipe query and the matching count query.
         """
         if user_id:
             user_tags = await self.get_user_tags(user_id)
@@ -253,6 +302,20 @@ class RecipeRepository(BaseRepo):
         else:
             query = select(Recipe)
             count_query = select(func.count()).select_from(Recipe)
+
+        return query, count_query
+
+    async def get_filtered(
+        self, limit: int, offset: int, user_id: int = None
+    ) -> List[Recipe]:
+        """Get a list of recipes.
+
+        Returns
+        -------
+        List[Recipe]
+            A list of recipes.
+        """
+        query, count_query = await self.get_filter_queries(user_id)
         # eager load all relationships
         query = self.query_options(query)
         # apply limit and offset
@@ -265,6 +328,191 @@ class RecipeRepository(BaseRepo):
         # return recipes and count
         return recipes, count
 
+    async def get_filtered_versions(
+        self, limit: int, offset: int, user_id: int = None
+    ) -> Tuple[List[Tuple[int, int]], int]:
+        """Get the ids and content versions of a page of filtered recipes.
+
+        Only two columns are selected, so no relationships are loaded.
+
+        Parameters
+        ----------
+        limit : int
+            Maximum amount of recipes in the page.
+        offset : int
+            Amount of recipes to skip.
+        user_id : int, optional
+            The id of the user whose filters should be applied.
+
+        Returns
+        -------
+        Tuple[List[Tuple[int, int]], int]
+            The (id, version) pairs of the page and the total count.
+        """
+        query, _ = await self.get_filter_queries(user_id)
+        query = (
+            query.with_only_columns(Recipe.id, Recipe.version)
+            .distinct()
+            .order_by(None)
+            .order_by(Recipe.id)
+        )
+        count_query = select(func.count()).select_from(query.subquery())
+
+        result = await session.execute(query.limit(limit).offset(offset))
+        result_count = await session.execute(count_query)
+        return [tuple(row) for row in result.all()], result_count.scalar()
+
+    async def get_versions(self, recipe_ids: List[int]) -> Dict[int, int]:
+        """Get the content versions of the given recipes.
+
+        Parameters
+        ----------
+        recipe_ids : List[int]
+            The ids of the recipes.
+
+        Returns
+        -------
+        Dict[int, int]
+            The content version by recipe id, missing recipes are left out.
+        """
+        query = select(Recipe.id, Recipe.version).where(Recipe.id.in_(recipe_ids))
+        result = await session.execute(query)
+        return dict(result.all())
+
+    async def get_by_ids(self, recipe_ids: List[int]) -> List[Recipe]:
+        """Get the recipes with the given ids, with all relationships loaded.
+
+        Parameters
+        ----------
+        recipe_ids : List[int]
+            The ids of the recipes.
+
+        Returns
+        -------
+        List[Recipe]
+            The recipes that exist.
+        """
+        query = (
+            select(Recipe)
+            .where(Recipe.id.in_(recipe_ids))
+            .execution_options(populate_existing=True)
+        )
+        query = self.query_options(query)
+        result = await session.execute(query)
+        return result.unique().scalars().all()
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[Recipe]:
+        """Stream all recipes with their tags and ingredients.
+
+        Recipes are fetched from a server-side cursor ``batch_size`` at a
+        time, and the tags and ingredients per batch, so memory use doesn't
+        grow with the amount of recipes.
+
+        Parameters
+        ----------
+        batch_size : int
+            The amount of recipes fetched at once.
+
+        Yields
+        ------
+        Recipe
+            The recipes, ordered by id.
+        """
+        query = (
+            select(Recipe)
+            .options(
+                selectinload(Recipe.tags).joinedload(RecipeTag.tag),
+                selectinload(Recipe.ingredients).joinedload(RecipeIngredient.ingredient),
+            )
+            .order_by(Recipe.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await session.stream_scalars(query)
+        async for recipe in result:
+            yield recipe
+
+    async def create_many(
+        self,
+        recipes: List[Recipe],
+        ingredient_rows: List[List[Dict]],
+        tag_rows: List[List[Dict]],
+    ) -> List[int]:
+        """Insert recipes and their association rows in bulk.
+
+        The recipes are flushed together, after which the ingredient and tag
+        rows of all recipes are inserted with one executemany each.
+
+        Parameters
+        ----------
+        recipes : List[Recipe]
+            New recipes, without ingredients or tags set.
+        ingredient_rows : List[List[Dict]]
+            Per recipe, the ``recipe_ingredient`` values without ``recipe_id``.
+        tag_rows : List[List[Dict]]
+            Per recipe, the ``recipe_tag`` values without ``recipe_id``.
+
+        Returns
+        -------
+        List[int]
+            The ids of the recipes, in order.
+        """
+        session.add_all(recipes)
+        await session.flush()
+
+        recipe_ingredients = [
+            {"recipe_id": recipe.id, **row}
+            for recipe, rows in zip(recipes, ingredient_rows)
+            for row in rows
+        ]
+        recipe_tags = [
+            {"recipe_id": recipe.id, **row}
+            for recipe, rows in zip(recipes, tag_rows)
+            for row in rows
+        ]
+        # Core inserts of the tables: ORM bulk inserts are not routed to the
+        # writer by RoutingSession.
+        if recipe_ingredients:
+            await session.execute(insert(RecipeIngredient.__table__), recipe_ingredients)
+        if recipe_tags:
+            await session.execute(insert(RecipeTag.__table__), recipe_tags)
+
+        return [recipe.id for recipe in recipes]
+
+    async def touch(self, *criteria, **values) -> None:
+        """Bump the content version of every recipe matching the criteria.
+
+        Called by writes that change what a recipe document contains, so the
+        pre-serialized documents of those recipes are rebuilt on next read.
+        Extra column values can be set in the same statement.
+        """
+        query = (
+            update(Recipe)
+            .where(*criteria)
+            .values(version=Recipe.version + 1, **values)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(query)
+
+    async def touch_by_tag(self, tag_id: int) -> None:
+        """Bump the content version of all recipes with the given tag."""
+        await self.touch(
+            Recipe.id.in_(select(RecipeTag.recipe_id).where(RecipeTag.tag_id == tag_id))
+        )
+
+    async def touch_by_ingredient(self, ingredient_id: int) -> None:
+        """Bump the content version of all recipes with the given ingredient."""
+        await self.touch(
+            Recipe.id.in_(
+                select(RecipeIngredient.recipe_id).where(
+                    RecipeIngredient.ingredient_id == ingredient_id
+                )
+            )
+        )
+
+    async def touch_by_creator(self, user_id: int) -> None:
+        """Bump the content version of all recipes created by the given user."""
+        await self.touch(Recipe.creator_id == user_id)
+
     async def get_user_tags(self, user_id: int):
         query = select(Tag).join(UserTag).where(UserTag.user_id == user_id)
         result = await session.execute(query)
@@ -352,7 +600,11 @@ class RecipeRepository(BaseRepo):
         return result.scalars().first()
 
     async def judge(self, recipe_id: int, user_id: int, like: bool) -> None:
-        """Like a recipe.
+        """Like or dislike a recipe, keeping the counters of the recipe current.
+
+        Judging a recipe the same way again changes nothing. On PostgreSQL the
+        judgement is upserted and the counters are updated in one statement,
+        relying on the foreign keys to reject unknown recipes and users.
 
         Parameters
         ----------
@@ -362,14 +614,152 @@ class RecipeRepository(BaseRepo):
             The id of the user who likes the recipe.
         like : bool
             True if the user likes the recipe, False if the user dislikes the recipe.
+
+        Raises
+        ------
+        RecipeNotFoundException
+            If the recipe with the given id does not exist.
+        UserNotFoundException
+            If the user with the given id does not exist.
         """
-        judgement = await self.get_jugment(recipe_id, user_id)
-        if judgement:
-            judgement.like = like
+        if engines["writer"].dialect.name == "postgresql":
+            await self._judge_upsert(recipe_id, user_id, like)
+        else:
+            await self._judge_conditional(recipe_id, user_id, like)
+
+    async def _judge_upsert(self, recipe_id: int, user_id: int, like: bool) -> None:
+        query = dialect_insert(RecipeJudgement).values(
+            recipe_id=recipe_id, user_id=user_id, like=like
+        )
+        # Conflicting rows that already hold the same judgement are left alone,
+        # so nothing is returned for them and the counters stay as they are.
+        judged = (
+            query.on_conflict_do_update(
+                index_elements=[RecipeJudgement.recipe_id, RecipeJudgement.user_id],
+                set_={"like": query.excluded.like, "updated_at": func.now()},
+                where=RecipeJudgement.like.is_distinct_from(query.excluded.like),
+            )
+            .returning(
+                RecipeJudgement.recipe_id,
+                literal_column("xmax = 0").label("inserted"),
+            )
+            .cte("judged")
+        )
+        # A new judgement only adds to one counter, a changed one also takes
+        # one off the other counter.
+        changed = case((judged.c.inserted, 0), else_=1)
+
+        try:
+            await self.touch(
+                Recipe.id == judged.c.recipe_id,
+                likes=Recipe.likes + 1 if like else Recipe.likes - changed,
+                dislikes=Recipe.dislikes - changed if like else Recipe.dislikes + 1,
+            )
+        except IntegrityError as exc:
+            if "recipe_id" in str(exc.orig):
+                raise RecipeNotFoundException() from exc
+            raise UserNotFoundException() from exc
+
+    async def _judge_conditional(
+        self, recipe_id: int, user_id: int, like: bool
+    ) -> None:
+        judgement = (RecipeJudgement.recipe_id == recipe_id) & (
+            RecipeJudgement.user_id == user_id
+        )
+        result = await session.execute(
+            update(RecipeJudgement)
+            .where(judgement, RecipeJudgement.like != like)
+            .values(like=like)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount:
+            likes, dislikes = (1, -1) if like else (-1, 1)
         else:
-            session.add(
-                RecipeJudgement(recipe_id=recipe_id, user_id=user_id, like=like)
+            # Foreign keys aren't enforced by every database, so the existence
+            # checks are part of the insert.
+            recipe_exists = select(Recipe.id).where(Recipe.id == recipe_id).exists()
+            user_exists = select(User.id).where(User.id == user_id).exists()
+            result = await session.execute(
+                insert_ignore(RecipeJudgement).from_select(
+                    ["recipe_id", "user_id", "like"],
+                    select(
+                        literal(recipe_id), literal(user_id), literal(like)
+                    ).where(recipe_exists, user_exists),
+                )
             )
+            if not result.rowcount:
+                result = await session.execute(select(recipe_exists, user_exists))
+                recipe_found, user_found = result.one()
+                if not recipe_found:
+                    raise RecipeNotFoundException()
+                if not user_found:
+                    raise UserNotFoundException()
+                return
+
+            likes, dislikes = (1, 0) if like else (0, 1)
+
+        await self.touch(
+            Recipe.id == recipe_id,
+            likes=Recipe.likes + likes,
+            dislikes=Recipe.dislikes + dislikes,
+        )
+
+    async def forget_judgements(self, user_id: int) -> None:
+        """Remove the judgements of a user from the counters.
+
+        Must run before the user, and with it their judgements, is deleted.
+
+        Parameters
+        ----------
+        user_id : int
+            The id of the user.
+        """
+        judged = select(RecipeJudgement.recipe_id).where(
+            RecipeJudgement.user_id == user_id
+        )
+        like = (
+            select(RecipeJudgement.like)
+            .where(RecipeJudgement.recipe_id == Recipe.id)
+            .where(RecipeJudgement.user_id == user_id)
+            .scalar_subquery()
+        )
+        await self.touch(
+            Recipe.id.in_(judged),
+            likes=Recipe.likes - case((like.is_(True), 1), else_=0),
+            dislikes=Recipe.dislikes - case((like.is_(False), 1), else_=0),
+        )
+
+    async def recount_judgements(self) -> int:
+        """Repair the like and dislike counters from the judgements.
+
+        Only recipes whose counters drifted are updated, their content version
+        is bumped as well.
+
+        Returns
+        -------
+        int
+            The amount of repaired recipes.
+        """
+        likes = (
+            select(func.count())
+            .where(RecipeJudgement.recipe_id == Recipe.id)
+            .where(RecipeJudgement.like.is_(True))
+            .scalar_subquery()
+        )
+        dislikes = (
+            select(func.count())
+            .where(RecipeJudgement.recipe_id == Recipe.id)
+            .where(RecipeJudgement.like.is_(False))
+            .scalar_subquery()
+        )
+        query = (
+            update(Recipe)
+            .where(or_(Recipe.likes != likes, Recipe.dislikes != dislikes))
+            .values(likes=likes, dislikes=dislikes, version=Recipe.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+        return result.rowcount
 
     # async def update_recipe(self, recipe: Recipe) -> Recipe:
     #     """Update a recipe.
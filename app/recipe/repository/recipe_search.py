@@ -0,0 +1,154 @@
+""" Recipe search repository. """
+
+from typing import List, Tuple
+from sqlalchemy import select, func, literal_column, or_
+from core.db import session
+from core.db.enums import CatalogEnum
+from core.db.models import Recipe
+from core.db.session import engines
+from core.helpers.search import InvertedIndex
+from core.repository.catalog_version import CatalogVersionRepository
+from app.recipe.repository.recipe import RecipeRepository
+
+# Must stay identical to the expression of the ix_recipe_search_document index.
+SEARCH_DOCUMENT = literal_column(
+    "to_tsvector('dutch', coalesce(recipe.name, '') || ' ' "
+    "|| coalesce(recipe.description, ''))"
+)
+SEARCH_TEXT_CONFIG = literal_column("'dutch'")
+
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 1
+
+# Ranked ids checked against the filters of the user per query
+FILTER_WINDOW = 500
+
+
+class RecipeSearchIndex:
+    """In-process index over recipe names and descriptions.
+
+    Used when the database has no full-text search of its own. The index is
+    rebuilt whenever the ``RECIPES`` catalog version changed since it was
+    built, services bump it on every write of a name or description.
+    """
+
+    def __init__(self):
+        self.version = None
+        self.index = InvertedIndex()
+
+    async def get_index(self) -> InvertedIndex:
+        """Get an index that is current with the recipe table."""
+        version = await CatalogVersionRepository().get(CatalogEnum.RECIPES)
+
+        if version != self.version:
+            result = await session.execute(
+                select(Recipe.id, Recipe.name, Recipe.description)
+            )
+            index = InvertedIndex()
+            for recipe_id, name, description in result.all():
+                index.add(
+                    recipe_id, [(name, NAME_WEIGHT), (description, DESCRIPTION_WEIGHT)]
+                )
+            self.index, self.version = index, version
+
+        return self.index
+
+
+search_index = RecipeSearchIndex()
+
+
+class RecipeSearchRepository(RecipeRepository):
+    """Ranked full-text search over recipes.
+
+    On PostgreSQL the ``tsvector`` and trigram indexes are used, elsewhere an
+    in-process inverted index. Both apply the allergen and diet filters of the
+    user, like ``get_filtered``.
+
+    Methods
+    -------
+    search(query, limit, offset, user_id)
+        Get a page of recipe ids ranked by relevance.
+    """
+
+    async def get_allowed_ids_query(self, user_id: int = None):
+        """Get a query for the ids of all recipes that pass the user's filters.
+
+        Parameters
+        ----------
+        user_id : int, optional
+            The id of the user whose filters should be applied.
+        """
+        query, _ = await self.get_filter_queries(user_id)
+        return query.with_only_columns(Recipe.id).order_by(None).distinct()
+
+    async def search(
+        self, query: str, limit: int, offset: int, user_id: int = None
+    ) -> Tuple[List[int], int]:
+        """Search recipes by name and description.
+
+        Parameters
+        ----------
+        query : str
+            Free text query.
+        limit : int
+            Maximum amount of recipes in the page.
+        offset : int
+            Amount of recipes to skip.
+        user_id : int, optional
+            The id of the user whose filters should be applied.
+
+        Returns
+        -------
+        Tuple[List[int], int]
+            The ids of the page, most relevant first, and the total count.
+        """
+        allowed = await self.get_allowed_ids_query(user_id)
+
+        if engines["reader"].dialect.name == "postgresql":
+            return await self._search_postgres(query, limit, offset, allowed)
+
+        return await self._search_index(query, limit, offset, allowed)
+
+    async def _search_postgres(self, query: str, limit: int, offset: int, allowed):
+        ts_query = func.websearch_to_tsquery(SEARCH_TEXT_CONFIG, query)
+        rank = func.ts_rank(SEARCH_DOCUMENT, ts_query) + func.similarity(
+            Recipe.name, query
+        )
+
+        matches = (
+            select(Recipe.id)
+            .where(Recipe.id.in_(allowed))
+            .where(
+                or_(
+                    SEARCH_DOCUMENT.op("@@")(ts_query),
+                    Recipe.name.op("%")(query),
+                )
+            )
+        )
+        page_query = (
+            matches.add_columns(rank.label("rank"))
+            .order_by(literal_column("rank").desc(), Recipe.id)
+            .limit(limit)
+            .offset(offset)
+        )
+        count_query = select(func.count()).select_from(matches.subquery())
+
+        result = await session.execute(page_query)
+        result_count = await session.execute(count_query)
+        return [row.id for row in result.all()], result_count.scalar()
+
+    async def _search_index(self, query: str, limit: int, offset: int, allowed):
+        index = await search_index.get_index()
+        ranked = [recipe_id for recipe_id, _ in index.search(query)]
+
+        allowed_ids = set()
+        for start in range(0, len(ranked), FILTER_WINDOW):
+            result = await session.execute(
+                select(Recipe.id)
+                .where(Recipe.id.in_(ranked[start : start + FILTER_WINDOW]))
+                .where(Recipe.id.in_(allowed))
+            )
+            allowed_ids.update(result.scalars().all())
+
+        recipe_ids = [recipe_id for recipe_id in ranked if recipe_id in allowed_ids]
+        return recipe_ids[offset : offset + limit], len(recipe_ids)
@@ -58,5 +58,18 @@ class CreateRecipeSchema(BaseModel):
     )
 
 
+class ImportRecipeErrorSchema(BaseModel):
+    line: int = Field(..., description="Line number of the record, starting at 1")
+    error: str = Field(..., description="Why the record was not imported")
+
+
+class ImportRecipesResponseSchema(BaseModel):
+    imported: int = Field(..., description="Amount of imported recipes")
+    recipe_ids: List[int] = Field(..., description="IDs of the imported recipes")
+    errors: List[ImportRecipeErrorSchema] = Field(
+        ..., description="Records that were not imported"
+    )
+
+
 class JudgeRecipeSchema(BaseModel):
     like: bool = Field(..., description="Like / Dislike")
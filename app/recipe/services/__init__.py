@@ -3,3 +3,6 @@ Import all recipe services.
 """
 
 from .recipe import *
+from .recipe_document import RecipeDocumentService
+from .recipe_import import RecipeImportService
+from .recipe_export import RecipeExportService, RECIPE_EXPORT_FIELDS
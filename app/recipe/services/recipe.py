@@ -1,10 +1,13 @@
 """Recipe service module."""
 
-from typing import List, Dict
-from app.group.repository.group import GroupRepository
+from typing import Dict, Iterable, List
+from sqlalchemy.orm.attributes import set_committed_value
 from core.db.models import RecipeIngredient, Recipe, RecipeTag, User
 from core.db import Transactional
+from core.db.enums import CatalogEnum
 from core.exceptions.base import UnauthorizedException
+from core.repository.catalog_version import CatalogVersionRepository
+from app.filter.services.group_filter import GroupFilterService
 from app.ingredient.repository.ingredient import IngredientRepository
 from app.tag.repository.tag import TagRepository
 from app.tag.schemas import CreateTagSchema
@@ -13,7 +16,6 @@ from app.recipe.schemas import CreateRecipeSchema, CreateRecipeIngredientSchema
 from app.recipe.repository.recipe import RecipeRepository
 from app.image.repository.image import ImageRepository
 from app.image.exceptions.image import FileNotFoundException
-from app.user.exceptions.user import UserNotFoundException
 from app.user.services.user import UserService
 
 
@@ -39,6 +41,8 @@ class RecipeService:
         Get a list of recipes.
     get_recipe_by_id(recipe_id)
         Get a recipe by id.
+    get_recipes_by_ids(recipe_ids)
+        Get several recipes by id.
     judge_recipe(recipe_id, user_id, like)
         Like a recipe.
     create_recipe(recipe, user_id)
@@ -51,7 +55,8 @@ class RecipeService:
         self.image_repo = ImageRepository()
         self.recipe_repo = RecipeRepository()
         self.user_serv = UserService()
-        self.group_repo = GroupRepository()
+        self.group_filter_serv = GroupFilterService()
+        self.version_repo = CatalogVersionRepository()
 
     async def get(self, limit: int = None, offset: int = None):
         return await self.recipe_repo.get(limit, offset)
@@ -77,19 +82,27 @@ class RecipeService:
         limit: int = None,
         offset: int = None,
     ):
-        group = await self.group_repo.get_by_id(group_id)
+        """Get the recipes that pass the filters of all members of a group.
 
-        user_tags = [
-            await self.recipe_repo.get_user_tags(member.user_id)
-            for member in group.users
-        ]
-        user_tags = [item for sublist in user_tags for item in sublist]
+        Parameters
+        ----------
+        group_id : int
+            The id of the group.
+        limit : int, optional
+            Maximum amount of recipes.
+        offset : int, optional
+            Amount of recipes to skip.
 
-        recipes = await self.recipe_repo.get_custom_filtered(
-            user_tags, limit, offset
-        )
+        Returns
+        -------
+        List[Recipe]
+            The recipes, without relationships loaded.
+        """
+        group_filter = await self.group_filter_serv.get_group_filter(group_id)
 
-        return recipes
+        return await self.recipe_repo.get_group_filtered(
+            list(group_filter.allergen_tag_ids), group_filter.diet, limit, offset
+        )
 
     async def get_recipe_by_id(self, recipe_id: int) -> Recipe:
         """Get a recipe by id.
@@ -115,6 +128,26 @@ class RecipeService:
 
         return recipe
 
+    async def get_recipes_by_ids(self, recipe_ids: Iterable[int]) -> Dict[int, Recipe]:
+        """Get several recipes by id in a single query.
+
+        Parameters
+        ----------
+        recipe_ids : Iterable[int]
+            The ids of the recipes to get.
+
+        Returns
+        -------
+        Dict[int, Recipe]
+            The recipes that exist, by id.
+        """
+        recipe_ids = list(recipe_ids)
+        if not recipe_ids:
+            return {}
+
+        recipes = await self.recipe_repo.get_by_ids(recipe_ids)
+        return {recipe.id: recipe for recipe in recipes}
+
     @Transactional()
     async def judge_recipe(self, recipe_id: int, user_id: int, like: bool) -> None:
         """Like a recipe.
@@ -127,24 +160,26 @@ class RecipeService:
             The id of the user who likes the recipe.
         like : bool
             True if the user likes the recipe, False if the user dislikes the recipe.
-        """
-        recipe = await self.recipe_repo.get_by_id(recipe_id)
-        if not recipe:
-            raise RecipeNotFoundException
-
-        try:
-            await self.user_serv.get_by_id(user_id)
-        except UserNotFoundException as exc:
-            raise UserNotFoundException() from exc
 
+        Raises
+        ------
+        RecipeNotFoundException
+            If the recipe with the given id does not exist.
+        UserNotFoundException
+            If the user with the given id does not exist.
+        """
         await self.recipe_repo.judge(recipe_id, user_id, like)
 
         return "Ok"
 
     @Transactional()
-    async def create_recipe(self, recipe: CreateRecipeSchema, user_id: int) -> int:
+    async def create_recipe(self, recipe: CreateRecipeSchema, user_id: int) -> Recipe:
         """Create a recipe.
 
+        The returned recipe has all relationships of a fetched recipe set from
+        the objects loaded while creating it, so it doesn't need to be fetched
+        again.
+
         Parameters
         ----------
         recipe : CreatorCreateRecipeRequestSchema
@@ -152,8 +187,8 @@ class RecipeService:
 
         Returns
         -------
-        int
-            The id of the created recipe.
+        Recipe
+            The created recipe.
         Raises
         ------
         FileNotFoundException
@@ -165,12 +200,16 @@ class RecipeService:
         image = await self.image_repo.get_by_name(recipe.filename)
         if not image:
             raise FileNotFoundException()
-        await self.user_serv.get_by_id(user_id)
+        creator = await self.user_serv.get_by_id(user_id)
         db_recipe = await self.create_recipe_object(recipe, user_id)
+        db_recipe.creator = creator
+        set_committed_value(db_recipe, "image", image)
         await self.set_ingredients_of_recipe(db_recipe, recipe.ingredients)
         await self.set_tags_of_recipe(db_recipe, recipe.tags)
 
-        return await self.recipe_repo.create(db_recipe)
+        await self.recipe_repo.create(db_recipe)
+        await self.version_repo.bump(CatalogEnum.RECIPES)
+        return db_recipe
 
     async def create_recipe_object(
         self, recipe: CreateRecipeSchema, user_id: int
@@ -215,22 +254,20 @@ class RecipeService:
         IngredientNotFoundException
             If one of the ingredients does not exist.
         """
-        recipe_ingredients = []
-        for ingredient in ingredients:
-            ingredient_object = await self.ingredient_repo.get_by_name(ingredient.name)
-            if not ingredient_object:
-                ingredient_object = await self.ingredient_repo.create_by_name(
-                    ingredient.name
-                )
-            recipe_ingredients.append(
-                RecipeIngredient(
-                    ingredient=ingredient_object,
-                    amount=ingredient.amount,
-                    unit=ingredient.unit,
-                    recipe=recipe,
-                )
+        ingredient_objects, created = await self.ingredient_repo.get_or_create_by_names(
+            {ingredient.name for ingredient in ingredients}
+        )
+        if created:
+            await self.version_repo.bump(CatalogEnum.INGREDIENTS)
+
+        recipe.ingredients = [
+            RecipeIngredient(
+                ingredient=ingredient_objects[ingredient.name],
+                amount=ingredient.amount,
+                unit=ingredient.unit,
             )
-            recipe.ingredients = recipe_ingredients
+            for ingredient in ingredients
+        ]
 
     async def set_tags_of_recipe(
         self, recipe: Recipe, tags: List[CreateTagSchema]
@@ -244,14 +281,13 @@ class RecipeService:
         tags : List[int]
             A list of tag ids.
         """
-        recipe_tags = []
-        for tag in tags:
-            tag_object = await self.tag_repo.get_by_name(tag.name)
-            if not tag_object:
-                tag_object = await self.tag_repo.create_tag(tag.name, tag.tag_type)
-            recipe_tags.append(RecipeTag(tag=tag_object, recipe=recipe))
+        tag_objects, created = await self.tag_repo.get_or_create_by_names(
+            {tag.name: tag.tag_type for tag in tags}
+        )
+        if created:
+            await self.version_repo.bump(CatalogEnum.TAGS)
 
-        recipe.tags = recipe_tags
+        recipe.tags = [RecipeTag(tag=tag_objects[tag.name]) for tag in tags]
 
     @Transactional()
     async def delete_recipe(self, recipe_id: int, user: User):
@@ -275,4 +311,5 @@ class RecipeService:
         if recipe.creator_id != user.id and not user.is_admin:
             raise UnauthorizedException()
         await self.recipe_repo.delete(recipe)
+        await self.version_repo.bump(CatalogEnum.RECIPES)
         return "Ok"
@@ -0,0 +1,237 @@
+"""Recipe document service module.
+
+A recipe response is only a function of the recipe row, its tags, ingredients,
+image and creator. Instead of validating all of that through pydantic on every
+request, the JSON is rendered once per content version of a recipe and served
+as raw bytes afterwards.
+"""
+
+from typing import List
+import orjson
+from app.recipe.exceptions.recipe import RecipeNotFoundException
+from app.recipe.repository.recipe import RecipeRepository
+from app.recipe.repository.recipe_search import RecipeSearchRepository
+from app.recipe.schemas.recipe import GetFullRecipeResponseSchema
+from core.config import config
+from core.db.models import Recipe, User
+from core.helpers.cache import LRUCache
+
+# recipe id -> (content version, rendered document)
+documents = LRUCache(maxsize=config.RECIPE_DOCUMENT_CACHE_SIZE)
+
+
+def render_recipe(recipe: Recipe) -> bytes:
+    """Render the JSON document of a fully loaded recipe.
+
+    Parameters
+    ----------
+    recipe : Recipe
+        The recipe, with all relationships of ``RecipeRepository.query_options``
+        loaded.
+
+    Returns
+    -------
+    bytes
+        The recipe as a ``GetFullRecipeResponseSchema`` JSON document.
+    """
+    return orjson.dumps(GetFullRecipeResponseSchema.from_orm(recipe).dict())
+
+
+def join_documents(recipe_documents: List[bytes]) -> bytes:
+    """Join rendered documents into a JSON array."""
+    return b"[" + b",".join(recipe_documents) + b"]"
+
+
+class RecipeDocumentService:
+    """Serve recipes as pre-serialized JSON documents.
+
+    Attributes
+    ----------
+    recipe_repo : RecipeRepository
+        The recipe repository.
+
+    Methods
+    -------
+    get_documents(recipe_ids)
+        Get the documents of multiple recipes.
+    get_version(recipe_id)
+        Get the content version of a recipe.
+    get_document(recipe_id, version)
+        Get the document of a recipe.
+    get_paginated_documents(limit, offset, user)
+        Get a page of filtered recipe documents.
+    search_documents(query, limit, offset, user)
+        Get a page of recipe documents ranked by relevance.
+    """
+
+    def __init__(self):
+        self.recipe_repo = RecipeRepository()
+        self.search_repo = RecipeSearchRepository()
+
+    async def get_documents(self, recipe_ids: List[int]) -> List[bytes]:
+        """Get the documents of multiple recipes.
+
+        Only the ids and versions are queried for documents that are already
+        rendered; the remaining recipes are loaded and rendered in one query.
+
+        Parameters
+        ----------
+        recipe_ids : List[int]
+            The ids of the recipes, in the order the documents should be
+            returned in.
+
+        Returns
+        -------
+        List[bytes]
+            The documents of the recipes that exist.
+        """
+        if not recipe_ids:
+            return []
+
+        versions = await self.recipe_repo.get_versions(recipe_ids)
+        return await self._get_versioned_documents(recipe_ids, versions)
+
+    async def _get_versioned_documents(
+        self, recipe_ids: List[int], versions: dict
+    ) -> List[bytes]:
+        rendered = {}
+        stale = []
+        for recipe_id, version in versions.items():
+            cached = documents.get(recipe_id)
+            if cached and cached[0] == version:
+                rendered[recipe_id] = cached[1]
+            else:
+                stale.append(recipe_id)
+
+        if stale:
+            for recipe in await self.recipe_repo.get_by_ids(stale):
+                document = render_recipe(recipe)
+                documents.set(recipe.id, (recipe.version, document))
+                rendered[recipe.id] = document
+
+        return [rendered[recipe_id] for recipe_id in recipe_ids if recipe_id in rendered]
+
+    async def get_version(self, recipe_id: int) -> int:
+        """Get the content version of a recipe.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The id of the recipe.
+
+        Returns
+        -------
+        int
+            The content version.
+
+        Raises
+        ------
+        RecipeNotFoundException
+            If the recipe with the given id does not exist.
+        """
+        versions = await self.recipe_repo.get_versions([recipe_id])
+        if recipe_id not in versions:
+            raise RecipeNotFoundException()
+
+        return versions[recipe_id]
+
+    async def get_document(self, recipe_id: int, version: int = None) -> bytes:
+        """Get the document of a recipe.
+
+        Parameters
+        ----------
+        recipe_id : int
+            The id of the recipe.
+        version : int, optional
+            The content version, when already known to the caller.
+
+        Returns
+        -------
+        bytes
+            The recipe document.
+
+        Raises
+        ------
+        RecipeNotFoundException
+            If the recipe with the given id does not exist.
+        """
+        if version is None:
+            result = await self.get_documents([recipe_id])
+        else:
+            result = await self._get_versioned_documents(
+                [recipe_id], {recipe_id: version}
+            )
+
+        if not result:
+            raise RecipeNotFoundException()
+
+        return result[0]
+
+    async def get_paginated_documents(
+        self, limit: int, offset: int, user: User = None
+    ) -> bytes:
+        """Get a page of recipes, filtered for the user, as one document.
+
+        Parameters
+        ----------
+        limit : int
+            Maximum amount of recipes in the page.
+        offset : int
+            Amount of recipes to skip.
+        user : User, optional
+            The user whose filters should be applied.
+
+        Returns
+        -------
+        bytes
+            A ``GetFullRecipePaginatedResponseSchema`` JSON document.
+        """
+        page, total_count = await self.recipe_repo.get_filtered_versions(
+            limit, offset, user.id if user else None
+        )
+        recipe_ids = [recipe_id for recipe_id, _ in page]
+        recipe_documents = await self._get_versioned_documents(
+            recipe_ids, dict(page)
+        )
+
+        return (
+            b'{"total_count":'
+            + str(total_count).encode()
+            + b',"recipes":'
+            + join_documents(recipe_documents)
+            + b"}"
+        )
+
+    async def search_documents(
+        self, query: str, limit: int, offset: int, user: User = None
+    ) -> bytes:
+        """Search recipes, filtered for the user, most relevant first.
+
+        Parameters
+        ----------
+        query : str
+            Free text query matched against names and descriptions.
+        limit : int
+            Maximum amount of recipes in the page.
+        offset : int
+            Amount of recipes to skip.
+        user : User, optional
+            The user whose filters should be applied.
+
+        Returns
+        -------
+        bytes
+            A ``GetFullRecipePaginatedResponseSchema`` JSON document.
+        """
+        recipe_ids, total_count = await self.search_repo.search(
+            query, limit, offset, user.id if user else None
+        )
+        recipe_documents = await self.get_documents(recipe_ids)
+
+        return (
+            b'{"total_count":'
+            + str(total_count).encode()
+            + b',"recipes":'
+            + join_documents(recipe_documents)
+            + b"}"
+        )
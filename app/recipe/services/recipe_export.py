@@ -0,0 +1,92 @@
+"""Recipe export service module.
+
+Exports every recipe with its tags and ingredients as NDJSON or CSV. The
+records have the shape of ``CreateRecipeSchema`` plus the generated fields,
+so an NDJSON export can be imported again.
+"""
+
+from typing import AsyncIterator
+from app.recipe.repository.recipe import RecipeRepository
+from core.config import config
+from core.db.models import Recipe
+
+RECIPE_EXPORT_FIELDS = [
+    "id",
+    "name",
+    "description",
+    "filename",
+    "preparation_time",
+    "spiciness",
+    "creator_id",
+    "likes",
+    "dislikes",
+    "instructions",
+    "materials",
+    "tags",
+    "ingredients",
+]
+
+
+def recipe_row(recipe: Recipe) -> dict:
+    """Flatten a recipe with its tags and ingredients into an export row."""
+    return {
+        "id": recipe.id,
+        "name": recipe.name,
+        "description": recipe.description,
+        "filename": recipe.filename,
+        "preparation_time": recipe.preparation_time,
+        "spiciness": recipe.spiciness,
+        "creator_id": recipe.creator_id,
+        "likes": recipe.likes,
+        "dislikes": recipe.dislikes,
+        "instructions": recipe.instructions,
+        "materials": recipe.materials,
+        "tags": [
+            {"name": tag.tag.name, "tag_type": tag.tag.tag_type.value}
+            for tag in recipe.tags
+        ],
+        "ingredients": [
+            {
+                "name": ingredient.ingredient.name,
+                "amount": ingredient.amount,
+                "unit": ingredient.unit,
+            }
+            for ingredient in recipe.ingredients
+        ],
+    }
+
+
+class RecipeExportService:
+    """Stream all recipes for exports.
+
+    Attributes
+    ----------
+    recipe_repo : RecipeRepository
+        The recipe repository.
+
+    Methods
+    -------
+    get_rows(batch_size)
+        Stream the export rows of all recipes.
+    """
+
+    def __init__(self):
+        self.recipe_repo = RecipeRepository()
+
+    async def get_rows(
+        self, batch_size: int = config.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[dict]:
+        """Stream the export rows of all recipes.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The amount of recipes fetched from the database at once.
+
+        Yields
+        ------
+        dict
+            A row with the fields of ``RECIPE_EXPORT_FIELDS``.
+        """
+        async for recipe in self.recipe_repo.stream_all(batch_size):
+            yield recipe_row(recipe)
@@ -0,0 +1,290 @@
+"""Recipe import service module.
+
+Imports recipes from newline delimited JSON, one ``CreateRecipeSchema`` per
+line. Records are handled in chunks: all ingredient and tag names of a chunk
+are resolved at once and the recipes are inserted in bulk. Records that can't
+be imported are reported by line number without aborting the import.
+"""
+
+from typing import AsyncIterable, Dict, List, Tuple
+from pydantic import ValidationError
+from sqlalchemy.exc import SQLAlchemyError
+from app.image.repository.image import ImageRepository
+from app.ingredient.repository.ingredient import IngredientRepository
+from app.recipe.repository.recipe import RecipeRepository
+from app.recipe.schemas import CreateRecipeSchema
+from app.tag.repository.tag import TagRepository
+from app.user.exceptions.user import UserNotFoundException
+from app.user.repository.user import UserRepository
+from core.config import config
+from core.db import Transactional, session
+from core.db.enums import CatalogEnum
+from core.db.models import Recipe
+from core.helpers.ndjson import iter_lines
+from core.repository.catalog_version import CatalogVersionRepository
+
+
+def format_validation_error(exc: ValidationError) -> str:
+    """Summarize a validation error on one line."""
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+class RecipeImportService:
+    """Bulk import of recipes.
+
+    Attributes
+    ----------
+    recipe_repo : RecipeRepository
+        The recipe repository.
+    ingredient_repo : IngredientRepository
+        The ingredient repository.
+    tag_repo : TagRepository
+        The tag repository.
+    image_repo : ImageRepository
+        The image repository.
+    user_repo : UserRepository
+        The user repository.
+    version_repo : CatalogVersionRepository
+        The catalog version repository.
+
+    Methods
+    -------
+    import_ndjson(chunks, user_id, chunk_size)
+        Import a stream of NDJSON recipes.
+    import_chunk(records, user_id)
+        Import parsed recipes.
+    """
+
+    def __init__(self):
+        self.recipe_repo = RecipeRepository()
+        self.ingredient_repo = IngredientRepository()
+        self.tag_repo = TagRepository()
+        self.image_repo = ImageRepository()
+        self.user_repo = UserRepository()
+        self.version_repo = CatalogVersionRepository()
+
+    async def import_ndjson(
+        self,
+        chunks: AsyncIterable[bytes],
+        user_id: int,
+        chunk_size: int = config.RECIPE_IMPORT_CHUNK_SIZE,
+    ) -> dict:
+        """Import a stream of NDJSON recipes.
+
+        Every chunk of records is committed on its own, so a large import
+        doesn't hold one long transaction.
+
+        Parameters
+        ----------
+        chunks : AsyncIterable[bytes]
+            The NDJSON stream, split at arbitrary positions.
+        user_id : int
+            The id of the creator of the recipes.
+        chunk_size : int, optional
+            The amount of records inserted at once.
+
+        Returns
+        -------
+        dict
+            An ``ImportRecipesResponseSchema``.
+
+        Raises
+        ------
+        UserNotFoundException
+            If the creator does not exist.
+        """
+        if not await self.user_repo.get_by_id(user_id):
+            raise UserNotFoundException()
+
+        recipe_ids = []
+        errors = []
+        records = []
+
+        line_number = 0
+        async for line in iter_lines(chunks):
+            line_number += 1
+            if not line.strip():
+                continue
+
+            try:
+                records.append((line_number, CreateRecipeSchema.parse_raw(line)))
+            except ValidationError as exc:
+                errors.append(
+                    {"line": line_number, "error": format_validation_error(exc)}
+                )
+
+            if len(records) >= chunk_size:
+                chunk_ids, chunk_errors = await self.import_chunk(records, user_id)
+                recipe_ids += chunk_ids
+                errors += chunk_errors
+                records = []
+
+        if records:
+            chunk_ids, chunk_errors = await self.import_chunk(records, user_id)
+            recipe_ids += chunk_ids
+            errors += chunk_errors
+
+        errors.sort(key=lambda error: error["line"])
+        return {"imported": len(recipe_ids), "recipe_ids": recipe_ids, "errors": errors}
+
+    async def import_chunk(
+        self, records: List[Tuple[int, CreateRecipeSchema]], user_id: int
+    ) -> Tuple[List[int], List[dict]]:
+        """Import parsed recipes.
+
+        Missing ingredients and tags are committed first, then the recipes of
+        the chunk in one transaction. Should that fail, the recipes are
+        retried one transaction each to find the records at fault.
+
+        Parameters
+        ----------
+        records : List[Tuple[int, CreateRecipeSchema]]
+            The recipes with their line numbers.
+        user_id : int
+            The id of the creator of the recipes.
+
+        Returns
+        -------
+        Tuple[List[int], List[dict]]
+            The ids of the imported recipes and the errors of the rest.
+        """
+        errors = []
+        existing_files = await self.image_repo.get_existing_names(
+            {recipe.filename for _, recipe in records}
+        )
+
+        valid = []
+        for line, recipe in records:
+            error = self.check_record(recipe, existing_files)
+            if error:
+                errors.append({"line": line, "error": error})
+            else:
+                valid.append((line, recipe))
+
+        if not valid:
+            return [], errors
+
+        ingredient_ids, tag_ids = await self.resolve_catalog(valid)
+
+        try:
+            recipe_ids = await self.insert_records(
+                valid, user_id, ingredient_ids, tag_ids
+            )
+            await session.commit()
+        except SQLAlchemyError:
+            await session.rollback()
+
+            recipe_ids = []
+            for line, recipe in valid:
+                try:
+                    recipe_ids += await self.insert_records(
+                        [(line, recipe)], user_id, ingredient_ids, tag_ids
+                    )
+                    await session.commit()
+                except SQLAlchemyError as exc:
+                    await session.rollback()
+                    errors.append(
+                        {
+                            "line": line,
+                            "error": f"Could not be stored: {getattr(exc, 'orig', exc)}",
+                        }
+                    )
+
+        if recipe_ids:
+            # Once the recipes are committed, so the search index can't be
+            # rebuilt without them under the new version.
+            await self.bump_recipes()
+
+        return recipe_ids, errors
+
+    @Transactional()
+    async def bump_recipes(self) -> None:
+        """Mark the recipes as changed, for the search index."""
+        await self.version_repo.bump(CatalogEnum.RECIPES)
+
+    @Transactional()
+    async def resolve_catalog(
+        self, records: List[Tuple[int, CreateRecipeSchema]]
+    ) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Get the ids of all ingredients and tags of the records, creating
+        the missing ones."""
+        ingredients, ingredients_created = (
+            await self.ingredient_repo.get_or_create_by_names(
+                {
+                    ingredient.name
+                    for _, recipe in records
+                    for ingredient in recipe.ingredients
+                }
+            )
+        )
+        tags, tags_created = await self.tag_repo.get_or_create_by_names(
+            {tag.name: tag.tag_type for _, recipe in records for tag in recipe.tags}
+        )
+
+        if ingredients_created:
+            await self.version_repo.bump(CatalogEnum.INGREDIENTS)
+        if tags_created:
+            await self.version_repo.bump(CatalogEnum.TAGS)
+
+        return (
+            {name: ingredient.id for name, ingredient in ingredients.items()},
+            {name: tag.id for name, tag in tags.items()},
+        )
+
+    @staticmethod
+    def check_record(recipe: CreateRecipeSchema, existing_files: set) -> str | None:
+        """Get why a record can't be imported, or ``None`` if it can."""
+        if recipe.filename not in existing_files:
+            return "Image file does not exist"
+
+        ingredient_names = [ingredient.name for ingredient in recipe.ingredients]
+        if len(set(ingredient_names)) != len(ingredient_names):
+            return "Duplicate ingredient"
+
+        tag_names = [tag.name for tag in recipe.tags]
+        if len(set(tag_names)) != len(tag_names):
+            return "Duplicate tag"
+
+        return None
+
+    async def insert_records(
+        self,
+        records: List[Tuple[int, CreateRecipeSchema]],
+        user_id: int,
+        ingredient_ids: Dict[str, int],
+        tag_ids: Dict[str, int],
+    ) -> List[int]:
+        """Insert checked records with their ingredients and tags."""
+        recipes = [
+            Recipe(
+                name=recipe.name,
+                filename=recipe.filename,
+                description=recipe.description,
+                preparation_time=recipe.preparation_time,
+                instructions=recipe.instructions,
+                materials=recipe.materials,
+                spiciness=recipe.spiciness,
+                creator_id=user_id,
+            )
+            for _, recipe in records
+        ]
+        ingredient_rows = [
+            [
+                {
+                    "ingredient_id": ingredient_ids[ingredient.name],
+                    "amount": ingredient.amount,
+                    "unit": ingredient.unit,
+                }
+                for ingredient in recipe.ingredients
+            ]
+            for _, recipe in records
+        ]
+        tag_rows = [
+            [{"tag_id": tag_ids[tag.name]} for tag in recipe.tags]
+            for _, recipe in records
+        ]
+
+        return await self.recipe_repo.create_many(recipes, ingredient_rows, tag_rows)
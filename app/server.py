@@ -12,10 +12,14 @@ from fastapi.responses import JSONResponse, HTMLResponse
 
 from api import router
 from api.home.home import home_router
+from app.ingredient.services.ingredient import ingredient_dictionary
+from app.tag.services.tag import tag_dictionary
 
 from core.config import config
+from core.db import standalone_session
 from core.exceptions import CustomException
 from core.fastapi.dependencies import Logging
+from core.fastapi.dependencies.pagination import NEXT_CURSOR_HEADER
 from core.fastapi.middlewares import (
     AuthenticationMiddleware,
     AuthBackend,
@@ -48,6 +52,7 @@ def init_listeners(app_: FastAPI) -> None:
         return JSONResponse(
             status_code=exc.code,
             content={"error_code": exc.error_code, "message": exc.message},
+            headers=getattr(exc, "headers", None),
         )
 
     @app_.exception_handler(Exception)
@@ -94,6 +99,7 @@ def make_middleware() -> list[Middleware]:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[NEXT_CURSOR_HEADER],
         ),
         Middleware(
             AuthenticationMiddleware,
@@ -113,6 +119,18 @@ def init_cache() -> None:
     Cache.init(backend=RedisBackend(), key_maker=CustomKeyMaker())
 
 
+def init_catalog(app_: FastAPI) -> None:
+    """
+    Load the tag and ingredient dictionaries before the first request
+    """
+
+    @app_.on_event("startup")
+    @standalone_session
+    async def load_catalog_dictionaries():
+        await tag_dictionary.refresh()
+        await ingredient_dictionary.refresh()
+
+
 def create_app() -> FastAPI:
     """
     Create app
@@ -142,6 +160,7 @@ def create_app() -> FastAPI:
         dependencies=[Depends(Logging)],
         middleware=make_middleware(),
     )
+    init_catalog(app_=app_)
 
     return app_
 
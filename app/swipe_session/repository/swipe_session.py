@@ -2,10 +2,11 @@
 Class containing crud logic for swipe session
 """
 
-from sqlalchemy import and_, distinct, func, join, select, update
-from sqlalchemy.orm import joinedload
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import and_, delete, distinct, func, select, update
+from sqlalchemy.orm import joinedload, selectinload
 from core.db import session
-from core.db.enums import SwipeSessionEnum
+from core.db.enums import SwipeSessionEnum, SwipeSessionSortEnum
 from core.db.models import (
     GroupMember,
     Recipe,
@@ -13,10 +14,10 @@ from core.db.models import (
     RecipeTag,
     Swipe,
     SwipeSession,
-    Group,
     User,
 )
 from core.repository.base import BaseRepo
+from core.repository.pagination import Page, paginate, sort_keys
 
 
 class SwipeSessionRepository(BaseRepo):
@@ -35,23 +36,58 @@ class SwipeSessionRepository(BaseRepo):
         super().__init__(SwipeSession)
 
     def query_options(self, query):
+        # Swipes in a query of their own, so a listing can be limited per session.
         return query.options(
-            joinedload(SwipeSession.swipes),
-            joinedload(SwipeSession.swipe_match),
+            selectinload(SwipeSession.swipes),
             joinedload(SwipeSession.swipe_match).joinedload(Recipe.image),
+            joinedload(SwipeSession.summary),
         )
 
-    async def get(self):
-        """Retrieve all swipe sessions with their swipes.
+    async def get(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: SwipeSessionSortEnum = SwipeSessionSortEnum.ID,
+        status: SwipeSessionEnum | None = None,
+        group_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> Page:
+        """Retrieve a page of swipe sessions with their swipes.
+
+        Args:
+            cursor (str | None): Cursor of the page, None for the first page.
+            limit (int): Maximum amount of sessions in the page.
+            descending (bool): Whether to sort in descending order.
+            sort (SwipeSessionSortEnum): Column to sort by.
+            status (SwipeSessionEnum | None): Only sessions with this status.
+            group_id (int | None): Only sessions of this group.
+            date_from (date | None): Only sessions on or after this date.
+            date_to (date | None): Only sessions on or before this date.
 
         Returns:
-            list[SwipeSession]: List of `SwipeSession` instances with their `swipes`.
+            Page: The `SwipeSession` instances of the page with their `swipes`,
+            and the cursor of the next page.
         """
         query = select(self.model)
+        if status:
+            query = query.where(self.model.status == status)
+        if group_id:
+            query = query.where(self.model.group_id == group_id)
+        if date_from:
+            query = query.where(
+                self.model.session_date >= datetime.combine(date_from, time.min)
+            )
+        if date_to:
+            query = query.where(
+                self.model.session_date
+                < datetime.combine(date_to + timedelta(days=1), time.min)
+            )
         query = self.query_options(query)
 
-        result = await session.execute(query)
-        return result.unique().scalars().all()
+        columns = sort_keys(getattr(self.model, sort.value), self.model.id)
+        return await paginate(query, columns, cursor, limit, descending)
 
     async def get_by_group(self, group_id) -> list[SwipeSession]:
         """Retrieve all swipe sessions for a group.
@@ -88,37 +124,102 @@ class SwipeSessionRepository(BaseRepo):
         )
         await session.execute(query)
 
-    async def get_matches(self, session_id: int) -> int:
-        """Retrieve recipe IDs that have a match for a swipe session.
+    async def get_swipe_rows(self, session_id: int) -> list:
+        """Retrieve who swiped which recipe in a swipe session.
 
         Args:
             session_id (int): ID of the swipe session.
 
         Returns:
-            int: List of recipe IDs that have a match for the swipe session.
+            list: Rows of (user_id, recipe_id, like).
         """
-        group_size = (
-            select(func.count(distinct(GroupMember.user_id))) # pylint: disable=not-callable
-            .where(GroupMember.group_id == Group.id)
-            .where(SwipeSession.id == session_id)
-            .select_from(join(GroupMember, Group).join(SwipeSession))
-            .scalar_subquery()
+        query = select(Swipe.user_id, Swipe.recipe_id, Swipe.like).where(
+            Swipe.swipe_session_id == session_id
         )
+        result = await session.execute(query)
+        return result.all()
+
+    async def delete_swipes(self, session_id: int) -> None:
+        """Delete all swipes of a swipe session.
+
+        Args:
+            session_id (int): ID of the swipe session.
+        """
+        await session.execute(delete(Swipe).where(Swipe.swipe_session_id == session_id))
+
+    async def get_uncompacted_ids(
+        self, statuses: list[SwipeSessionEnum], limit: int
+    ) -> list[int]:
+        """Retrieve swipe sessions that still have swipes.
+
+        Args:
+            statuses (list[SwipeSessionEnum]): Only sessions with these statuses.
+            limit (int): Maximum amount of IDs.
+
+        Returns:
+            list[int]: IDs of the swipe sessions.
+        """
         query = (
-            select(Swipe.recipe_id)
+            select(self.model.id)
+            .where(
+                and_(
+                    self.model.status.in_(statuses),
+                    select(Swipe.id)
+                    .where(Swipe.swipe_session_id == self.model.id)
+                    .exists(),
+                )
+            )
+            .order_by(self.model.id)
+            .limit(limit)
+        )
+        result = await session.execute(query)
+        return result.scalars().all()
+
+    async def get_matches(self, session_ids: list[int]) -> dict[int, list[int]]:
+        """Retrieve the recipes every member of the group liked, for several
+        swipe sessions at once.
+
+        Args:
+            session_ids (list[int]): IDs of the swipe sessions.
+
+        Returns:
+            dict[int, list[int]]: Recipe IDs liked by all members of the group,
+            by swipe session ID. Sessions without a match are left out.
+        """
+        if not session_ids:
+            return {}
+
+        group_sizes = (
+            select(
+                GroupMember.group_id,
+                func.count(GroupMember.user_id).label("size"), # pylint: disable=not-callable
+            )
+            .where(
+                GroupMember.group_id.in_(
+                    select(SwipeSession.group_id).where(SwipeSession.id.in_(session_ids))
+                )
+            )
+            .group_by(GroupMember.group_id)
+            .subquery()
+        )
+        query = (
+            select(Swipe.swipe_session_id, Swipe.recipe_id)
             .join(SwipeSession, Swipe.swipe_session_id == SwipeSession.id)
-            .join(Group, Group.id == SwipeSession.group_id)
-            .join(GroupMember, GroupMember.group_id == Group.id)
+            .join(group_sizes, group_sizes.c.group_id == SwipeSession.group_id)
             .where(
                 and_(
-                    SwipeSession.id == session_id,
-                    Swipe.like is True,
+                    Swipe.swipe_session_id.in_(session_ids),
+                    Swipe.like.is_(True),
                 )
             )
-            .group_by(Swipe.recipe_id)
+            .group_by(Swipe.swipe_session_id, Swipe.recipe_id, group_sizes.c.size)
             .having(
-                func.count(distinct(Swipe.user_id)) == group_size # noqa pylint: disable=not-callable
+                func.count(distinct(Swipe.user_id)) == group_sizes.c.size # noqa pylint: disable=not-callable
             )
         )
         result = await session.execute(query)
-        return result.scalars().all()
+
+        matches: dict[int, list[int]] = {}
+        for session_id, recipe_id in result:
+            matches.setdefault(session_id, []).append(recipe_id)
+        return matches
@@ -1,11 +1,11 @@
 from datetime import date
-from typing import Any, List
+from typing import Any, Dict, List
 from pydantic import BaseModel
 from app.swipe_session.schemas.recipe import RecipeSchema
 from app.swipe_session.schemas.swipe import SwipeSchema
 
 from core.db.enums import SwipeSessionEnum, SwipeSessionActionEnum
-from core.fastapi.schemas.hashid import DehashId, HashId
+from core.fastapi.schemas.hashid import DehashId, HashId, HashIdList
 
 
 class ActionDocsSchema(BaseModel):
@@ -23,13 +23,24 @@ class UpdateSwipeSessionSchema(BaseModel):
     status: SwipeSessionEnum = None
 
 
+class SwipeSessionSummarySchema(BaseModel):
+    participants: HashIdList
+    likes: Dict[int, int]
+    swipe_count: int
+
+    class Config:
+        orm_mode = True
+
+
 class SwipeSessionSchema(BaseModel):
     id: HashId
     session_date: date
     status: SwipeSessionEnum
     group_id: HashId
+    # Empty once a finished session is compacted into its summary
     swipes: List[SwipeSchema]
     swipe_match: RecipeSchema = None
+    summary: SwipeSessionSummarySchema = None
 
     class Config:
         orm_mode = True
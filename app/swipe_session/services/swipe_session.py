@@ -4,8 +4,7 @@ Class business logic for swipe sessions
 
 from datetime import date, datetime
 import logging
-from typing import List
-from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.recipe.services.recipe import RecipeService
 from app.swipe_session.exceptions.swipe_session import DateTooOldException
@@ -15,13 +14,17 @@ from app.swipe_session.schemas.swipe_session import (
     UpdateSwipeSessionSchema,
 )
 from core.db import Transactional, session
-from core.db.enums import SwipeSessionEnum
-from core.db.models import Recipe, SwipeSession, User
+from core.db.enums import SwipeSessionEnum, SwipeSessionSortEnum
+from core.db.models import Recipe, SwipeSession, SwipeSessionSummary, User
 from core.exceptions.swipe_session import SwipeSessionNotFoundException
 from core.helpers.logger import get_logger
+from core.repository.pagination import Page
 
 from .action_docs import actions
 
+# Statuses after which the swipes of a session are folded into its summary
+FINISHED_STATUSES = [SwipeSessionEnum.COMPLETED, SwipeSessionEnum.CANCELLED]
+
 
 class SwipeSessionService:
     """
@@ -40,25 +43,42 @@ class SwipeSessionService:
         self.repo = SwipeSessionRepository()
         self.recipe_serv = RecipeService()
 
-    async def get_swipe_session_list(self) -> List[SwipeSession]:
+    async def get_swipe_session_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: SwipeSessionSortEnum = SwipeSessionSortEnum.ID,
+        status: SwipeSessionEnum | None = None,
+        group_id: int | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> Page:
         """
-        This method retrieves all swipe sessions from the repository and gets their 
-        associated matches.
+        This method retrieves a page of swipe sessions from the repository, with
+        their swipes and match loaded in batches for the whole page.
+
+        Args:
+            cursor: The cursor of the page, None for the first page.
+            limit: The maximum amount of sessions in the page.
+            descending: Whether to sort in descending order.
+            sort: The column to sort by.
+            status: Only sessions with this status.
+            group_id: Only sessions of this group.
+            date_from: Only sessions on or after this date.
+            date_to: Only sessions on or before this date.
 
         Returns:
-            A list of SwipeSession objects.
+            A Page of SwipeSession objects.
         """
-        swipe_sessions = await self.repo.get()
-
-        for swipe_session in swipe_sessions:
-            swipe_session.matches = await self.get_matches(swipe_session.id)
-
-        return swipe_sessions
+        return await self.repo.get(
+            cursor, limit, descending, sort, status, group_id, date_from, date_to
+        )
 
     async def get_swipe_sessions_by_group(self, group_id: int) -> list[SwipeSession]:
         """
         This method retrieves all swipe sessions associated with a particular group from
-        the repository and gets their associated matches.
+        the repository, with their swipes and match.
 
         Args:
             group_id: An integer representing the ID of the group.
@@ -66,12 +86,7 @@ class SwipeSessionService:
         Returns:
             A list of SwipeSession objects.
         """
-        swipe_sessions = await self.repo.get_by_group(group_id)
-
-        for swipe_session in swipe_sessions:
-            swipe_session.matches = await self.get_matches(swipe_session.id)
-
-        return swipe_sessions
+        return await self.repo.get_by_group(group_id)
 
     async def get_swipe_session_by_id(self, swipe_session_id: int) -> SwipeSession:
         """
@@ -87,7 +102,8 @@ class SwipeSessionService:
         swipe_session = await self.repo.get_by_id(swipe_session_id)
         if not swipe_session:
             raise SwipeSessionNotFoundException
-        swipe_session.matches = await self.get_matches(swipe_session.id)
+        matches = await self.resolve_matches([swipe_session])
+        swipe_session.matches = matches[swipe_session.id]
         return swipe_session
 
     def convert_date(self, session_date) -> datetime:
@@ -128,8 +144,7 @@ class SwipeSessionService:
 
     async def get_matches(self, swipe_session_id: int) -> list[Recipe]:
         """
-        This method retrieves all matches for a particular swipe session from the
-        repository and returns them as a list of Recipe objects.
+        This method retrieves all matches for a particular swipe session.
 
         Args:
             swipe_session_id: An integer representing the ID of the swipe session.
@@ -137,19 +152,63 @@ class SwipeSessionService:
         Returns:
             A list of Recipe objects.
         """
+        swipe_session = await self.repo.get_by_id(swipe_session_id)
+        if not swipe_session:
+            raise SwipeSessionNotFoundException
+        matches = await self.resolve_matches([swipe_session])
+        return matches[swipe_session.id]
 
-        recipe_ids = await self.repo.get_matches(swipe_session_id)
+    async def resolve_matches(
+        self, swipe_sessions: list[SwipeSession]
+    ) -> dict[int, list[Recipe]]:
+        """
+        This method resolves the matches of several swipe sessions at once.
+
+        A session whose match was already recorded in `match_recipe_id` is
+        trusted; the matches of the others are computed in a single query, and
+        all matched recipes are then loaded in a single query.
 
-        if len(recipe_ids) > 1:
-            get_logger("multiple_matches")
-            logging.warning("There should only be one match, not %e", len(recipe_ids))
+        Args:
+            swipe_sessions: The swipe sessions.
+
+        Returns:
+            A dict with the list of matched Recipe objects by swipe session ID.
+        """
+        recipe_ids = await self.repo.get_matches(
+            [
+                swipe_session.id
+                for swipe_session in swipe_sessions
+                if swipe_session.match_recipe_id is None
+            ]
+        )
+        for session_id, ids in recipe_ids.items():
+            if len(ids) > 1:
+                get_logger("multiple_matches")
+                logging.warning(
+                    "There should only be one match in session %d, not %d",
+                    session_id,
+                    len(ids),
+                )
+        for swipe_session in swipe_sessions:
+            if swipe_session.match_recipe_id is not None:
+                recipe_ids[swipe_session.id] = [swipe_session.match_recipe_id]
 
-        return [await self.recipe_serv.get_recipe_by_id(id) for id in recipe_ids]
+        recipes = await self.recipe_serv.get_recipes_by_ids(
+            {recipe_id for ids in recipe_ids.values() for recipe_id in ids}
+        )
+        matches = {}
+        for swipe_session in swipe_sessions:
+            matches[swipe_session.id] = [
+                recipes[recipe_id]
+                for recipe_id in recipe_ids.get(swipe_session.id, [])
+                if recipe_id in recipes
+            ]
+        return matches
 
     @Transactional()
     async def update_swipe_session(
         self, request: UpdateSwipeSessionSchema, group_id=None
-    ) -> int:
+    ) -> SwipeSession:
         """
         Update an existing swipe session.
 
@@ -162,42 +221,77 @@ class SwipeSessionService:
             group_id (int, optional): The ID of the group associated with the session.
 
         Returns:
-            int: The ID of the updated swipe session.
+            SwipeSession: The updated swipe session, with its swipes and match.
 
         Raises:
             SwipeSessionNotFoundException: If the specified swipe session does not 
             exist.
         """
-        swipe_session = await self.get_swipe_session_by_id(request.id)
-
-        if not request.session_date:
-            request.session_date = swipe_session.session_date
-        else:
-            request.session_date = self.convert_date(request.session_date)
+        swipe_session = await self.repo.get_by_id(request.id)
 
         if not swipe_session:
             raise SwipeSessionNotFoundException
 
-        if not request.status:
-            request.status = swipe_session.status
+        if request.session_date:
+            swipe_session.session_date = self.convert_date(request.session_date)
 
-        else:
+        if request.status:
             if request.status == SwipeSessionEnum.IN_PROGRESS and group_id:
                 await self.update_all_in_group_to_paused(group_id)
 
-        query = (
-            update(SwipeSession)
-            .where(SwipeSession.id == request.id)
-            .values(**request.dict())
-        )
-        await session.execute(query)
+            swipe_session.status = request.status
+
+        if swipe_session.status in FINISHED_STATUSES:
+            await self.compact_swipe_session(swipe_session)
+
+        await session.flush()
+
+        return swipe_session
+
+    async def compact_swipe_session(self, swipe_session: SwipeSession) -> None:
+        """
+        Fold the swipes of a finished swipe session into its summary.
+
+        The likes per recipe and the participants are added to the summary and
+        the swipes are deleted, so a finished session is a single row to load.
+        Compacting a session without swipes does nothing.
 
-        return swipe_session.id
+        Args:
+            swipe_session (SwipeSession): The swipe session, with its summary
+            loaded.
+        """
+        rows = await self.repo.get_swipe_rows(swipe_session.id)
+        if not rows:
+            return
+
+        summary = swipe_session.summary or SwipeSessionSummary.empty()
+        summary.add_swipes(rows)
+        swipe_session.summary = summary
+
+        await self.repo.delete_swipes(swipe_session.id)
+        set_committed_value(swipe_session, "swipes", [])
+
+    async def compact_finished_swipe_sessions(self, limit: int) -> int:
+        """
+        Compact finished swipe sessions that still have swipes, e.g. sessions
+        that finished before compaction existed.
+
+        Args:
+            limit (int): Maximum amount of sessions to compact.
+
+        Returns:
+            int: The amount of compacted sessions.
+        """
+        session_ids = await self.repo.get_uncompacted_ids(FINISHED_STATUSES, limit)
+        for session_id in session_ids:
+            await self.compact_swipe_session(await self.repo.get_by_id(session_id))
+        await session.flush()
+        return len(session_ids)
 
     @Transactional()
     async def create_swipe_session(
         self, request: CreateSwipeSessionSchema, user: User, group_id: int = None
-    ) -> int:
+    ) -> SwipeSession:
         """
         Create a new swipe session.
         If another session in the group is active and the new session is set to
@@ -209,7 +303,7 @@ class SwipeSessionService:
             group_id (int): The ID of the group associated with the session.
 
         Returns:
-            int: The ID of the newly created swipe session.
+            SwipeSession: The newly created swipe session.
 
         Raises:
             None
@@ -220,7 +314,11 @@ class SwipeSessionService:
             # pylint: enable=broad-exception-raised
 
         db_swipe_session = SwipeSession(
-            group_id=group_id, **request.dict()
+            group_id=group_id,
+            **request.dict(),
+            swipes=[],
+            swipe_match=None,
+            summary=None,
         )
 
         request.session_date = self.convert_date(request.session_date)
@@ -228,7 +326,8 @@ class SwipeSessionService:
         if request.status == SwipeSessionEnum.IN_PROGRESS and group_id:
             await self.update_all_in_group_to_paused(group_id)
 
-        return await self.repo.create(db_swipe_session)
+        await self.repo.create(db_swipe_session)
+        return db_swipe_session
 
     async def get_swipe_session_actions(self) -> dict:
         """
@@ -7,8 +7,11 @@ from fastapi import WebSocket
 from pydantic import ValidationError
 from app.group.services.group import GroupService
 from app.recipe.exceptions.recipe import RecipeNotFoundException
-from app.recipe.schemas.recipe import GetFullRecipeResponseSchema
 from app.recipe.services.recipe import RecipeService
+from app.recipe.services.recipe_document import (
+    RecipeDocumentService,
+    join_documents,
+)
 from app.swipe.schemas.swipe import CreateSwipeSchema
 from app.swipe.services.swipe import SwipeService
 from app.user.services.user import UserService
@@ -20,6 +23,7 @@ from app.swipe_session.services.swipe_session import SwipeSessionService
 from app.swipe_session_recipe_queue.services.swipe_session_recipe_queue import (
     SwipeSessionRecipeQueueService,
 )
+from core.config import config
 from core.db import session
 from core.exceptions.websocket import (
     AlreadySwipedException,
@@ -30,19 +34,20 @@ from core.exceptions.websocket import (
 from core.db.enums import SwipeSessionActionEnum, SwipeSessionEnum
 from core.db.models import SwipeSession, User
 from core.exceptions.base import UnauthorizedException
-from core.helpers.hashid import decode_single
+from core.helpers.rate_limit import RateLimit
 from core.helpers.websocket.auth import (
+    HandshakeContext,
     IsActiveSession,
     IsAuthenticated,
     IsSessionMember,
+    IsValidSessionId,
 )
 from core.helpers.websocket.base import BaseWebsocketService
 from core.helpers.websocket.manager import WebsocketConnectionManager
-from core.utils.token_helper import TokenHelper
 
 
 manager = WebsocketConnectionManager(
-    [[IsAuthenticated, IsSessionMember, IsActiveSession]]
+    [[IsAuthenticated, IsValidSessionId, IsSessionMember, IsActiveSession]]
 )
 
 
@@ -93,6 +98,7 @@ class SwipeSessionWebsocketService(BaseWebsocketService):
         self.swipe_session_serv = SwipeSessionService()
         self.swipe_serv = SwipeService()
         self.recipe_serv = RecipeService()
+        self.recipe_document_serv = RecipeDocumentService()
         self.queue_serv = SwipeSessionRecipeQueueService()
         self.user_serv = UserService()
 
@@ -104,10 +110,20 @@ class SwipeSessionWebsocketService(BaseWebsocketService):
             SwipeSessionActionEnum.GET_RECIPES: self.handle_get_recipes,
         }
 
+        rate_limits = {
+            SwipeSessionActionEnum.RECIPE_SWIPE: RateLimit(
+                "swipe_session_recipe_swipe", config.RATE_LIMIT_RECIPE_SWIPE
+            ),
+            SwipeSessionActionEnum.GET_RECIPES: RateLimit(
+                "swipe_session_get_recipes", config.RATE_LIMIT_GET_RECIPES
+            ),
+        }
+
         super().__init__(
             manager=manager,
             actions=actions,
             schema=SwipeSessionPacketSchema,
+            rate_limits=rate_limits,
         )
 
     async def handler(
@@ -126,27 +142,21 @@ class SwipeSessionWebsocketService(BaseWebsocketService):
         Returns:
             Coroutine[Any, Any, None]: The handler loop.
         """
-        exc = await self.manager.check_auth(
-            access_token=access_token, swipe_session_id=swipe_session_id
-        )
+        context = HandshakeContext(access_token, swipe_session_id)
+        exc = await self.manager.check_auth(context=context)
         if exc:
             await self.manager.deny(websocket, exc)
             return
 
-        decoded_token = TokenHelper.decode(token=access_token)
-        user_id = decode_single(decoded_token.get("user_id"))
-        swipe_session_id = decode_single(swipe_session_id)
-
         # By calling "check_auth" with "IsSessionMember",
         # we already know that these exist
-        user = await self.user_serv.get_by_id(user_id)
-        swipe_session = await self.swipe_session_serv.get_swipe_session_by_id(
-            swipe_session_id
-        )
+        user = await context.get_user()
+        swipe_session = await context.get_swipe_session()
 
         return await super().handler(
             websocket=websocket,
             pool_id=swipe_session.id,
+            rate_limit_key=user.id,
             user=user,
             swipe_session=swipe_session,
         )
@@ -177,16 +187,14 @@ class SwipeSessionWebsocketService(BaseWebsocketService):
                 swipe_session.id, user.id, limit
             )
 
-        recipes = []
-        for queue_item in recipe_queue:
-            recipe = await self.recipe_serv.get_recipe_by_id(queue_item["recipe_id"])
-            recipes.append(GetFullRecipeResponseSchema(**recipe.to_dict()))
+        recipes = await self.recipe_document_serv.get_documents(
+            [queue_item["recipe_id"] for queue_item in recipe_queue]
+        )
 
-        packet = SwipeSessionPacketSchema(
-            action=SwipeSessionActionEnum.GET_RECIPES,
-            payload={"recipes": recipes},
+        packet = self.manager.render_packet(
+            SwipeSessionActionEnum.GET_RECIPES, recipes=join_documents(recipes)
         )
-        await self.manager.personal_packet(websocket, packet)
+        await self.manager.personal_raw_packet(websocket, packet)
 
     async def handle_global_message(
         self,
@@ -342,21 +350,21 @@ class SwipeSessionWebsocketService(BaseWebsocketService):
         """Send a recipe match packet to all participants of a swipe session."""
         del kwargs
 
-        recipe = await self.recipe_serv.get_recipe_by_id(recipe_id)
-        if not recipe:
+        try:
+            recipe = await self.recipe_document_serv.get_document(recipe_id)
+        except RecipeNotFoundException:
             await self.manager.handle_connection_code(
                 websocket, RecipeNotFoundException
             )
             return
 
-        swipe_session.swipe_match = recipe
+        swipe_session.match_recipe_id = recipe_id
         await session.commit()
 
-        full_recipe = GetFullRecipeResponseSchema(**recipe.to_dict())
-
-        payload = {"message": "A match has been found", "recipe": full_recipe}
-        packet = SwipeSessionPacketSchema(
-            action=SwipeSessionActionEnum.RECIPE_MATCH, payload=payload
+        packet = self.manager.render_packet(
+            SwipeSessionActionEnum.RECIPE_MATCH,
+            {"message": "A match has been found"},
+            recipe=recipe,
         )
 
-        await self.manager.pool_broadcast(swipe_session.id, packet)
+        await self.manager.pool_broadcast_raw(swipe_session.id, packet)
@@ -2,10 +2,11 @@
 The module contains a repository class that defines database operations for tags. 
 """
 
-from typing import List
-from sqlalchemy import select
+from typing import AsyncIterator, Dict, List, Tuple
+from sqlalchemy import Row, select
 from core.db import session
 from core.db.models import Tag
+from core.db.upsert import insert_ignore
 from core.repository.base import BaseRepo
 
 
@@ -35,6 +36,87 @@ class TagRepository(BaseRepo):
         await session.flush()
         return db_tag
 
+    async def get_or_create_by_names(
+        self, tag_types: Dict[str, str]
+    ) -> Tuple[Dict[str, Tag], bool]:
+        """
+        Returns tags by name, creating the missing ones.
+
+        Parameters
+        ----------
+        tag_types : Dict[str, str]
+            The tag type of every tag name, used for tags that are created.
+
+        Returns
+        -------
+        tags : Dict[str, Tag]
+            The tags by name.
+        created : bool
+            Whether any tag was created.
+        """
+        if not tag_types:
+            return {}, False
+
+        result = await session.scalars(select(Tag).where(Tag.name.in_(tag_types.keys())))
+        tags = {tag.name: tag for tag in result}
+        missing = tag_types.keys() - tags.keys()
+        if not missing:
+            return tags, False
+
+        result = await session.scalars(
+            insert_ignore(Tag)
+            .values([{"name": name, "tag_type": tag_types[name]} for name in missing])
+            .returning(Tag)
+        )
+        created = {tag.name: tag for tag in result}
+        tags.update(created)
+
+        # Created concurrently by another transaction.
+        if missing - created.keys():
+            result = await session.scalars(
+                select(Tag).where(Tag.name.in_(missing - created.keys()))
+            )
+            tags.update((tag.name, tag) for tag in result)
+
+        return tags, bool(created)
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[dict]:
+        """
+        Streams all tags from a server-side cursor.
+
+        Parameters
+        ----------
+        batch_size : int
+            The amount of tags fetched at once.
+
+        Yields
+        ------
+        row : dict
+            The id, name and tag type of every tag, ordered by id.
+        """
+        query = (
+            select(Tag.id, Tag.name, Tag.tag_type)
+            .order_by(Tag.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await session.stream(query)
+        async for row in result.mappings():
+            yield dict(row)
+
+    async def get_entries(self) -> List[Row]:
+        """
+        Returns the columns of all tags needed for lookups by id or name.
+
+        Returns
+        -------
+        entries : List[Row]
+            The id, name and tag type of every tag, ordered by id.
+        """
+        result = await session.execute(
+            select(Tag.id, Tag.name, Tag.tag_type).order_by(Tag.id)
+        )
+        return result.all()
+
     async def get(self) -> List[Tag]:
         """
         Returns a list of all tags.
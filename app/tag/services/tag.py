@@ -6,10 +6,16 @@ performing tag-related operations like creating a new tag,
 fetching all tags, or fetching a tag by its ID or name.
 """
 
-from typing import List
+from typing import AsyncIterator, List, Tuple
+from sqlalchemy import Row
 from sqlalchemy.exc import IntegrityError
 from core.db.models import Tag
-from core.db import Transactional
+from core.config import config
+from core.db import Transactional, after_commit
+from core.db.enums import CatalogEnum
+from core.helpers.catalog_dictionary import CatalogDictionary
+from core.repository.catalog_version import CatalogVersionRepository
+from app.filter.services.group_filter import GroupFilterService
 from app.tag.schemas import CreateTagSchema
 from app.tag.exceptions.tag import (
     TagAlreadyExistsException,
@@ -17,6 +23,9 @@ from app.tag.exceptions.tag import (
     TagDependecyException,
 )
 from app.tag.repository.tag import TagRepository
+from app.recipe.repository.recipe import RecipeRepository
+
+tag_dictionary = CatalogDictionary(CatalogEnum.TAGS, TagRepository().get_entries)
 
 
 class TagService:
@@ -25,8 +34,14 @@ class TagService:
 
     Methods
     -------
-    get_tags() -> List[Tag]:
+    get_tags() -> List[Row]:
         Returns a list of all tags.
+    autocomplete_tags(query: str, limit: int) -> List[Row]:
+        Returns the tags whose name starts with the query.
+    stream_tags() -> AsyncIterator[dict]:
+        Streams all tags for exports.
+    get_versioned_tags() -> Tuple[int, List[Row]]:
+        Returns all tags and the version of the tag collection.
     create_tag(request: CreateTagSchema) -> int:
         Creates a new tag with the given data and returns the ID of the new tag.
     get_tag_by_id(tag_id: int) -> Tag:
@@ -37,17 +52,73 @@ class TagService:
 
     def __init__(self):
         self.tag_repo = TagRepository()
+        self.recipe_repo = RecipeRepository()
+        self.group_filter_serv = GroupFilterService()
+        self.version_repo = CatalogVersionRepository()
 
-    async def get_tags(self) -> List[Tag]:
+    async def get_tags(self) -> List[Row]:
         """
-        Returns a list of all tags.
+        Returns a list of all tags, from the in-memory tag dictionary.
+
+        Returns
+        -------
+        tags : List[Row]
+            The id, name and tag type of all tags.
+        """
+        return (await tag_dictionary.refresh()).entries()
+
+    async def autocomplete_tags(self, query: str, limit: int) -> List[Row]:
+        """
+        Returns the tags whose name, or a word in it, starts with the query.
+
+        Parameters
+        ----------
+        query : str
+            The start of the tag name.
+        limit : int
+            The maximum amount of tags to return.
+
+        Returns
+        -------
+        tags : List[Row]
+            The id, name and tag type of the matching tags.
+        """
+        return (await tag_dictionary.refresh()).complete(query, limit)
+
+    async def stream_tags(
+        self, batch_size: int = config.EXPORT_BATCH_SIZE
+    ) -> AsyncIterator[dict]:
+        """
+        Streams all tags for exports.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The amount of tags fetched from the database at once.
+
+        Yields
+        ------
+        row : dict
+            The id, name and tag type of a tag.
+        """
+        async for row in self.tag_repo.stream_all(batch_size):
+            yield row | {"tag_type": row["tag_type"].value}
+
+    async def get_versioned_tags(self) -> Tuple[int, List[Row]]:
+        """
+        Returns all tags and the version of the tag collection they were loaded
+        at. The version, bumped on every write, is checked first, so the tags
+        are current.
 
         Returns
         -------
-        tags : List[Tag]
-            A list of all tags.
+        version : int
+            The version of the tag collection.
+        tags : List[Row]
+            The id, name and tag type of all tags.
         """
-        return await self.tag_repo.get()
+        dictionary = await tag_dictionary.refresh(check_version=True)
+        return dictionary.version, dictionary.entries()
 
     @Transactional()
     async def create_tag(self, request: CreateTagSchema) -> Tag:
@@ -73,6 +144,7 @@ class TagService:
         if tag:
             raise TagAlreadyExistsException
 
+        await self.version_repo.bump(CatalogEnum.TAGS)
         return await self.tag_repo.create_tag(request.name, request.tag_type)
 
     async def get_tag_by_id(self, tag_id: int) -> Tag:
@@ -149,6 +221,9 @@ class TagService:
             tag = await self.tag_repo.update(tag, request.name, request.tag_type)
         except IntegrityError as exc:
             raise TagAlreadyExistsException from exc
+        await self.recipe_repo.touch_by_tag(tag_id)
+        await after_commit(self.group_filter_serv.invalidate_all)
+        await self.version_repo.bump(CatalogEnum.TAGS)
         return tag
 
     @Transactional()
@@ -169,6 +244,9 @@ class TagService:
         tag = await self.tag_repo.get_by_id(tag_id)
         if not tag:
             raise TagNotFoundException
+        await self.recipe_repo.touch_by_tag(tag_id)
+        await after_commit(self.group_filter_serv.invalidate_all)
+        await self.version_repo.bump(CatalogEnum.TAGS)
         try:
             await self.tag_repo.delete(tag)
         except AssertionError as exc:
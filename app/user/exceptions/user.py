@@ -36,8 +36,3 @@ class DuplicateUsernameException(CustomException):
     error_code = "USER__DUPLICATE_USERNAME"
     message = "duplicate username"
 
-
-class DuplicateClientTokenException(CustomException):
-    code = 409
-    error_code = "USER__DUPLICATE_CLIENT_TOKEN"
-    message = "duplicate client token"
@@ -2,14 +2,17 @@
 The module contains a repository class that defines database operations for user. 
 """
 
-from typing import List
 import uuid
 from sqlalchemy import select
 from sqlalchemy.orm import joinedload
+from core.db.enums import UserSortEnum
 from core.db.models import AccountAuth, User
 from core.db import session
+from core.db.session import engines
 from core.db.transactional import Transactional
+from core.db.upsert import insert_ignore
 from core.repository.base import BaseRepo
+from core.repository.pagination import Page, paginate, sort_keys
 from core.repository.enum import SynchronizeSessionEnum
 
 
@@ -77,26 +80,71 @@ class UserRepository(BaseRepo):
         user.account_auth = account_auth
         return user
 
-    async def get_by_client_token(self, ctoken: uuid.UUID) -> User:
-        """Retrieve a user by client token.
+    @Transactional()
+    async def set_password(self, user: User, password: str):
+        """Replace the password hash of a user.
+
+        Parameters
+        ----------
+        user : User
+            User instance, with its account authentication loaded.
+        password : str
+            The new password hash.
+
+        Returns
+        -------
+        None
+        """
+        user.account_auth.password = password
+
+    async def get_id_by_client_token(
+        self, ctoken: uuid.UUID, writer: bool = False
+    ) -> int | None:
+        """Retrieve the id of a user by client token, without loading the user.
 
         Parameters
         ----------
         ctoken : uuid.UUID
             Client token for the user.
+        writer : bool, optional
+            Read from the writer, for users created moments ago, by default False
 
         Returns
         -------
-        User
-            User instance.
+        int, optional
+            User id, None if no user has the client token.
         """
-        query = (
-            select(User)
-            .where(User.client_token == ctoken)
+        query = select(User.id).where(User.client_token == ctoken)
+        bind_arguments = {"bind": engines["writer"].sync_engine} if writer else None
+        return await session.scalar(query, bind_arguments=bind_arguments)
+
+    @Transactional()
+    async def get_or_create_by_client_token(
+        self, display_name: str, ctoken: uuid.UUID
+    ) -> int:
+        """Create a user with a client token, unless one already has it.
+
+        Parameters
+        ----------
+        display_name : str
+            Display name for the user, if created.
+        ctoken : uuid.UUID
+            Client token for the user.
+
+        Returns
+        -------
+        int
+            Id of the created or existing user.
+        """
+        user_id = await session.scalar(
+            insert_ignore(User)
+            .values(display_name=display_name, client_token=ctoken)
+            .returning(User.id)
         )
-        query = self.query_options(query)
-        result = await session.execute(query)
-        return result.scalars().first()
+        if user_id is None:
+            # Created concurrently by another transaction.
+            user_id = await self.get_id_by_client_token(ctoken, writer=True)
+        return user_id
 
     async def get_by_username(self, username: str) -> User:
         """Get user by username.
@@ -142,18 +190,46 @@ class UserRepository(BaseRepo):
         result = await session.execute(query)
         return result.scalars().first()
 
-    async def get_user_list(self) -> List[User]:
-        """Get user list.
+    async def get_user_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: UserSortEnum = UserSortEnum.ID,
+        display_name: str | None = None,
+        is_admin: bool | None = None,
+    ) -> Page:
+        """Get a page of users.
+
+        Parameters
+        ----------
+        cursor : str, optional
+            Cursor of the page, None for the first page.
+        limit : int
+            Maximum amount of users in the page.
+        descending : bool, optional
+            Whether to sort in descending order.
+        sort : UserSortEnum, optional
+            Column to sort by.
+        display_name : str, optional
+            Only users whose display name contains this, case insensitive.
+        is_admin : bool, optional
+            Only admins or only non-admins.
 
         Returns
         -------
-        List[User]
-            User list.
+        Page
+            The users of the page and the cursor of the next page.
         """
         query = select(User)
+        if display_name:
+            query = query.where(User.display_name.icontains(display_name, autoescape=True))
+        if is_admin is not None:
+            query = query.where(User.is_admin.is_(is_admin))
         query = self.query_options(query)
-        result = await session.execute(query)
-        return result.scalars().all()
+
+        columns = sort_keys(getattr(User, sort.value), User.id)
+        return await paginate(query, columns, cursor, limit, descending)
 
     @Transactional()
     async def set_admin(self, user: User, is_admin: bool):
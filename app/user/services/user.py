@@ -2,20 +2,31 @@
 User service module
 """
 
-from typing import List
 import uuid
+from app.filter.services.group_filter import GroupFilterService
+from app.group.repository.membership import MembershipRepository
 from app.image.repository.image import ImageRepository
+from app.recipe.repository.recipe import RecipeRepository
 from app.user.exceptions.user import (
-    DuplicateClientTokenException,
     UserNotFoundException,
     DuplicateUsernameException,
 )
-from app.user.utils import generate_name, get_password_hash
+from app.user.utils import generate_name, hash_password
 from app.user.repository.user import UserRepository
 from app.user.schemas.user import UpdateUserSchema
 from app.image.exceptions.image import FileNotFoundException
+from core.config import config
+from core.db import Transactional, after_commit
+from core.db.enums import UserSortEnum
 from core.db.models import User
 from core.db.session import session
+from core.helpers.cache import LRUCache
+from core.repository.pagination import Page
+
+# client token -> user id
+client_token_ids = LRUCache(
+    maxsize=config.CLIENT_TOKEN_CACHE_SIZE, ttl=config.CLIENT_TOKEN_CACHE_TTL
+)
 
 
 class UserService:
@@ -31,16 +42,44 @@ class UserService:
         """Constructor for the UserService class."""
         self.repo = UserRepository()
         self.image_repo = ImageRepository()
+        self.recipe_repo = RecipeRepository()
+        self.group_filter_serv = GroupFilterService()
+        self.membership_repo = MembershipRepository()
+
+    async def get_user_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        descending: bool = False,
+        sort: UserSortEnum = UserSortEnum.ID,
+        display_name: str | None = None,
+        is_admin: bool | None = None,
+    ) -> Page:
+        """Get a page of the users in the system.
 
-    async def get_user_list(self) -> List[User]:
-        """Get the list of all users in the system.
+        Parameters
+        ----------
+        cursor : str, optional
+            Cursor of the page, None for the first page.
+        limit : int
+            Maximum amount of users in the page.
+        descending : bool, optional
+            Whether to sort in descending order.
+        sort : UserSortEnum, optional
+            Column to sort by.
+        display_name : str, optional
+            Only users whose display name contains this, case insensitive.
+        is_admin : bool, optional
+            Only admins or only non-admins.
 
         Returns
         -------
-        List[User]
-            The list of all users.
+        Page
+            The users of the page and the cursor of the next page.
         """
-        return await self.repo.get_user_list()
+        return await self.repo.get_user_list(
+            cursor, limit, descending, sort, display_name, is_admin
+        )
 
     async def update(self, updated_user: UpdateUserSchema) -> User:
         """
@@ -63,6 +102,8 @@ class UserService:
         ):
             raise FileNotFoundException
 
+        # the creator is embedded in recipe documents
+        await self.recipe_repo.touch_by_creator(updated_user.id)
         await self.repo.update_by_id(model_id=updated_user.id, params=user_dict)
         user = await self.repo.get_by_id(updated_user.id)
         await session.refresh(user)
@@ -108,26 +149,6 @@ class UserService:
         """
         return await self.repo.get_by_display_name(display_name)
 
-    async def get_by_client_token(self, ctoken) -> User:
-        """Get the user with the given client token.
-
-        Parameters
-        ----------
-        ctoken : uuid.UUID
-            The client token of the user.
-
-        Returns
-        -------
-        User
-            The user with the given client token.
-
-        Raises
-        ------
-        UserNotFoundException
-            If the user with the given client token does not exist.
-        """
-        return await self.repo.get_by_client_token(ctoken)
-
     async def get_by_id(self, user_id: int) -> User:
         """Get a user by id.
 
@@ -174,43 +195,50 @@ class UserService:
         user = await self.repo.get_by_display_name(username)
         if user:
             raise DuplicateUsernameException()
-        hashed_pwd = get_password_hash(password)
+        hashed_pwd = await hash_password(password)
 
         user_id = await self.repo.create_user(username, uuid.uuid4())
         await self.repo.create_account_auth(user_id, username, hashed_pwd)
         return user_id
 
-    async def create_user_with_client_token(
-        self, ctoken: uuid.UUID, display_name: str = None
-    ) -> int:
-        """Create a new user with the given client token and display name.
+    async def set_password_hash(self, user: User, hashed_password: str) -> None:
+        """Store a new password hash of an authenticated user.
 
-        If the display name is not provided, it will be generated.
+        Parameters
+        ----------
+        user : User
+            The user, with its account authentication loaded.
+        hashed_password : str
+            The new hash of the password.
+        """
+        await self.repo.set_password(user, hashed_password)
+
+    async def get_id_by_client_token(self, ctoken: uuid.UUID) -> int:
+        """Get the id of the user with a client token, creating the user if new.
+
+        Ids are cached for ``CLIENT_TOKEN_CACHE_TTL`` seconds, 0 disables the
+        cache. The cache is local to the process, other workers may still log in
+        a deleted user until their entry expires.
 
         Parameters
         ----------
         ctoken : uuid.UUID
-            The client token of the new user.
-        display_name : str, optional
-            The display name of the new user, by default None
+            The client token of the user.
 
         Returns
         -------
         int
-            The id of the newly created user.
-
-        Raises
-        ------
-        DuplicateClientTokenException
-            If a user with the given client token already exists.
+            The id of the user.
         """
-        if not display_name:
-            display_name = generate_name()
-
-        if await self.get_by_client_token(ctoken):
-            raise DuplicateClientTokenException
-
-        return await self.repo.create_user(display_name, ctoken)
+        user_id = client_token_ids.get(ctoken)
+        if user_id is None:
+            user_id = await self.repo.get_id_by_client_token(ctoken)
+            if user_id is None:
+                user_id = await self.repo.get_or_create_by_client_token(
+                    generate_name(), ctoken
+                )
+            client_token_ids.set(ctoken, user_id)
+        return user_id
 
     async def set_admin(self, user_id: int, is_admin: bool):
         """Set admin status for a user.
@@ -228,6 +256,7 @@ class UserService:
             If the user with the given id does not exist.
         """
         user = await self.get_by_id(user_id)
+        await self.recipe_repo.touch_by_creator(user_id)
         await self.repo.set_admin(user, is_admin)
 
     async def is_admin(self, user_id: int) -> bool:
@@ -251,9 +280,13 @@ class UserService:
         user = await self.get_by_id(user_id)
         return user.is_admin
 
+    @Transactional()
     async def delete_user(self, user_id) -> None:
         """Delete's a user by given id.
 
+        The judgements of the user leave the like and dislike counters in the
+        same transaction as the user is deleted.
+
         Parameters
         ----------
         user_id : int
@@ -264,7 +297,12 @@ class UserService:
         if not user:
             raise UserNotFoundException
 
+        await self.recipe_repo.forget_judgements(user_id)
+
         if user.account_auth:
-            await self.repo.delete(user.account_auth)
+            await session.delete(user.account_auth)
 
-        await self.repo.delete(user)
+        await session.delete(user)
+        await after_commit(client_token_ids.pop, user.client_token)
+        await after_commit(self.membership_repo.invalidate_user, user_id)
+        await after_commit(self.group_filter_serv.invalidate_user, user_id)
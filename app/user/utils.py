@@ -2,15 +2,36 @@
 Helper functions for user.
 """
 
+import asyncio
 import random
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
+from pathlib import Path
+from typing import List, Tuple
+
 from passlib.context import CryptContext
 
-PWD_CONTEXT = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from core.config import config
+
+PWD_CONTEXT = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=config.PASSWORD_BCRYPT_ROUNDS,
+)
+
+# bcrypt releases the GIL, so hashing in threads keeps the event loop free. The
+# pool size bounds how many hashes run at once, further calls wait in its queue.
+PWD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS, thread_name_prefix="password"
+)
 
 
 def get_password_hash(password: str) -> str:
     """Hashes a password using bcrypt encryption algorithm.
 
+    Blocks for as long as bcrypt takes, use ``hash_password`` on the event loop.
+
     Args:
         password (str): The password to hash.
 
@@ -23,6 +44,9 @@ def get_password_hash(password: str) -> str:
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifies a plain password against a hashed password using bcrypt.
 
+    Blocks for as long as bcrypt takes, use ``verify_and_update_password`` on the
+    event loop.
+
     Args:
         plain_password (str): The plain password to verify.
         hashed_password (str): The hashed password to verify against.
@@ -33,13 +57,104 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return PWD_CONTEXT.verify(plain_password, hashed_password)
 
 
+async def hash_password(password: str) -> str:
+    """Hashes a password in the password pool.
+
+    Args:
+        password (str): The password to hash.
+
+    Returns:
+        str: The hashed password.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(PWD_EXECUTOR, PWD_CONTEXT.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, str | None]:
+    """Verifies a password in the password pool and rehashes it if outdated.
+
+    A hash is outdated if it was made with other bcrypt rounds than
+    ``PASSWORD_BCRYPT_ROUNDS`` or with a deprecated scheme.
+
+    Args:
+        plain_password (str): The plain password to verify.
+        hashed_password (str): The hashed password to verify against.
+
+    Returns:
+        Tuple[bool, str | None]: Whether the passwords match, and the new hash to
+        store if the password matched and its hash is outdated.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        PWD_EXECUTOR, PWD_CONTEXT.verify_and_update, plain_password, hashed_password
+    )
+
+
+NAMES_PATH = Path(__file__).parents[2] / "core" / "storage" / "names.txt"
+
+
+class NameList:
+    """Names read once from a file, one name per line.
+
+    The names are joined in a single string, ``offsets[i]`` is where name ``i``
+    starts and ``offsets[i + 1]`` where it ends, so a name is picked without
+    keeping hundreds of string objects around. Blank and repeated lines are
+    skipped.
+
+    Args:
+        path (Path): The file to read.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "r", encoding="utf-8") as names_file:
+            lines = (line.strip() for line in names_file)
+            names = list(dict.fromkeys(line for line in lines if line))
+
+        self.text = "".join(names)
+        self.offsets = array("I", accumulate((len(name) for name in names), initial=0))
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.text[self.offsets[index] : self.offsets[index + 1]]
+
+    def choice(self) -> str:
+        """Picks a random name."""
+        return self[random.randrange(len(self))]
+
+
+NAMES = NameList(NAMES_PATH)
+
+
 def generate_name() -> str:
-    """Generates a random name by reading from a list of names.
+    """Generates a random name from the preloaded list of names.
 
     Returns:
         str: The randomly generated name.
     """
-    with open("core/storage/names.txt", "r", encoding="utf-8") as names_file:
-        names = names_file.read().split("\n")
+    return NAMES.choice()
+
+
+def generate_names(count: int) -> List[str]:
+    """Generates distinct random names, for creating users in bulk.
 
-    return random.choice(names)
+    Every name of the list is used once before any is reused. Reused names get
+    a number, the second round is "Xenon 2", the third "Xenon 3" and so on.
+
+    Args:
+        count (int): The number of names to generate.
+
+    Returns:
+        List[str]: The names, all different from each other.
+    """
+    names = []
+    rounds = 0
+    while len(names) < count:
+        rounds += 1
+        suffix = f" {rounds}" if rounds > 1 else ""
+        picks = random.sample(range(len(NAMES)), min(len(NAMES), count - len(names)))
+        names.extend(NAMES[index] + suffix for index in picks)
+    return names
@@ -0,0 +1,105 @@
+"""
+Compare serializing a group with and without the hashid cache.
+
+Usage:
+    python -m benchmarks.hashid [--members 20] [--sessions 50] [--swipes 40]
+                                [--rounds 20]
+
+Every group, member, session and swipe id in a ``GroupSchema`` is hashed. The
+"uncached" path hashes each of them with Hashids, the "cached" path is what
+``core.helpers.hashid.encode`` does once the ids were seen before.
+"""
+
+import argparse
+import os
+import timeit
+import uuid
+from datetime import date
+
+os.environ.setdefault("ENV", "test")
+
+# pylint: disable=wrong-import-position
+from app.group.schemas.group import GroupSchema
+from core.db.enums import SwipeSessionEnum
+from core.db.models import File, Group, GroupMember, Swipe, SwipeSession, User
+from core.fastapi.schemas import hashid as hashid_schemas
+from core.helpers import hashid
+
+
+def build_group(members: int, sessions: int, swipes: int) -> Group:
+    """Build a fully populated, transient group."""
+    users = [
+        User(
+            id=user_id,
+            display_name=f"user_{user_id}",
+            is_admin=False,
+            client_token=uuid.uuid4(),
+            image=File(filename=f"user_{user_id}.png"),
+        )
+        for user_id in range(1, members + 1)
+    ]
+    group = Group(id=1, name="bench", image=File(filename="group.png"))
+    group.users = [
+        GroupMember(user=user, user_id=user.id, is_admin=user.id == 1)
+        for user in users
+    ]
+    group.swipe_sessions = [
+        SwipeSession(
+            id=session_id,
+            session_date=date(2023, 7, 1),
+            status=SwipeSessionEnum.IN_PROGRESS,
+            group_id=group.id,
+            swipes=[
+                Swipe(
+                    id=session_id * swipes + swipe_id,
+                    like=swipe_id % 2 == 0,
+                    user_id=users[swipe_id % members].id,
+                    recipe_id=swipe_id,
+                )
+                for swipe_id in range(swipes)
+            ],
+            swipe_match=None,
+            summary=None,
+        )
+        for session_id in range(1, sessions + 1)
+    ]
+    return group
+
+
+def serialize(group: Group) -> dict:
+    """Validate and dump like a ``response_model`` endpoint does."""
+    return GroupSchema.from_orm(group).dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--members", type=int, default=20)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--swipes", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    group = build_group(args.members, args.sessions, args.swipes)
+    ids = 1 + args.members + args.sessions * (2 + args.swipes)
+
+    cached_encode = hashid_schemas.encode
+    hashid_schemas.encode = hashid.hashids.encode
+    try:
+        expected = serialize(group)
+        uncached = timeit.timeit(lambda: serialize(group), number=args.rounds)
+    finally:
+        hashid_schemas.encode = cached_encode
+
+    hashid.encoded.clear()
+    assert serialize(group) == expected
+    cached = timeit.timeit(lambda: serialize(group), number=args.rounds)
+
+    print(f"{ids} hashed ids per group, {args.rounds} responses")
+    print(f"uncached path:    {uncached / args.rounds * 1000:8.2f} ms/response")
+    print(f"cached path:      {cached / args.rounds * 1000:8.2f} ms/response")
+    print(f"speedup:          {uncached / cached:8.1f}x")
+    print(f"cache hit rate:   {hashid.encoded.hit_rate:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
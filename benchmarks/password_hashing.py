@@ -0,0 +1,99 @@
+"""
+Compare verifying passwords on the event loop with the password pool.
+
+Usage:
+    python -m benchmarks.password_hashing [--logins 32] [--rounds 10]
+
+Runs ``--logins`` concurrent password checks while a ticker coroutine wakes up
+every millisecond. The "inline" path is what a login did before: call bcrypt on
+the event loop. The "pooled" path is ``verify_and_update_password``. The lag is
+how late the ticker woke up, i.e. how long every other request on the worker
+would have waited.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+os.environ.setdefault("ENV", "test")
+
+# pylint: disable=wrong-import-position
+from app.user.utils import (
+    PWD_CONTEXT,
+    PWD_EXECUTOR,
+    verify_and_update_password,
+    verify_password,
+)
+
+
+async def inline_login(password: str, hashed: str) -> bool:
+    """Verify the password on the event loop."""
+    return verify_password(password, hashed)
+
+
+async def pooled_login(password: str, hashed: str) -> bool:
+    """Verify the password in the password pool."""
+    valid, _ = await verify_and_update_password(password, hashed)
+    return valid
+
+
+async def run(login, logins: int, hashed: str) -> tuple[float, float]:
+    """Run the logins concurrently next to a ticker.
+
+    Returns:
+        tuple[float, float]: The elapsed time and the worst ticker lag.
+    """
+    lag = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal lag
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(0.001)
+            lag = max(lag, time.perf_counter() - start - 0.001)
+
+    ticker_task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(login("benchmark", hashed) for _ in range(logins))
+    )
+    elapsed = time.perf_counter() - start
+    done = True
+    await ticker_task
+    assert all(results)
+    return elapsed, lag
+
+
+async def main_async(args):
+    PWD_CONTEXT.update(bcrypt__rounds=args.rounds)
+    hashed = PWD_CONTEXT.hash("benchmark")
+
+    # Start the pool threads before timing
+    await pooled_login("benchmark", hashed)
+
+    inline, inline_lag = await run(inline_login, args.logins, hashed)
+    pooled, pooled_lag = await run(pooled_login, args.logins, hashed)
+
+    print(
+        f"{args.logins} concurrent logins, bcrypt rounds {args.rounds}, "
+        f"{PWD_EXECUTOR._max_workers} pool workers"  # pylint: disable=protected-access
+    )
+    print(f"inline path:      {args.logins / inline:8.1f} logins/s")
+    print(f"pooled path:      {args.logins / pooled:8.1f} logins/s")
+    print(f"inline max lag:   {inline_lag * 1000:8.2f} ms")
+    print(f"pooled max lag:   {pooled_lag * 1000:8.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--logins", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Compare serving recipes through pydantic with serving pre-serialized documents.
+
+Usage:
+    python -m benchmarks.recipe_documents [--recipes 50] [--rounds 200]
+
+The "current" path is what FastAPI does for a ``response_model`` endpoint:
+validate the ORM object with ``orm_mode`` and encode the result. The
+"document" path is what ``RecipeDocumentService`` does once a recipe has been
+rendered: look the bytes up by id and join them.
+"""
+
+import argparse
+import json
+import os
+import timeit
+import uuid
+
+os.environ.setdefault("ENV", "test")
+
+# pylint: disable=wrong-import-position
+from fastapi.encoders import jsonable_encoder
+
+from app.recipe.schemas.recipe import GetFullRecipePaginatedResponseSchema
+from app.recipe.services.recipe_document import (
+    documents,
+    join_documents,
+    render_recipe,
+)
+from core.db.enums import TagType
+from core.db.models import (
+    AccountAuth,
+    File,
+    Ingredient,
+    Recipe,
+    RecipeIngredient,
+    RecipeTag,
+    Tag,
+    User,
+)
+
+
+def build_recipes(amount: int) -> list[Recipe]:
+    """Build fully populated, transient recipes."""
+    creator = User(
+        id=1,
+        display_name="bench",
+        is_admin=False,
+        client_token=uuid.uuid4(),
+        image=File(filename="creator.png"),
+        account_auth=AccountAuth(username="bench", password="-"),
+    )
+    tags = [Tag(id=i, name=f"tag_{i}", tag_type=TagType.CUISINE) for i in range(5)]
+    ingredients = [Ingredient(id=i, name=f"ingredient_{i}") for i in range(12)]
+
+    recipes = []
+    for recipe_id in range(1, amount + 1):
+        recipe = Recipe(
+            id=recipe_id,
+            name=f"Recipe {recipe_id}",
+            description="A recipe used for benchmarking serialization.",
+            instructions=[f"Step {step}" for step in range(8)],
+            materials=["Pan", "Knife"],
+            preparation_time=30,
+            spiciness=1,
+            version=1,
+            likes=0,
+            image=File(filename=f"recipe_{recipe_id}.png"),
+            creator=creator,
+        )
+        recipe.tags = [RecipeTag(tag=tag) for tag in tags]
+        recipe.ingredients = [
+            RecipeIngredient(ingredient=ingredient, amount=1.5, unit="g")
+            for ingredient in ingredients
+        ]
+        recipes.append(recipe)
+
+    return recipes
+
+
+def current_path(recipes: list[Recipe]) -> bytes:
+    """Validate and encode like a ``response_model`` endpoint does."""
+    response = GetFullRecipePaginatedResponseSchema(
+        total_count=len(recipes), recipes=recipes
+    )
+    return json.dumps(jsonable_encoder(response)).encode()
+
+
+def document_path(recipe_ids: list[int]) -> bytes:
+    """Serve already rendered documents."""
+    rendered = [documents.get(recipe_id)[1] for recipe_id in recipe_ids]
+    return (
+        b'{"total_count":'
+        + str(len(recipe_ids)).encode()
+        + b',"recipes":'
+        + join_documents(rendered)
+        + b"}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--recipes", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    recipes = build_recipes(args.recipes)
+    recipe_ids = [recipe.id for recipe in recipes]
+
+    render_time = timeit.timeit(
+        lambda: [
+            documents.set(recipe.id, (recipe.version, render_recipe(recipe)))
+            for recipe in recipes
+        ],
+        number=1,
+    )
+
+    assert json.loads(current_path(recipes)) == json.loads(document_path(recipe_ids))
+
+    current = timeit.timeit(lambda: current_path(recipes), number=args.rounds)
+    document = timeit.timeit(lambda: document_path(recipe_ids), number=args.rounds)
+
+    print(f"{args.recipes} recipes per response, {args.rounds} responses")
+    print(f"first render:     {render_time * 1000:8.2f} ms")
+    print(f"pydantic path:    {current / args.rounds * 1000:8.3f} ms/response")
+    print(f"document path:    {document / args.rounds * 1000:8.3f} ms/response")
+    print(f"speedup:          {current / document:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
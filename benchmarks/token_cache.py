@@ -0,0 +1,68 @@
+"""
+Compare verifying an access token on every request with the verified-token cache.
+
+Usage:
+    python -m benchmarks.token_cache [--clients 100] [--requests 20000]
+
+The "uncached" path is what every request did before: check the signature and
+expiry with ``jwt.decode`` and decode the hashed user id. The "cached" path is
+``TokenHelper.decode_user_id`` with a warm cache, clients sending the same token
+until it expires.
+"""
+
+import argparse
+import os
+import timeit
+
+os.environ.setdefault("ENV", "test")
+
+# pylint: disable=wrong-import-position
+import jwt
+
+from core.config import config
+from core.helpers.hashid import decode_single, encode
+from core.utils.token_helper import TokenHelper, verified_tokens
+
+
+def uncached_path(token: str) -> int:
+    """Verify the token and decode the user id from scratch."""
+    payload = jwt.decode(
+        token, config.JWT_SECRET_KEY, algorithms=[config.JWT_ALGORITHM]
+    )
+    return decode_single(payload["user_id"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    tokens = [
+        TokenHelper.encode_access(payload={"user_id": encode(user_id)})
+        for user_id in range(1, args.clients + 1)
+    ]
+    requests = [tokens[i % len(tokens)] for i in range(args.requests)]
+
+    assert [uncached_path(token) for token in tokens] == [
+        TokenHelper.decode_user_id(token) for token in tokens
+    ]
+    verified_tokens.clear()
+
+    uncached = timeit.timeit(
+        lambda: [uncached_path(token) for token in requests], number=1
+    )
+    cached = timeit.timeit(
+        lambda: [TokenHelper.decode_user_id(token) for token in requests], number=1
+    )
+    stats = TokenHelper.cache_stats()
+
+    print(f"{args.clients} clients, {args.requests} requests")
+    print(f"uncached path:    {uncached / args.requests * 1e6:8.2f} us/request")
+    print(f"cached path:      {cached / args.requests * 1e6:8.2f} us/request")
+    print(f"speedup:          {uncached / cached:8.1f}x")
+    print(f"cache hit rate:   {stats['hit_rate']:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
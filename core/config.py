@@ -34,8 +34,39 @@ class Config(BaseSettings):
     IMAGE_MAX_SIZE = 5 * 1024 * 1024  # 5 MB
     ACCESS_TOKEN_EXPIRE_PERIOD: int = 3600
     REFRESH_TOKEN_EXPIRE_PERIOD: int = 3600 * 24
+    TOKEN_CACHE_SIZE: int = 10000
+    TOKEN_CACHE_MAX_TTL: int = 3600
+    REFRESH_TOKEN_STORE: str = "redis"
+    REFRESH_TOKEN_STORE_SIZE: int = 100000
+    HASHID_CACHE_SIZE: int = 65536
+    CLIENT_TOKEN_CACHE_SIZE: int = 10000
+    CLIENT_TOKEN_CACHE_TTL: int = 60
+    PASSWORD_BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = min(4, os.cpu_count() or 1)
     TASK_CAPTURE_EXCEPTIONS: bool = os.getenv("TASK_CAPTURE_EXCEPTIONS")
     SWIPE_SESSION_RECIPE_QUEUE: int = 5
+    RECIPE_DOCUMENT_CACHE_SIZE: int = 2048
+    GROUP_FILTER_CACHE_SIZE: int = 1024
+    GROUP_FILTER_CACHE_TTL: int = 300
+    CATALOG_DICTIONARY_MAX_AGE: int = 30
+    MEMBERSHIP_CACHE_SIZE: int = 8192
+    MEMBERSHIP_CACHE_TTL: int = 60
+    MEMBERSHIP_CACHE_REDIS: bool = False
+    MEMBERSHIP_REDIS_TTL: int = 600
+    RECIPE_IMPORT_CHUNK_SIZE: int = 500
+    EXPORT_BATCH_SIZE: int = 500
+    SWIPE_COMPACTION_BATCH_SIZE: int = 100
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MEMORY_SIZE: int = 100000
+    RATE_LIMIT_JUDGE: str = "60/60"
+    RATE_LIMIT_REFRESH: str = "10/60"
+    RATE_LIMIT_RECIPE_SWIPE: str = "30/10"
+    RATE_LIMIT_GET_RECIPES: str = "10/10"
+    PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000
+    CACHE_CONTROL_RECIPE: str = "public, max-age=60, must-revalidate"
+    CACHE_CONTROL_TAGS: str = "public, max-age=300, must-revalidate"
+    CACHE_CONTROL_INGREDIENTS: str = "public, max-age=300, must-revalidate"
 
 
 class DevelopmentConfig(Config):
@@ -58,6 +89,7 @@ class LocalConfig(Config):
     IMAGE_CONTAINER_NAME: str = os.getenv("IMAGE_CONTAINER_NAME")
     AZURE_BLOB_CONNECTION_STRING: str = os.getenv("AZURE_BLOB_CONNECTION_STRING")
     ACCESS_TOKEN_EXPIRE_PERIOD: int = 3600 * 24
+    REFRESH_TOKEN_STORE: str = "memory"
 
 
 class ProductionConfig(Config):
@@ -72,6 +104,7 @@ class ProductionConfig(Config):
 class TestConfig(Config):
     WRITER_DB_URL: str = "sqlite+aiosqlite:///./test.db"
     READER_DB_URL: str = "sqlite+aiosqlite:///./test.db"
+    REFRESH_TOKEN_STORE: str = "memory"
 
 
 def get_config():
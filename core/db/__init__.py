@@ -1,10 +1,11 @@
 from .session import Base, session
 from .standalone_session import standalone_session
-from .transactional import Transactional
+from .transactional import Transactional, after_commit
 
 __all__ = [
     "Base",
     "session",
     "Transactional",
+    "after_commit",
     "standalone_session",
 ]
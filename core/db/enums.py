@@ -33,8 +33,47 @@ class SwipeSessionEnum(str, BaseEnum):
     PAUSED = "Gepauzeerd"
     READY = "Staat klaar"
 
+
+class GroupRoleEnum(str, BaseEnum):
+    ADMIN = "admin"
+    MEMBER = "member"
+    NONE = "none"
+
 class TagType(str, BaseEnum):
     ALLERGIES = "Allergieën"
     CUISINE = "Keuken"
     DIET = "Dieet"
 
+
+class CatalogEnum(str, BaseEnum):
+    INGREDIENTS = "ingredients"
+    TAGS = "tags"
+    RECIPES = "recipes"
+
+
+class ExportFormatEnum(str, BaseEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class SortOrderEnum(str, BaseEnum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class UserSortEnum(str, BaseEnum):
+    ID = "id"
+    DISPLAY_NAME = "display_name"
+    CREATED_AT = "created_at"
+
+
+class GroupSortEnum(str, BaseEnum):
+    ID = "id"
+    NAME = "name"
+    CREATED_AT = "created_at"
+
+
+class SwipeSessionSortEnum(str, BaseEnum):
+    ID = "id"
+    SESSION_DATE = "session_date"
+    CREATED_AT = "created_at"
@@ -5,6 +5,7 @@ from typing import List
 import uuid
 from sqlalchemy import (
     Column,
+    Index,
     String,
     ForeignKey,
     JSON,
@@ -14,7 +15,7 @@ from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.ext.hybrid import hybrid_property
 from core.db import Base
 from core.db.mixins import TimestampMixin
-from core.db.enums import SwipeSessionEnum, TagType
+from core.db.enums import CatalogEnum, SwipeSessionEnum, TagType
 from core.config import config
 
 # pylint: disable=too-few-public-methods
@@ -38,11 +39,20 @@ class RecipeJudgement(Base, TimestampMixin):
 
 class User(Base, TimestampMixin):
     __tablename__ = "user"
+    __table_args__ = (
+        # Includes the id, so a login by client token only reads the index
+        Index(
+            "ix_user_client_token",
+            "client_token",
+            unique=True,
+            postgresql_include=["id"],
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     display_name: Mapped[str] = mapped_column(String(50), nullable=False)
     is_admin: Mapped[bool] = mapped_column(default=False)
-    client_token: Mapped[uuid.UUID] = mapped_column(unique=True, nullable=False)
+    client_token: Mapped[uuid.UUID] = mapped_column(nullable=False)
     filename: Mapped[str] = mapped_column(
         ForeignKey("file.filename", ondelete="CASCADE"), nullable=True
     )
@@ -180,6 +190,9 @@ class Recipe(Base, TimestampMixin):
     )
     creator_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
     spiciness: Mapped[int] = mapped_column()
+    version: Mapped[int] = mapped_column(default=1, server_default="1")
+    likes: Mapped[int] = mapped_column(default=0, server_default="0")
+    dislikes: Mapped[int] = mapped_column(default=0, server_default="0")
 
     image: Mapped[File] = relationship(back_populates="recipe")
     ingredients: Mapped[List[RecipeIngredient]] = relationship(
@@ -203,15 +216,6 @@ class Recipe(Base, TimestampMixin):
             + f"creator_id='{self.creator_id}')"
         )
 
-    @hybrid_property
-    def likes(self):
-        return len([judgement for judgement in self.judgements if judgement.like])
-
-    def to_dict(self) -> dict:
-        result = self.__dict__
-        result["likes"] = self.likes
-        return result
-
 
 class Tag(Base):
     __tablename__ = "tag"
@@ -261,6 +265,9 @@ class SwipeSession(Base, TimestampMixin):
     recipe_queue: Mapped["SwipeSessionRecipeQueue"] = relationship(
         back_populates="swipe_session", cascade="all, delete"
     )
+    summary: Mapped["SwipeSessionSummary"] = relationship(
+        back_populates="swipe_session", cascade="all, delete"
+    )
 
     def __repr__(self) -> str:
         return f"SwipeSession({self.id}, {self.session_date}, {self.status})"
@@ -278,6 +285,38 @@ class SwipeSessionRecipeQueue(Base):
     queue: Mapped[JSON] = Column(JSON)
 
 
+class SwipeSessionSummary(Base, TimestampMixin):
+    # The swipes of a finished swipe session, folded into one row
+    __tablename__ = "swipe_session_summary"
+
+    swipe_session_id: Mapped[int] = mapped_column(
+        ForeignKey("swipe_session.id", ondelete="cascade"), primary_key=True
+    )
+    swipe_session: Mapped[SwipeSession] = relationship(back_populates="summary")
+    # ids of the users that swiped
+    participants: Mapped[JSON] = Column(JSON, nullable=False)
+    # recipe id -> amount of likes, for every swiped recipe
+    likes: Mapped[JSON] = Column(JSON, nullable=False)
+    swipe_count: Mapped[int] = mapped_column(default=0)
+
+    @classmethod
+    def empty(cls) -> "SwipeSessionSummary":
+        return cls(participants=[], likes={}, swipe_count=0)
+
+    def add_swipes(self, rows) -> None:
+        # rows of (user_id, recipe_id, like)
+        participants = set(self.participants)
+        # JSON object keys are strings
+        likes = dict(self.likes)
+        for user_id, recipe_id, like in rows:
+            participants.add(user_id)
+            likes[str(recipe_id)] = likes.get(str(recipe_id), 0) + int(like)
+
+        self.participants = sorted(participants)
+        self.likes = likes
+        self.swipe_count += len(rows)
+
+
 class Swipe(Base, TimestampMixin):
     __tablename__ = "swipe"
 
@@ -317,3 +356,10 @@ class GroupMember(Base):
 
     group: Mapped[Group] = relationship(back_populates="users")
     user: Mapped[User] = relationship(back_populates="groups")
+
+
+class CatalogVersion(Base):
+    __tablename__ = "catalog_version"
+
+    name: Mapped[CatalogEnum] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(default=1)
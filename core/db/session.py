@@ -35,7 +35,9 @@ engines = {
 
 
 class RoutingSession(Session):
-    def get_bind(self, mapper=None, clause=None, **kw):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kw):
+        if bind is not None:
+            return bind
         if self._flushing or isinstance(clause, (Update, Delete, Insert)):
             return engines["writer"].sync_engine
         else:
@@ -1,7 +1,31 @@
-from functools import wraps
+import inspect
+from functools import partial, wraps
+from typing import Callable
 
 from core.db import session
 
+AFTER_COMMIT = "after_commit"
+
+
+async def after_commit(func: Callable, *args) -> None:
+    """Run a callback once the current transaction is committed.
+
+    Caches of written rows are invalidated this way: invalidated before the
+    commit, a concurrent request could still read the old rows and cache them
+    again. Outside a transaction the callback runs right away, callbacks of a
+    transaction that is rolled back are dropped.
+    """
+    if session().in_transaction():
+        session.info.setdefault(AFTER_COMMIT, []).append(partial(func, *args))
+    else:
+        await _run(partial(func, *args))
+
+
+async def _run(callback: Callable) -> None:
+    result = callback()
+    if inspect.isawaitable(result):
+        await result
+
 
 class Transactional:
     def __call__(self, func):
@@ -11,9 +35,13 @@ class Transactional:
                 result = await func(*args, **kwargs)
                 await session.commit()
             except Exception as exc:
+                session.info.pop(AFTER_COMMIT, None)
                 await session.rollback()
                 raise exc
 
+            for callback in session.info.pop(AFTER_COMMIT, []):
+                await _run(callback)
+
             return result
 
         return _transactional
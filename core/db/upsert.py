@@ -0,0 +1,22 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+from core.db.session import engines
+
+_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def dialect_insert(model):
+    """INSERT of the writer engine's dialect, supporting ``ON CONFLICT``."""
+    return _INSERTS[engines["writer"].dialect.name](model)
+
+
+def insert_ignore(model):
+    """INSERT that skips rows conflicting with a unique constraint.
+
+    Builds ``INSERT ... ON CONFLICT DO NOTHING`` for the dialect of the writer
+    engine, so existing rows are neither updated nor reported as errors.
+    """
+    return dialect_insert(model).on_conflict_do_nothing()
@@ -10,6 +10,8 @@ from .base import (
 from .token import DecodeTokenException, ExpiredTokenException
 from .responses import ExceptionResponseSchema
 from .hashids import IncorrectHashIDException
+from .pagination import InvalidCursorException
+from .rate_limit import RateLimitedException
 
 
 __all__ = [
@@ -24,4 +26,6 @@ __all__ = [
     "ExpiredTokenException",
     "ExceptionResponseSchema",
     "IncorrectHashIDException",
+    "InvalidCursorException",
+    "RateLimitedException",
 ]
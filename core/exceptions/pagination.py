@@ -0,0 +1,7 @@
+from core.exceptions import CustomException
+
+
+class InvalidCursorException(CustomException):
+    code = 400
+    error_code = "PAGINATION__INVALID_CURSOR"
+    message = "the cursor is invalid or belongs to another sort order"
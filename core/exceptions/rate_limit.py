@@ -0,0 +1,14 @@
+from http import HTTPStatus
+
+from core.exceptions import CustomException
+
+
+class RateLimitedException(CustomException):
+    code = HTTPStatus.TOO_MANY_REQUESTS
+    error_code = "RATE_LIMIT__EXCEEDED"
+    message = "too many requests, try again later"
+
+    def __init__(self, retry_after: int):
+        super().__init__()
+        self.retry_after = retry_after
+        self.headers = {"Retry-After": str(retry_after)}
@@ -6,6 +6,7 @@ from .permission import (
     AllowAll,
     IsGroupAdmin,
 )
+from .rate_limit import RateLimitDependency
 
 __all__ = [
     "Logging",
@@ -14,4 +15,5 @@ __all__ = [
     "IsAdmin",
     "AllowAll",
     "IsGroupAdmin",
+    "RateLimitDependency",
 ]
@@ -1,5 +1,5 @@
 import json
-from fastapi import Path, Request
+from fastapi import Path, Query, Request
 
 from core.helpers.hashid import decode_single
 
@@ -12,3 +12,6 @@ async def get_path_session_id(session_id: str = Path(...)):
 
 async def get_path_user_id(user_id: str = Path(...)):
     return decode_single(user_id)
+
+async def get_query_group_id(group_id: str | None = Query(None)) -> int | None:
+    return decode_single(group_id) if group_id else None
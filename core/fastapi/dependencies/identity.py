@@ -0,0 +1,104 @@
+"""REQUEST SCOPED IDENTITY"""
+
+from starlette.requests import HTTPConnection
+
+from app.group.repository.membership import MembershipRepository
+from app.user.repository.user import UserRepository
+from core.db.enums import GroupRoleEnum
+from core.db.models import User
+from core.helpers.cache.lru import MISSING
+
+
+class Identity:
+    """
+    The user making a request, loaded at most once per request.
+
+    Permissions and dependencies of one request share a single instance through
+    ``get_identity``, so the user and each group role asked about are queried
+    once, however many checks need them.
+
+    Attributes
+    ----------
+    user_id : int, optional
+        The id from the access token, None if not authenticated.
+    """
+
+    def __init__(self, user_id: int | None):
+        self.user_id = user_id
+        self._user = MISSING
+        self._group_roles: dict[int, GroupRoleEnum] = {}
+
+    async def get_user(self) -> User | None:
+        """
+        Get the user, with the relationships of ``UserRepository`` loaded.
+
+        Returns
+        -------
+        User, optional
+            The user, None if not authenticated or the user doesn't exist.
+        """
+        if self._user is MISSING:
+            self._user = (
+                await UserRepository().get_by_id(self.user_id)
+                if self.user_id
+                else None
+            )
+        return self._user
+
+    async def is_admin(self) -> bool:
+        """Whether the user is an admin of the application."""
+        user = await self.get_user()
+        return bool(user and user.is_admin)
+
+    async def get_group_role(self, group_id: int) -> GroupRoleEnum:
+        """
+        Get the role of the user in a group.
+
+        Parameters
+        ----------
+        group_id : int
+            The id of the group.
+
+        Returns
+        -------
+        GroupRoleEnum
+            The role, ``GroupRoleEnum.NONE`` if not a member or not
+            authenticated.
+        """
+        if not self.user_id:
+            return GroupRoleEnum.NONE
+
+        if group_id not in self._group_roles:
+            self._group_roles[group_id] = await MembershipRepository().get_role(
+                group_id, self.user_id
+            )
+        return self._group_roles[group_id]
+
+    async def is_group_member(self, group_id: int) -> bool:
+        """Whether the user is a member of the group."""
+        return await self.get_group_role(group_id) != GroupRoleEnum.NONE
+
+    async def is_group_admin(self, group_id: int) -> bool:
+        """Whether the user is the admin of the group."""
+        return await self.get_group_role(group_id) == GroupRoleEnum.ADMIN
+
+
+def get_identity(conn: HTTPConnection) -> Identity:
+    """
+    Get the identity of a request, created on first use.
+
+    Parameters
+    ----------
+    conn : HTTPConnection
+        The request or websocket, after the authentication middleware.
+
+    Returns
+    -------
+    Identity
+        The identity memoized on ``conn.state``.
+    """
+    identity = getattr(conn.state, "identity", None)
+    if identity is None:
+        identity = Identity(conn.user.id)
+        conn.state.identity = identity
+    return identity
@@ -0,0 +1,39 @@
+from fastapi import Query, Response
+
+from core.config import config
+from core.db.enums import SortOrderEnum
+from core.repository.pagination import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """
+    Query parameters of a keyset paginated listing.
+
+    The items of a page are the response body; the cursor of the next page is
+    sent in the ``X-Next-Cursor`` header, which is absent on the last page.
+    """
+
+    def __init__(
+        self,
+        cursor: str | None = Query(
+            None, description=f"Value of the {NEXT_CURSOR_HEADER} header of the previous page"
+        ),
+        limit: int = Query(config.PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+        order: SortOrderEnum = Query(SortOrderEnum.ASC),
+    ):
+        self.cursor = cursor
+        self.limit = limit
+        self.descending = order == SortOrderEnum.DESC
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """
+    Sets the cursor of the next page on the response.
+
+    :param response: The response of the listing.
+    :param page: The page sent in the response.
+    """
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
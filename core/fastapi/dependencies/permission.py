@@ -6,16 +6,16 @@ from fastapi import Request
 from fastapi.openapi.models import APIKey, APIKeyIn
 from fastapi.security.base import SecurityBase
 
-from app.group.services.group import GroupService
 from app.swipe_session.services.swipe_session import SwipeSessionService
 from app.image.services import ImageService
-from app.user.services import UserService
 from core.exceptions import (
     CustomException,
     UnauthorizedException,
 )
+from core.fastapi.dependencies.identity import get_identity
 from core.fastapi.dependencies.object_storage import get_object_storage
 from core.helpers.hashid import decode_single
+from core.helpers.permission import QUERIES, TOKEN_ONLY, CompiledPermissions
 
 
 def get_group_id_from_path(request):
@@ -44,6 +44,7 @@ def get_session_id_from_path(request):
 
 class BasePermission(ABC):
     exception = CustomException
+    cost = QUERIES
 
     @abstractmethod
     async def has_permission(self, request: Request) -> bool:
@@ -52,12 +53,15 @@ class BasePermission(ABC):
 
 class IsAuthenticated(BasePermission):
     exception = UnauthorizedException
+    cost = TOKEN_ONLY
 
     async def has_permission(self, request: Request) -> bool:
         return request.user.id is not None
 
 
 class IsUserOwner(BasePermission):
+    cost = TOKEN_ONLY
+
     async def has_permission(self, request: Request) -> bool:
         user_id = get_user_id_from_path(request)
 
@@ -103,14 +107,12 @@ class IsAdmin(BasePermission):
     exception = UnauthorizedException
 
     async def has_permission(self, request: Request) -> bool:
-        user_id = request.user.id
-        if not user_id:
-            return False
-
-        return await UserService().is_admin(user_id=user_id)
+        return await get_identity(request).is_admin()
 
 
 class AllowAll(BasePermission):
+    cost = TOKEN_ONLY
+
     async def has_permission(self, request: Request) -> bool:
         return True
 
@@ -133,7 +135,7 @@ class IsGroupMember(BasePermission):
         except ValueError as e:
             raise ValueError(str(e) + " did you forget to decode?")
 
-        return await GroupService().is_member(group_id=group_id, user_id=user_id)
+        return await get_identity(request).is_group_member(group_id)
 
 
 class IsGroupAdmin(BasePermission):
@@ -153,28 +155,17 @@ class IsGroupAdmin(BasePermission):
         except ValueError as e:
             raise ValueError(str(e) + " did you forget to decode?")
 
-        return await GroupService().is_admin(group_id=group_id, user_id=user_id)
+        return await get_identity(request).is_group_admin(group_id)
 
 
 class PermissionDependency(SecurityBase):
     def __init__(self, permissions: List[List[Type[BasePermission]]]):
         self.permissions = permissions
+        self.compiled = CompiledPermissions(permissions)
         self.model: APIKey = APIKey(**{"in": APIKeyIn.header}, name="Authorization")
         self.scheme_name = self.__class__.__name__
 
     async def __call__(self, request: Request):
-        exceptions = {}
-        for i, permission_combo in enumerate(self.permissions):
-            exceptions[i] = []
-
-            for permission in permission_combo:
-                cls = permission()
-                if not await cls.has_permission(request=request):
-                    exceptions[i].append(cls.exception)
-
-        if any(len(excs) == 0 for _, excs in exceptions.items()):
-            return
-
-        for _, excs in exceptions.items():
-            if len(excs) > 0:
-                raise excs[0]
+        exception = await self.compiled.evaluate(request=request)
+        if exception:
+            raise exception
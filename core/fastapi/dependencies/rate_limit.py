@@ -0,0 +1,74 @@
+from typing import Awaitable, Callable, Hashable
+
+from fastapi import Request
+
+from core.exceptions import CustomException
+from core.helpers.rate_limit import RateLimit
+from core.utils.token_helper import TokenHelper
+
+
+def client_address(request: Request) -> str:
+    """The address of the client, the last resort key of a bucket.
+
+    Every client behind the same proxy or NAT shares it, and it is missing when
+    the server doesn't know the peer, e.g. on a unix socket.
+    """
+    return request.client.host if request.client else "anonymous"
+
+
+async def user_key(request: Request) -> Hashable:
+    """Key calls by the user of the access token, else by client address."""
+    return request.user.id or client_address(request)
+
+
+async def refresh_token_key(request: Request) -> Hashable:
+    """Key calls by the user of the refresh token in the body.
+
+    The refresh token is only verified, never looked up, so the key costs no
+    database access. Calls with a token that doesn't verify fall back to the
+    client address.
+    """
+    try:
+        body = await request.json()
+    except ValueError:
+        # Rejected by the validation of the route
+        return client_address(request)
+
+    if isinstance(body, dict) and isinstance(body.get("refresh_token"), str):
+        try:
+            verified = TokenHelper.verify(body["refresh_token"])
+        except CustomException:
+            verified = None
+
+        if verified and verified.user_id is not None:
+            return verified.user_id
+
+    return client_address(request)
+
+
+class RateLimitDependency:
+    """
+    Rate limit a route per user, or per client address if not authenticated.
+
+    Put it before the permission dependency of the route, so a rejected call
+    never reaches a check that queries the database.
+
+    Args:
+        name (str): Name of the limited route.
+        budget (str | None): The ``"<capacity>/<seconds>"`` budget, nothing is
+        limited if empty.
+        key (Callable[[Request], Awaitable[Hashable]]): Who is calling, by
+        default the user of the access token.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        budget: str | None,
+        key: Callable[[Request], Awaitable[Hashable]] = user_key,
+    ):
+        self.limit = RateLimit(name, budget)
+        self.key = key
+
+    async def __call__(self, request: Request):
+        await self.limit.hit(await self.key(request))
@@ -2,8 +2,8 @@
 
 from fastapi import Request
 from app.user.exceptions.user import UserNotFoundException
-from app.user.repository.user import UserRepository
 from core.db.models import User
+from core.fastapi.dependencies.identity import get_identity
 
 
 async def get_current_user(request: Request) -> User:
@@ -30,7 +30,7 @@ async def get_current_user(request: Request) -> User:
     if not user or not user.id:
         return None
 
-    user = await UserRepository().get_by_id(user.id)
+    user = await get_identity(request).get_user()
 
     if not user:
         raise UserNotFoundException
@@ -1,14 +1,13 @@
 from typing import Optional, Tuple
 
-import jwt
 from starlette.authentication import AuthenticationBackend
 from starlette.middleware.authentication import (
     AuthenticationMiddleware as BaseAuthenticationMiddleware,
 )
 from starlette.requests import HTTPConnection
 
-from core.config import config
-from core.helpers.hashid import decode_single
+from core.exceptions import CustomException
+from core.utils.token_helper import TokenHelper
 from ..schemas import CurrentUser
 
 
@@ -32,13 +31,8 @@ class AuthBackend(AuthenticationBackend):
             return False, current_user
 
         try:
-            payload = jwt.decode(
-                credentials,
-                config.JWT_SECRET_KEY,
-                algorithms=[config.JWT_ALGORITHM],
-            )
-            user_id = int(decode_single(payload.get("user_id")))
-        except jwt.exceptions.PyJWTError:
+            user_id = TokenHelper.decode_user_id(credentials)
+        except CustomException:
             return False, current_user
 
         current_user.id = user_id
@@ -1,4 +1,4 @@
-from core.helpers.hashid import decode, decode_single, encode
+from core.helpers.hashid import decode, decode_single, encode, encode_many
 
 
 class HashId(int):
@@ -15,6 +15,20 @@ class HashId(int):
         return encode(v)
     
 
+class HashIdList(list):
+    """Pydantic type for hashing a list of integers at once"""
+
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, v):
+        if not all(isinstance(item, int) for item in v):
+            raise TypeError('list of integers required')
+        return encode_many(v)
+
+
 class DehashId(str):
     """Pydantic type for dehashing hash"""
 
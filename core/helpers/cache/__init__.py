@@ -1,6 +1,7 @@
 from .cache_manager import Cache
 from .cache_tag import CacheTag
 from .custom_key_maker import CustomKeyMaker
+from .lru import LRUCache
 from .redis_backend import RedisBackend
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "RedisBackend",
     "CustomKeyMaker",
     "CacheTag",
+    "LRUCache",
 ]
@@ -0,0 +1,112 @@
+"""
+Process-local dictionary of a catalog collection (tags, ingredients, ...).
+
+Catalog collections are small and read far more often than written, so every
+process keeps all of their entries in memory, indexed by id, by name and by
+name prefix. The copy is reloaded when the version of the collection changed.
+"""
+
+import time
+from typing import Any, Awaitable, Callable, Iterable, Iterator
+
+from core.config import config
+from core.db.enums import CatalogEnum
+from core.helpers.prefix_index import PrefixIndex
+from core.helpers.search import tokenize
+from core.repository.catalog_version import CatalogVersionRepository, local_bumps
+
+
+class CatalogDictionary:
+    """In-memory entries of a catalog collection.
+
+    Entries are any objects with an ``id`` and a ``name`` attribute, e.g. rows
+    of the columns a response needs. The version of the collection is checked
+    at most every ``max_age`` seconds, and right after this process wrote to
+    the collection, so other processes' writes show up within ``max_age``.
+    """
+
+    def __init__(
+        self,
+        name: CatalogEnum,
+        load: Callable[[], Awaitable[Iterable[Any]]],
+        max_age: float = config.CATALOG_DICTIONARY_MAX_AGE,
+    ):
+        self.name = name
+        self.load = load
+        self.max_age = max_age
+        self.version = None
+        self.checked_at = None
+        self.by_id: dict[int, Any] = {}
+        self.by_name: dict[str, Any] = {}
+        self.names = PrefixIndex()
+        self.words = PrefixIndex()
+        self.version_repo = CatalogVersionRepository()
+
+    def is_fresh(self) -> bool:
+        """Whether the entries may be used without checking the version."""
+        if self.checked_at is None:
+            return False
+        if self.checked_at <= local_bumps.get(self.name, 0):
+            return False
+        return time.monotonic() - self.checked_at < self.max_age
+
+    async def refresh(self, check_version: bool = False) -> "CatalogDictionary":
+        """Reload the entries if the collection changed since they were loaded.
+
+        The version is read before the entries, so ``version`` never claims
+        entries newer than those loaded.
+
+        Args:
+            check_version (bool, optional): Read the version even if the entries
+            are fresh, e.g. to answer with an ETag of ``version``.
+
+        Returns:
+            CatalogDictionary: The dictionary itself, for chaining.
+        """
+        if not check_version and self.is_fresh():
+            return self
+
+        checked_at = time.monotonic()
+        version = await self.version_repo.get(self.name)
+        if version != self.version:
+            self.build(await self.load())
+            self.version = version
+        self.checked_at = checked_at
+        return self
+
+    def build(self, entries: Iterable[Any]) -> None:
+        """Replace all entries and rebuild the indexes."""
+        entries = list(entries)
+        self.by_id = {entry.id: entry for entry in entries}
+        self.by_name = {entry.name: entry for entry in entries}
+        self.names = PrefixIndex((entry.name, entry) for entry in entries)
+        # Later words of a name, so "kaas" also completes to "geraspte kaas".
+        self.words = PrefixIndex(
+            (word, entry) for entry in entries for word in tokenize(entry.name)[1:]
+        )
+
+    def entries(self) -> list[Any]:
+        """All entries, in the order they were loaded."""
+        return list(self.by_id.values())
+
+    def complete(self, prefix: str, limit: int) -> list[Any]:
+        """Entries whose name, or a word in it, starts with the prefix.
+
+        Args:
+            prefix (str): Start of the name, matched case and accent insensitive.
+            limit (int): Maximum amount of entries to return.
+
+        Returns:
+            list[Any]: Entries whose name starts with the prefix first, then
+            those with a later word starting with it, alphabetically.
+        """
+        matches = {}
+        for entry in self._iter_matches(prefix):
+            if len(matches) >= limit:
+                break
+            matches.setdefault(entry.id, entry)
+        return list(matches.values())
+
+    def _iter_matches(self, prefix: str) -> Iterator[Any]:
+        yield from self.names.iter_search(prefix)
+        yield from self.words.iter_search(prefix)
@@ -0,0 +1,70 @@
+"""
+Helpers for conditional GET requests using strong ETags
+"""
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the parts that identify a representation.
+
+    Args:
+        *parts: e.g. the resource name and its version.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the client already has the representation with the given ETag.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the If-None-Match header matches the ETag.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+
+    if header.strip() == "*":
+        return True
+
+    # If-None-Match uses the weak comparison
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def set_cache_headers(response: Response, etag: str, cache_control: str) -> None:
+    """
+    Set the ETag and Cache-Control headers on a response.
+
+    Args:
+        response (Response): The response to set the headers on.
+        etag (str): The ETag of the representation.
+        cache_control (str): The Cache-Control policy of the route.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    """
+    Build a 304 Not Modified response.
+
+    Args:
+        etag (str): The ETag of the representation.
+        cache_control (str): The Cache-Control policy of the route.
+
+    Returns:
+        Response: An empty response telling the client to reuse its copy.
+    """
+    response = Response(status_code=304)
+    set_cache_headers(response, etag, cache_control)
+    return response
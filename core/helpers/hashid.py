@@ -3,9 +3,12 @@ Module to encode and decode integers.
 """
 
 import os
+from typing import Iterable
 from hashids import Hashids
 
+from core.config import config
 from core.exceptions.hashids import IncorrectHashIDException
+from core.helpers.cache.lru import MISSING, LRUCache
 
 
 salt = os.getenv("HASH_SALT")
@@ -13,20 +16,54 @@ min_length = int(os.getenv("HASH_MIN_LEN"))
 
 hashids = Hashids(salt=salt, min_length=min_length)
 
+# Hashids is pure Python, and the same ids are hashed over and over, e.g. the
+# members of a group in every response about it. Both directions are cached,
+# each filling the other.
+# id -> hash
+encoded = LRUCache(maxsize=config.HASHID_CACHE_SIZE)
+# hash -> ids
+decoded = LRUCache(maxsize=config.HASHID_CACHE_SIZE)
+
 
 def encode(id_to_hash):
     """Hashids encode function"""
-    return hashids.encode(id_to_hash)
+    hashed_id = encoded.get(id_to_hash, MISSING)
+    if hashed_id is MISSING:
+        hashed_id = hashids.encode(id_to_hash)
+        encoded.set(id_to_hash, hashed_id)
+        decoded.set(hashed_id, (id_to_hash,))
+    return hashed_id
+
+
+def encode_many(ids_to_hash: Iterable[int]) -> list[str]:
+    """Encode every id of a list, each to its own hash"""
+    return [encode(id_to_hash) for id_to_hash in ids_to_hash]
 
 
 def decode(hashed_ids):
     """Hashids decode function"""
+    if not isinstance(hashed_ids, str):
+        try:
+            return hashids.decode(hashed_ids)
+        except Exception as exc:
+            raise IncorrectHashIDException from exc
+
+    real_ids = decoded.get(hashed_ids, MISSING)
+    if real_ids is not MISSING:
+        return real_ids
+
     try:
-        return hashids.decode(hashed_ids)
+        real_ids = hashids.decode(hashed_ids)
 
     except Exception as exc:
         raise IncorrectHashIDException from exc
 
+    # Only valid hashes, garbage must not evict them
+    if len(real_ids) == 1:
+        decoded.set(hashed_ids, real_ids)
+        encoded.set(real_ids[0], hashed_ids)
+    return real_ids
+
 
 def decode_single(hashed_ids) -> int:
     """Decode, return single ID"""
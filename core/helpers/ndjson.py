@@ -0,0 +1,34 @@
+"""
+Helpers for newline delimited JSON streams.
+"""
+
+from typing import AsyncIterable, AsyncIterator, Iterable
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Split a stream of byte chunks into lines.
+
+    Chunks may end halfway a line, e.g. when reading a request body. Empty
+    lines are yielded too, so callers can keep track of line numbers.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The stream, e.g. ``request.stream()``.
+
+    Yields:
+        bytes: Every line without its line ending.
+    """
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line.rstrip(b"\r")
+
+    if buffer:
+        yield buffer.rstrip(b"\r")
+
+
+async def iter_file(lines: Iterable[bytes]) -> AsyncIterator[bytes]:
+    """Expose the lines of a file opened in binary mode as a stream."""
+    for line in lines:
+        yield line
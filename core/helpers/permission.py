@@ -0,0 +1,61 @@
+"""
+Evaluation of permission specs shared by routes and websockets.
+
+A spec is a list of alternatives, each a list of permission classes that must
+all pass: ``[[IsAdmin], [IsAuthenticated, IsGroupMember]]`` reads "admin, or
+an authenticated group member". The spec is compiled once, when the route or
+manager is defined, into an evaluator that stops as soon as the outcome is
+known.
+"""
+
+from typing import List, Type
+
+from core.exceptions.base import CustomException
+
+# Costs of a check, cheaper checks run first within an alternative
+TOKEN_ONLY = 0
+QUERIES = 1
+
+
+class CompiledPermissions:
+    """Short-circuiting evaluator of a permission spec.
+
+    Every permission class is instantiated once here, so checks must not keep
+    state between calls. Within an alternative the checks run by ``cost``,
+    keeping their written order for equal costs, and stop at the first failing
+    one. The alternatives run in their written order and evaluation stops at
+    the first that passes.
+
+    The ordering decides which error is reported: when no alternative passes,
+    it is the exception of the check that failed first in the first
+    alternative, i.e. its cheapest failing check rather than the first failing
+    one as written.
+    """
+
+    def __init__(self, permissions: List[List[Type]]):
+        self.alternatives = [
+            sorted(
+                (permission() for permission in alternative),
+                key=lambda check: check.cost,
+            )
+            for alternative in permissions
+        ]
+
+    async def evaluate(self, *args, **kwargs) -> Type[CustomException] | None:
+        """Run the checks with the given arguments.
+
+        Returns:
+            Type[CustomException] | None: None if an alternative passed, else
+            the exception of the cheapest failing check of the first
+            alternative.
+        """
+        exception = None
+        for alternative in self.alternatives:
+            for check in alternative:
+                if not await check.has_permission(*args, **kwargs):
+                    exception = exception or check.exception
+                    break
+            else:
+                return None
+
+        return exception
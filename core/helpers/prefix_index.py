@@ -0,0 +1,52 @@
+"""
+Prefix lookups over a sorted array of normalized keys.
+
+Used for autocompletion, where a prefix has to be answered from memory without
+scanning every key.
+"""
+
+from bisect import bisect_left
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from core.helpers.search import normalize
+
+
+class PrefixIndex:
+    """Immutable index answering "which keys start with ..." by binary search.
+
+    Keys are normalized like search terms, so "cre" finds "Crème fraîche".
+    Several values may share a key; they are returned in key order.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, Any]] = ()):
+        pairs = sorted(
+            ((normalize(key), value) for key, value in items), key=lambda pair: pair[0]
+        )
+        self.keys = [key for key, _ in pairs]
+        self.values = [value for _, value in pairs]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def iter_search(self, prefix: str) -> Iterator[Any]:
+        """Lazily yield the values whose key starts with the prefix, in key
+        order."""
+        prefix = normalize(prefix)
+
+        for position in range(bisect_left(self.keys, prefix), len(self.keys)):
+            if not self.keys[position].startswith(prefix):
+                return
+            yield self.values[position]
+
+    def search(self, prefix: str, limit: int | None = None) -> list[Any]:
+        """Values whose key starts with the prefix.
+
+        Args:
+            prefix (str): Start of the key, matched after normalization.
+            limit (int | None): Maximum amount of values to return.
+
+        Returns:
+            list[Any]: The matching values, ordered by key.
+        """
+        return list(islice(self.iter_search(prefix), limit))
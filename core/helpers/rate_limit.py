@@ -0,0 +1,174 @@
+"""
+Token bucket rate limiting of hot endpoints and websocket actions.
+
+A budget ``"<capacity>/<seconds>"`` gives every key a bucket of ``capacity``
+tokens that refills at ``capacity / seconds`` tokens per second: a client may
+burst ``capacity`` calls, then keeps that average rate. Every call takes a
+token, a call finding the bucket empty is rejected with the time until the
+next token, without running anything else.
+
+Keys are the user id, from the access token or the refresh token being used, or
+the client address when there is none, so buckets are checked from the tokens
+alone and never touch the database.
+"""
+
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Hashable, NamedTuple
+
+from core.config import config
+from core.exceptions.rate_limit import RateLimitedException
+from core.helpers.cache import LRUCache
+from core.helpers.redis import redis
+
+
+class Budget(NamedTuple):
+    capacity: int
+    period: float
+
+    @classmethod
+    def parse(cls, budget: str) -> "Budget":
+        """Parse a ``"<capacity>/<seconds>"`` budget.
+
+        Args:
+            budget (str): The budget, e.g. ``"30/60"`` for 30 calls a minute.
+
+        Returns:
+            Budget: The parsed budget.
+        """
+        capacity, period = budget.split("/")
+        return cls(int(capacity), float(period))
+
+    @property
+    def rate(self) -> float:
+        """Tokens added to the bucket per second."""
+        return self.capacity / self.period
+
+
+class RateLimitBackend(ABC):
+    """Storage of the buckets."""
+
+    @abstractmethod
+    async def consume(self, key: str, budget: Budget) -> float:
+        """Take a token from the bucket of a key.
+
+        Args:
+            key (str): The bucket.
+            budget (Budget): The size and refill rate of the bucket.
+
+        Returns:
+            float: 0 if a token was taken, else the seconds until one is
+            available.
+        """
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """Process-local buckets, for a single worker and for tests.
+
+    A bucket is dropped once it would have refilled, a missing bucket is full.
+    """
+
+    def __init__(self, maxsize: int = config.RATE_LIMIT_MEMORY_SIZE):
+        # key -> (tokens, monotonic time of the last update)
+        self.buckets = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    async def consume(self, key: str, budget: Budget) -> float:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self.buckets.get(key, (budget.capacity, now))
+            tokens = min(budget.capacity, tokens + (now - updated) * budget.rate)
+            wait = (1 - tokens) / budget.rate if tokens < 1 else 0
+            if not wait:
+                tokens -= 1
+            self.buckets.set(key, (tokens, now), ttl=budget.period)
+            return wait
+
+
+# Takes a token from the bucket KEYS[1] of ARGV[1] tokens refilling at ARGV[2]
+# tokens per second. Returns 0 when taken, else the milliseconds until the next
+# token.
+CONSUME_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * rate)
+local wait = 0
+if tokens < 1 then
+    wait = math.ceil((1 - tokens) / rate * 1000)
+else
+    tokens = tokens - 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(capacity / rate * 1000))
+return wait
+"""
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Buckets shared by all workers.
+
+    A bucket is a hash ``rate_limit::<key>`` updated by a script, so concurrent
+    calls of one client on different workers can't take the same token. It
+    expires once it would have refilled.
+    """
+
+    PREFIX = "rate_limit::"
+
+    def __init__(self):
+        self.consume_script = redis.register_script(CONSUME_SCRIPT)
+
+    async def consume(self, key: str, budget: Budget) -> float:
+        wait = await self.consume_script(
+            keys=[self.PREFIX + key], args=[budget.capacity, budget.rate]
+        )
+        return int(wait) / 1000
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """The backend configured by ``RATE_LIMIT_BACKEND``."""
+    backends = {
+        "memory": MemoryRateLimitBackend,
+        "redis": RedisRateLimitBackend,
+    }
+    return backends[config.RATE_LIMIT_BACKEND]()
+
+
+rate_limit_backend = get_rate_limit_backend()
+
+
+class RateLimit:
+    """A named budget, limiting every key separately.
+
+    Args:
+        name (str): Name of the limited route or action, separates its buckets
+        from those of other limits.
+        budget (str | None): The ``"<capacity>/<seconds>"`` budget, nothing is
+        limited if empty.
+    """
+
+    def __init__(self, name: str, budget: str | None):
+        self.name = name
+        self.budget = Budget.parse(budget) if budget else None
+
+    async def hit(self, key: Hashable) -> None:
+        """Count a call of a key against the budget.
+
+        Args:
+            key (Hashable): Who is calling, e.g. the user id.
+
+        Raises:
+            RateLimitedException: If the budget of the key is used up.
+        """
+        if self.budget is None:
+            return
+
+        wait = await rate_limit_backend.consume(f"{self.name}:{key}", self.budget)
+        if wait:
+            raise RateLimitedException(retry_after=math.ceil(wait))
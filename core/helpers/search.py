@@ -0,0 +1,108 @@
+"""
+In-process inverted index with tf-idf ranking and trigram fuzzy matching.
+
+Used as the search backend for databases without a full-text index of their own
+(e.g. the SQLite test database).
+"""
+
+import math
+import re
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Hashable, Iterable
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and strip accents, so "Crème" matches "creme"."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenize(text: str | None) -> list[str]:
+    """Split text into normalized word tokens."""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(normalize(text))
+
+
+def trigrams(term: str) -> set[str]:
+    """Padded character trigrams of a term, as pg_trgm builds them."""
+    padded = f"  {term} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class InvertedIndex:
+    """Maps terms to the documents containing them.
+
+    Every document consists of weighted fields, e.g. a recipe name weighs more
+    than its description. ``search`` ranks documents by the tf-idf of the query
+    terms; query terms that do not occur in the index are expanded to similar
+    terms by trigram similarity, so small typos still find results.
+    """
+
+    def __init__(self, similarity_threshold: float = 0.3):
+        self.similarity_threshold = similarity_threshold
+        self.postings: dict[str, dict[Hashable, float]] = defaultdict(dict)
+        self.trigram_terms: dict[str, set[str]] = defaultdict(set)
+        self.document_count = 0
+
+    def add(self, document_id: Hashable, fields: Iterable[tuple[str, float]]) -> None:
+        """Index a document.
+
+        Args:
+            document_id (Hashable): Identifier returned by ``search``.
+            fields (Iterable[tuple[str, float]]): (text, weight) pairs.
+        """
+        frequencies: Counter = Counter()
+        for text, weight in fields:
+            for token in tokenize(text):
+                frequencies[token] += weight
+
+        for term, frequency in frequencies.items():
+            if term not in self.postings:
+                for trigram in trigrams(term):
+                    self.trigram_terms[trigram].add(term)
+            self.postings[term][document_id] = frequency
+
+        self.document_count += 1
+
+    def similar_terms(self, term: str) -> dict[str, float]:
+        """Indexed terms similar to ``term``, with their trigram similarity."""
+        if term in self.postings:
+            return {term: 1.0}
+
+        term_trigrams = trigrams(term)
+        shared: Counter = Counter()
+        for trigram in term_trigrams:
+            for candidate in self.trigram_terms.get(trigram, ()):
+                shared[candidate] += 1
+
+        similar = {}
+        for candidate, count in shared.items():
+            union = len(term_trigrams) + len(trigrams(candidate)) - count
+            similarity = count / union
+            if similarity >= self.similarity_threshold:
+                similar[candidate] = similarity
+        return similar
+
+    def search(self, query: str) -> list[tuple[Hashable, float]]:
+        """Rank the documents matching any term of the query.
+
+        Args:
+            query (str): Free text query.
+
+        Returns:
+            list[tuple[Hashable, float]]: (document_id, score) pairs, best first.
+        """
+        scores: dict[Hashable, float] = defaultdict(float)
+
+        for token in set(tokenize(query)):
+            for term, similarity in self.similar_terms(token).items():
+                postings = self.postings[term]
+                idf = math.log(1 + self.document_count / len(postings))
+                for document_id, frequency in postings.items():
+                    scores[document_id] += similarity * idf * (1 + math.log(frequency))
+
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
@@ -6,15 +6,18 @@ from abc import ABC, abstractmethod
 from typing import Annotated, List, Type
 
 from fastapi import Cookie, Query, WebSocketException, status
-from app.swipe_session.services.swipe_session import SwipeSessionService
-from app.user.services.user import UserService
-from app.group.services.group import GroupService
-from core.db.enums import SwipeSessionEnum
+from app.group.repository.membership import MembershipRepository
+from app.swipe_session.repository.swipe_session import SwipeSessionRepository
+from app.user.repository.user import UserRepository
+from core.db.enums import GroupRoleEnum, SwipeSessionEnum
+from core.db.models import SwipeSession, User
 
 from core.exceptions.base import CustomException, UnauthorizedException
 from core.exceptions.hashids import IncorrectHashIDException
 from core.exceptions.websocket import InactiveException, InvalidIdException
+from core.helpers.cache.lru import MISSING
 from core.helpers.hashid import decode_single
+from core.helpers.permission import QUERIES, TOKEN_ONLY, CompiledPermissions
 from core.utils.token_helper import TokenHelper
 
 # pylint: disable=too-few-public-methods
@@ -34,6 +37,7 @@ class BaseWebsocketPermission(ABC):
     """Base permission for websocket authentication and authorization"""
 
     exception = UnauthorizedException
+    cost = QUERIES
 
     @abstractmethod
     async def has_permission(self, **kwargs) -> bool:
@@ -43,83 +47,132 @@ class BaseWebsocketPermission(ABC):
 class AllowAll(BaseWebsocketPermission):
     """Always allow access"""
 
+    cost = TOKEN_ONLY
+
     async def has_permission(self, **kwargs) -> bool:
         """Function to check permission"""
         return True
 
 
+class HandshakeContext:
+    """Credentials of a websocket handshake, each decoded or loaded once.
+
+    The permission checks and the handler of a connection share one context,
+    so the token, the ids and the rows they refer to are decoded or queried at
+    most once per handshake.
+
+    Attributes:
+        access_token (str | None): The JWT of the client.
+        hashed_swipe_session_id (str | None): The hashed id of the swipe session.
+    """
+
+    def __init__(self, access_token: str | None, swipe_session_id: str | None):
+        self.access_token = access_token
+        self.hashed_swipe_session_id = swipe_session_id
+        self._user_id = MISSING
+        self._swipe_session_id = MISSING
+        self._user = MISSING
+        self._swipe_session = MISSING
+        self._is_member = MISSING
+
+    def get_user_id(self) -> int | None:
+        """The user id in the access token, None if the token is invalid."""
+        if self._user_id is MISSING:
+            self._user_id = None
+            if self.access_token:
+                try:
+                    self._user_id = TokenHelper.decode_user_id(self.access_token)
+                except CustomException:
+                    pass
+        return self._user_id
+
+    def get_swipe_session_id(self) -> int | None:
+        """The swipe session id, None if it isn't a valid hashid."""
+        if self._swipe_session_id is MISSING:
+            self._swipe_session_id = None
+            if self.hashed_swipe_session_id:
+                try:
+                    self._swipe_session_id = decode_single(
+                        self.hashed_swipe_session_id
+                    )
+                except IncorrectHashIDException:
+                    pass
+        return self._swipe_session_id
+
+    async def get_user(self) -> User | None:
+        """The user of the access token, None if it doesn't exist."""
+        if self._user is MISSING:
+            user_id = self.get_user_id()
+            self._user = await UserRepository().get_by_id(user_id) if user_id else None
+        return self._user
+
+    async def get_swipe_session(self) -> SwipeSession | None:
+        """The swipe session, with its swipes, None if it doesn't exist."""
+        if self._swipe_session is MISSING:
+            swipe_session_id = self.get_swipe_session_id()
+            self._swipe_session = (
+                await SwipeSessionRepository().get_by_id(swipe_session_id)
+                if swipe_session_id
+                else None
+            )
+        return self._swipe_session
+
+    async def is_session_member(self) -> bool:
+        """Whether the user is a member of the group of the swipe session."""
+        if self._is_member is MISSING:
+            user = await self.get_user()
+            swipe_session = await self.get_swipe_session()
+            self._is_member = bool(user and swipe_session) and (
+                await MembershipRepository().get_role(swipe_session.group_id, user.id)
+                != GroupRoleEnum.NONE
+            )
+        return self._is_member
+
+
 class IsAuthenticated(BaseWebsocketPermission):
     """Only allow access if authenticated"""
 
-    async def has_permission(self, **kwargs) -> bool:
-        """Function to check permission"""
-        access_token = kwargs.get("access_token")
+    cost = TOKEN_ONLY
 
-        if not access_token:
-            return False
+    async def has_permission(self, context: HandshakeContext, **kwargs) -> bool:
+        """Function to check permission"""
+        del kwargs
 
-        try:
-            TokenHelper.decode(token=access_token)
+        return context.get_user_id() is not None
 
-        except CustomException:
-            return False
 
-        return True
+class IsValidSessionId(BaseWebsocketPermission):
+    """Only allow access if the swipe session id is a valid hashid"""
 
+    exception = InvalidIdException
+    cost = TOKEN_ONLY
 
-class IsSessionMember(BaseWebsocketPermission):
-    """Only allow access if authenticated"""
-
-    async def has_permission(self, **kwargs) -> bool:
+    async def has_permission(self, context: HandshakeContext, **kwargs) -> bool:
         """Function to check permission"""
-        access_token = kwargs.get("access_token")
-        swipe_session_id = kwargs.get("swipe_session_id")
+        del kwargs
 
-        if not access_token or not swipe_session_id:
-            return False
+        return context.get_swipe_session_id() is not None
 
-        try:
-            decoded_token = TokenHelper.decode(token=access_token)
-        except CustomException:
-            return False
 
-        try:
-            user_id = decode_single(decoded_token.get("user_id"))
-            swipe_session_id = decode_single(swipe_session_id)
-        except IncorrectHashIDException:
-            self.exception = InvalidIdException
-            return False
+class IsSessionMember(BaseWebsocketPermission):
+    """Only allow access if member of the group of the swipe session"""
 
-        try:
-            await UserService().get_by_id(user_id)
-            swipe_session = await SwipeSessionService().get_swipe_session_by_id(
-                swipe_session_id
-            )
-        except CustomException:
-            return False
+    async def has_permission(self, context: HandshakeContext, **kwargs) -> bool:
+        """Function to check permission"""
+        del kwargs
 
-        return await GroupService().is_member(swipe_session.group_id, user_id)
+        return await context.is_session_member()
 
 
 class IsActiveSession(BaseWebsocketPermission):
     """Only allow access if session is active"""
     exception = InactiveException
 
-    async def has_permission(self, **kwargs) -> bool:
+    async def has_permission(self, context: HandshakeContext, **kwargs) -> bool:
         """Function to check permission"""
-        swipe_session_id = kwargs.get("swipe_session_id")
+        del kwargs
 
-        if not swipe_session_id:
-            return False
-
-        try:
-            swipe_session_id = decode_single(swipe_session_id)
-        except IncorrectHashIDException:
-            return False
-
-        swipe_session = await SwipeSessionService().get_swipe_session_by_id(
-            swipe_session_id
-        )
+        swipe_session = await context.get_swipe_session()
         if not swipe_session:
             return False
 
@@ -127,24 +180,13 @@ class IsActiveSession(BaseWebsocketPermission):
 
 
 class WebsocketPermission:
-    """Callable class to check permissions with the given access token"""
+    """Callable class to check permissions of a handshake"""
 
     def __init__(self, permissions: List[List[Type[BaseWebsocketPermission]]]):
         self.permissions = permissions
+        self.compiled = CompiledPermissions(permissions)
 
     async def __call__(self, **kwargs):
-        exceptions = {}
-        for i, permission_combo in enumerate(self.permissions):
-            exceptions[i] = []
-
-            for permission in permission_combo:
-                cls = permission()
-                if not await cls.has_permission(**kwargs):
-                    exceptions[i].append(cls.exception)
-
-        if any(len(excs) == 0 for _, excs in exceptions.items()):
-            return
-
-        for _, excs in exceptions.items():
-            if len(excs) > 0:
-                raise excs[0]
+        exception = await self.compiled.evaluate(**kwargs)
+        if exception:
+            raise exception
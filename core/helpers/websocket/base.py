@@ -11,6 +11,7 @@ from core.exceptions.websocket import (
     SuccessfullConnection,
 )
 from core.helpers.logger import get_logger
+from core.helpers.rate_limit import RateLimit
 from core.helpers.schemas.websocket import WebsocketPacketSchema
 from core.helpers.websocket.manager import WebsocketConnectionManager
 from pydantic.main import ModelMetaclass
@@ -22,9 +23,11 @@ class BaseWebsocketService:
         manager: WebsocketConnectionManager,
         schema: ModelMetaclass = WebsocketPacketSchema,
         actions: dict = None,
+        rate_limits: dict[str, RateLimit] = None,
     ) -> None:
         self.manager = manager
         self.schema = schema
+        self.rate_limits = rate_limits or {}
 
         if not actions:
             self.actions = {
@@ -34,16 +37,23 @@ class BaseWebsocketService:
         else:
             self.actions = actions
 
-    async def handler(self, websocket: WebSocket, pool_id: int, **kwargs) -> None:
+    async def handler(
+        self, websocket: WebSocket, pool_id: int, rate_limit_key=None, **kwargs
+    ) -> None:
         """The handler for the Websocket protocol.
 
         Args:
             websocket (WebSocket): The websocket connection.
             pool_id (int): The identifiër for which pool the websocket will be
             connected to.
+            rate_limit_key: Who the rate limits of the actions apply to, e.g. the
+            user id. Defaults to the connection.
             kwargs: Any extra arguments which will be passed to the functions ran by
             the handler.
         """
+        if rate_limit_key is None:
+            rate_limit_key = f"connection-{id(websocket)}"
+
         await self.manager.connect(websocket, pool_id)
         await self.manager.handle_connection_code(websocket, SuccessfullConnection)
 
@@ -56,6 +66,7 @@ class BaseWebsocketService:
                     packet: self.schema = await self.manager.receive_data(
                         websocket, self.schema
                     )
+                    await self.check_rate_limit(packet, rate_limit_key)
 
                 except CustomException as exc:
                     await self.manager.handle_connection_code(websocket, exc)
@@ -90,6 +101,21 @@ class BaseWebsocketService:
             logging.exception(exc)
             print(exc)
 
+    async def check_rate_limit(self, packet: WebsocketPacketSchema, key) -> None:
+        """Count a packet against the rate limit of its action, if any.
+
+        Args:
+            packet (WebsocketPacketSchema): WebsocketPacket sent by client.
+            key: Who the rate limit applies to.
+
+        Raises:
+            RateLimitedException: If the budget of the action is used up, the
+            packet is dropped.
+        """
+        rate_limit = self.rate_limits.get(packet.action.value)
+        if rate_limit:
+            await rate_limit.hit(key)
+
     async def handle_action_not_implemented(self, websocket: WebSocket, **kwargs):
         """Handle an action packet that has not been implemented.
 
@@ -4,6 +4,7 @@ Connection manager for websockets
 
 import json
 import logging
+import orjson
 import random
 import time
 from starlette.websockets import WebSocketState
@@ -52,6 +53,7 @@ class WebsocketConnectionManager:
 
         self.active_pools: dict = {}
         self.permissions = permissions
+        self.permission_checker = WebsocketPermission(permissions)
 
     async def queued_run(self, pool_id, func, **kwargs):
         # ticket = random.random()
@@ -106,10 +108,10 @@ class WebsocketConnectionManager:
         Returns:
             bool: True if the permission check succeeds.
         """
-        if not permissions:
-            permissions = self.permissions
-
-        perm_checker = WebsocketPermission(permissions)
+        if permissions:
+            perm_checker = WebsocketPermission(permissions)
+        else:
+            perm_checker = self.permission_checker
 
         try:
             await perm_checker(**kwargs)
@@ -149,6 +151,43 @@ class WebsocketConnectionManager:
         ):
             await websocket.send_json(data)
 
+    async def send_raw(self, websocket: WebSocket, data: bytes):
+        if (
+            websocket.client_state == WebSocketState.CONNECTED
+            and websocket.application_state == WebSocketState.CONNECTED
+        ):
+            await websocket.send_text(data.decode())
+
+    @staticmethod
+    def render_packet(action: str, payload: dict = None, **documents: bytes) -> bytes:
+        """
+        Renders a packet whose payload embeds already serialized JSON documents.
+
+        Args:
+            action (str): The action of the packet.
+            payload (dict, optional): Plain payload fields, serialized here.
+            **documents (bytes): Payload fields holding pre-rendered JSON.
+
+        Returns:
+            bytes: The packet as JSON, equal to what a WebsocketPacketSchema with
+            the same contents would produce.
+        """
+        fields = [
+            orjson.dumps(key) + b":" + orjson.dumps(value)
+            for key, value in (payload or {}).items()
+        ]
+        fields += [
+            orjson.dumps(key) + b":" + document for key, document in documents.items()
+        ]
+
+        return (
+            b'{"action":'
+            + orjson.dumps(action)
+            + b',"payload":{'
+            + b",".join(fields)
+            + b"}}"
+        )
+
     async def receive_data(self, websocket: WebSocket, schema: ModelMetaclass):
         """
         Receives and validates data from the given websocket.
@@ -341,6 +380,16 @@ class WebsocketConnectionManager:
         """
         await self.send_data(websocket, packet.dict())
 
+    async def personal_raw_packet(self, websocket: WebSocket, packet: bytes) -> None:
+        """
+        Sends a pre-rendered packet to a single WebSocket connection.
+
+        Args:
+            websocket (WebSocket): The WebSocket connection to send the packet to.
+            packet (bytes): The packet, as rendered by ``render_packet``.
+        """
+        await self.send_raw(websocket, packet)
+
     async def global_broadcast(self, packet: WebsocketPacketSchema) -> None:
         """Broadcasts a packet to all connected websockets across all pools.
 
@@ -361,6 +410,16 @@ class WebsocketConnectionManager:
         for websocket in self.active_pools[pool_id]["connections"]:
             await self.send_data(websocket, packet.dict())
 
+    async def pool_broadcast_raw(self, pool_id: str, packet: bytes) -> None:
+        """Broadcasts a pre-rendered packet to all websockets of a specific pool.
+
+        Args:
+            pool_id (str): The ID of the pool to broadcast to.
+            packet (bytes): The packet, as rendered by ``render_packet``.
+        """
+        for websocket in self.active_pools[pool_id]["connections"]:
+            await self.send_raw(websocket, packet)
+
     def get_connection_count(self, pool_id: str | None = None) -> int:
         """ "Gets the total number of active websocket connections across all pools, or
         the number of connections for a specific pool if pool_id is provided.
@@ -0,0 +1,66 @@
+"""
+Repository for the versions of catalog collections
+"""
+
+import time
+from typing import Dict
+
+from sqlalchemy import select, update
+
+from core.db.enums import CatalogEnum
+from core.db.models import CatalogVersion
+from core.db.session import session
+from core.db.transactional import after_commit
+
+# collection -> time.monotonic() of the last bump made by this process
+local_bumps: Dict[CatalogEnum, float] = {}
+
+
+class CatalogVersionRepository:
+    """
+    Keeps a version number per catalog collection (tags, ingredients, ...).
+
+    Services bump the version of a collection whenever they write to it, so
+    readers can tell whether a copy they already have is still current by
+    reading a single integer.
+    """
+
+    async def get(self, name: CatalogEnum) -> int:
+        """
+        Returns the current version of a collection.
+
+        :param name: The collection.
+        :return: The version, 0 if the collection was never written to.
+        """
+        query = select(CatalogVersion.version).where(CatalogVersion.name == name)
+        result = await session.execute(query)
+        return result.scalar() or 0
+
+    async def bump(self, name: CatalogEnum) -> None:
+        """
+        Increments the version of a collection, as part of the current transaction.
+
+        The bump is also recorded in ``local_bumps`` once committed, so in-process
+        copies of the collection know to check the version again. Recorded
+        before, a copy could still load the old version after the bump and count
+        as fresh.
+
+        :param name: The collection.
+        """
+        query = (
+            update(CatalogVersion)
+            .where(CatalogVersion.name == name)
+            .values(version=CatalogVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        result = await session.execute(query)
+
+        if not result.rowcount:
+            session.add(CatalogVersion(name=name, version=1))
+
+        await after_commit(record_bump, name)
+
+
+def record_bump(name: CatalogEnum) -> None:
+    """Records a committed bump of a collection in ``local_bumps``."""
+    local_bumps[name] = time.monotonic()
@@ -0,0 +1,186 @@
+"""
+Keyset pagination for listing queries.
+
+Instead of an offset, a page starts after the sort key of the last row of the
+previous page. Every page is then a range scan on the sort index, no matter how
+far into the listing it is, and rows inserted meanwhile don't shift the pages.
+"""
+
+import base64
+import binascii
+from datetime import date, datetime
+from typing import Any, NamedTuple, Sequence
+
+import orjson
+from sqlalchemy import DateTime, Select, and_, func, literal, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from core.db.session import engines, session
+from core.exceptions import InvalidCursorException
+
+
+class Page(NamedTuple):
+    """
+    A page of a listing.
+
+    items: The rows of the page.
+    next_cursor: The cursor of the next page, None on the last page.
+    """
+
+    items: list
+    next_cursor: str | None
+
+
+def sort_keys(
+    sort_column: InstrumentedAttribute, key_column: InstrumentedAttribute
+) -> list[InstrumentedAttribute]:
+    """
+    Returns the columns to order a listing by, ending with a unique column so
+    every row has a distinct position.
+
+    :param sort_column: The column requested to sort by.
+    :param key_column: A unique column, e.g. the primary key.
+    :return: The columns of the sort key.
+    """
+    if sort_column is key_column:
+        return [key_column]
+    return [sort_column, key_column]
+
+
+def encode_cursor(columns: Sequence[InstrumentedAttribute], row: Any) -> str:
+    """
+    Returns the cursor of the page following the given row.
+
+    :param columns: The columns of the sort key.
+    :param row: The last row of the current page.
+    :return: An opaque, URL safe cursor.
+    """
+    payload = {
+        "keys": [column.key for column in columns],
+        "values": [getattr(row, column.key) for column in columns],
+    }
+    return base64.urlsafe_b64encode(orjson.dumps(payload)).decode()
+
+
+def decode_cursor(columns: Sequence[InstrumentedAttribute], cursor: str) -> list:
+    """
+    Returns the sort key values stored in a cursor.
+
+    :param columns: The columns of the sort key.
+    :param cursor: A cursor made by ``encode_cursor`` for the same columns.
+    :return: The values, converted to the types of the columns.
+    :raises InvalidCursorException: If the cursor is malformed or was made for
+        another sort order.
+    """
+    try:
+        payload = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["keys"] != [column.key for column in columns]:
+            raise InvalidCursorException
+
+        return [
+            _parse_value(column, value)
+            for column, value in zip(columns, payload["values"], strict=True)
+        ]
+    except (
+        binascii.Error,
+        orjson.JSONDecodeError,
+        KeyError,
+        TypeError,
+        ValueError,
+    ) as exc:
+        raise InvalidCursorException from exc
+
+
+def _parse_value(column: InstrumentedAttribute, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(value)
+    if python_type is date:
+        return date.fromisoformat(value)
+    return python_type(value)
+
+
+def _comparable(column: InstrumentedAttribute, expression):
+    # SQLite keeps datetimes as text in the format they were written with, e.g.
+    # with or without microseconds, so equal times only compare equal once
+    # both sides are brought into the same format.
+    if engines["reader"].dialect.name == "sqlite" and isinstance(
+        column.type, DateTime
+    ):
+        return func.strftime("%Y-%m-%d %H:%M:%f", expression)
+    return expression
+
+
+def after_cursor(
+    columns: Sequence[InstrumentedAttribute], values: Sequence[Any], descending: bool
+):
+    """
+    Returns the condition for rows sorted after the given sort key.
+
+    Written out as ``a > x OR (a = x AND b > y)`` rather than as a row value
+    comparison, which not every database supports.
+
+    :param columns: The columns of the sort key.
+    :param values: The sort key of the last row of the previous page.
+    :param descending: Whether the listing is sorted in descending order.
+    """
+    expressions = [_comparable(column, column) for column in columns]
+    values = [
+        _comparable(column, literal(value, column.type))
+        for column, value in zip(columns, values)
+    ]
+
+    conditions = []
+    for position, (expression, value) in enumerate(zip(expressions, values)):
+        ties = [
+            tied_expression == tied_value
+            for tied_expression, tied_value in zip(
+                expressions[:position], values[:position]
+            )
+        ]
+        after = expression < value if descending else expression > value
+        conditions.append(and_(*ties, after))
+    return or_(*conditions)
+
+
+async def paginate(
+    query: Select,
+    columns: Sequence[InstrumentedAttribute],
+    cursor: str | None,
+    limit: int,
+    descending: bool = False,
+) -> Page:
+    """
+    Returns a page of the entities selected by a query.
+
+    Collections of the entities must be loaded with ``selectinload``, joined
+    collections would count towards the limit.
+
+    :param query: The query selecting the entities, filters applied.
+    :param columns: The columns of the sort key, ending with a unique column.
+    :param cursor: The cursor of the page, None for the first page.
+    :param limit: The maximum amount of entities in the page.
+    :param descending: Whether to sort in descending order.
+    :return: The page.
+    :raises InvalidCursorException: If the cursor is invalid.
+    """
+    if cursor:
+        query = query.where(
+            after_cursor(columns, decode_cursor(columns, cursor), descending)
+        )
+
+    expressions = [_comparable(column, column) for column in columns]
+    query = query.order_by(
+        *(
+            expression.desc() if descending else expression.asc()
+            for expression in expressions
+        )
+    ).limit(limit + 1)
+    result = await session.execute(query)
+    items = list(result.scalars().all())
+
+    if len(items) <= limit:
+        return Page(items, None)
+
+    items = items[:limit]
+    return Page(items, encode_cursor(columns, items[-1]))
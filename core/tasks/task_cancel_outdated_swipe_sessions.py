@@ -1,6 +1,8 @@
-from sqlalchemy import and_, or_, update
+from sqlalchemy import and_, delete, or_, select, update
+from app.swipe_session.services.swipe_session import FINISHED_STATUSES
+from core.config import config
 from core.db.enums import SwipeSessionEnum
-from core.db.models import SwipeSession
+from core.db.models import Swipe, SwipeSession, SwipeSessionSummary
 from core.tasks.base_task import BaseTask
 from datetime import datetime, timedelta
 
@@ -40,4 +42,46 @@ class Task(BaseTask):
         )
         self.session.execute(query)
         self.session.commit()
-        print("END OF TASK")
\ No newline at end of file
+        self.compact_finished_swipe_sessions()
+        print("END OF TASK")
+
+    def compact_finished_swipe_sessions(self) -> None:
+        # Fold the swipes of the cancelled sessions, and of any other finished
+        # session that still has swipes, into their summaries. The same as
+        # SwipeSessionService.compact_swipe_session, committed per batch.
+        # Locked sessions are skipped, another worker is compacting them.
+        while True:
+            query = (
+                select(SwipeSession)
+                .where(
+                    and_(
+                        SwipeSession.status.in_(FINISHED_STATUSES),
+                        select(Swipe.id)
+                        .where(Swipe.swipe_session_id == SwipeSession.id)
+                        .exists(),
+                    )
+                )
+                .order_by(SwipeSession.id)
+                .limit(config.SWIPE_COMPACTION_BATCH_SIZE)
+                .with_for_update(skip_locked=True, of=SwipeSession)
+            )
+            swipe_sessions = self.session.execute(query).scalars().all()
+            if not swipe_sessions:
+                return
+
+            for swipe_session in swipe_sessions:
+                rows = self.session.execute(
+                    select(Swipe.user_id, Swipe.recipe_id, Swipe.like).where(
+                        Swipe.swipe_session_id == swipe_session.id
+                    )
+                ).all()
+                summary = swipe_session.summary or SwipeSessionSummary.empty()
+                summary.add_swipes(rows)
+                swipe_session.summary = summary
+                self.session.execute(
+                    delete(Swipe)
+                    .where(Swipe.swipe_session_id == swipe_session.id)
+                    .execution_options(synchronize_session=False)
+                )
+
+            self.session.commit()
\ No newline at end of file
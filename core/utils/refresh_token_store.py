@@ -0,0 +1,213 @@
+"""
+Rotation store of refresh tokens.
+
+Every login starts a family of refresh tokens. Refreshing rotates the presented
+token: it gets a successor and may not be used again. Presenting a token that
+already has a successor means it leaked, so the whole family is revoked and
+every client holding a token of it has to log in again.
+
+Tokens are kept until they expire, ``REFRESH_TOKEN_EXPIRE_PERIOD`` after they
+were issued, so the store doesn't grow beyond the tokens still valid.
+"""
+
+import secrets
+import threading
+from abc import ABC, abstractmethod
+from typing import NamedTuple
+
+from redis.exceptions import ResponseError
+
+from core.config import config
+from core.exceptions import DecodeTokenException, UnauthorizedException
+from core.helpers.cache import LRUCache
+from core.helpers.redis import redis
+
+
+def generate_id() -> str:
+    """Random id of a token or family."""
+    return secrets.token_hex(15)
+
+
+class RefreshTokenStore(ABC):
+    """Store of refresh token families."""
+
+    def __init__(self, ttl: int = config.REFRESH_TOKEN_EXPIRE_PERIOD):
+        self.ttl = int(ttl)
+
+    @abstractmethod
+    async def issue(self) -> str:
+        """Start a new family.
+
+        Returns:
+            str: The id of its first token.
+        """
+
+    @abstractmethod
+    async def rotate(self, token_id: str) -> str:
+        """Replace a token by its successor, atomically.
+
+        Args:
+            token_id (str): The id of the presented token.
+
+        Returns:
+            str: The id of the successor.
+
+        Raises:
+            DecodeTokenException: If the token is unknown or expired.
+            UnauthorizedException: If the token was already rotated, its family
+            is revoked.
+        """
+
+    @abstractmethod
+    async def revoke_family(self, family_id: str) -> None:
+        """Forget every token of a family."""
+
+
+class MemoryToken(NamedTuple):
+    family_id: str
+    next_id: str | None
+
+
+class MemoryRefreshTokenStore(RefreshTokenStore):
+    """Process-local store, for a single worker and for tests.
+
+    Tokens are kept in a LRU, the oldest tokens are dropped first if more than
+    ``maxsize`` tokens are alive.
+    """
+
+    def __init__(
+        self,
+        ttl: int = config.REFRESH_TOKEN_EXPIRE_PERIOD,
+        maxsize: int = config.REFRESH_TOKEN_STORE_SIZE,
+    ):
+        super().__init__(ttl)
+        # token id -> MemoryToken
+        self.tokens = LRUCache(maxsize=maxsize, ttl=self.ttl)
+        # family id -> ids of its tokens
+        self.families = LRUCache(maxsize=maxsize, ttl=self.ttl)
+        self._lock = threading.Lock()
+
+    async def issue(self) -> str:
+        family_id = generate_id()
+        token_id = generate_id()
+        with self._lock:
+            self.tokens.set(token_id, MemoryToken(family_id, None))
+            self.families.set(family_id, [token_id])
+        return token_id
+
+    async def rotate(self, token_id: str) -> str:
+        next_id = generate_id()
+        with self._lock:
+            token = self.tokens.get(token_id)
+            if token is None:
+                raise DecodeTokenException
+
+            if token.next_id is None:
+                self.tokens.set(token_id, token._replace(next_id=next_id))
+                self.tokens.set(next_id, MemoryToken(token.family_id, None))
+                members = self.families.get(token.family_id, [])
+                self.families.set(token.family_id, [*members, next_id])
+                return next_id
+
+        await self.revoke_family(token.family_id)
+        raise UnauthorizedException
+
+    async def revoke_family(self, family_id: str) -> None:
+        with self._lock:
+            for token_id in self.families.pop(family_id, []):
+                self.tokens.pop(token_id)
+
+
+# Rotates KEYS[1] to the token ARGV[1] in one step. Returns {1, family} when
+# rotated, {0} when the token is unknown and {2, family} when it was rotated
+# before.
+ROTATE_SCRIPT = """
+local family = redis.call('HGET', KEYS[1], 'family')
+if not family then
+    return {0}
+end
+if redis.call('HGET', KEYS[1], 'next') ~= '' then
+    return {2, family}
+end
+local next_key = ARGV[3] .. ARGV[1]
+local family_key = ARGV[4] .. family
+redis.call('HSET', KEYS[1], 'next', ARGV[1])
+redis.call('HSET', next_key, 'family', family, 'next', '')
+redis.call('EXPIRE', next_key, ARGV[2])
+redis.call('SADD', family_key, ARGV[1])
+redis.call('EXPIRE', family_key, ARGV[2])
+return {1, family}
+"""
+
+
+class RedisRefreshTokenStore(RefreshTokenStore):
+    """Store shared by all workers.
+
+    A token is a hash ``refresh_token::<id>`` with its family and successor, a
+    family a set ``refresh_family::<id>`` of its tokens. Both expire with the
+    tokens. Rotation runs as a script, so two workers can't both rotate the
+    same token.
+    """
+
+    TOKEN_PREFIX = "refresh_token::"
+    FAMILY_PREFIX = "refresh_family::"
+
+    def __init__(self, ttl: int = config.REFRESH_TOKEN_EXPIRE_PERIOD):
+        super().__init__(ttl)
+        self.rotate_script = redis.register_script(ROTATE_SCRIPT)
+
+    async def issue(self) -> str:
+        family_id = generate_id()
+        token_id = generate_id()
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.hset(
+                self.TOKEN_PREFIX + token_id,
+                mapping={"family": family_id, "next": ""},
+            )
+            pipe.expire(self.TOKEN_PREFIX + token_id, self.ttl)
+            pipe.sadd(self.FAMILY_PREFIX + family_id, token_id)
+            pipe.expire(self.FAMILY_PREFIX + family_id, self.ttl)
+            await pipe.execute()
+        return token_id
+
+    async def rotate(self, token_id: str) -> str:
+        next_id = generate_id()
+        try:
+            result = await self.rotate_script(
+                keys=[self.TOKEN_PREFIX + token_id],
+                args=[next_id, self.ttl, self.TOKEN_PREFIX, self.FAMILY_PREFIX],
+            )
+        except ResponseError as exc:
+            raise DecodeTokenException from exc
+
+        if result[0] == 1:
+            return next_id
+        if result[0] == 0:
+            raise DecodeTokenException
+
+        await self.revoke_family(result[1].decode())
+        raise UnauthorizedException
+
+    async def revoke_family(self, family_id: str) -> None:
+        family_key = self.FAMILY_PREFIX + family_id
+        batch = []
+        async for token_id in redis.sscan_iter(family_key):
+            batch.append(self.TOKEN_PREFIX + token_id.decode())
+            if len(batch) >= 500:
+                await redis.delete(*batch)
+                batch = []
+        if batch:
+            await redis.delete(*batch)
+        await redis.delete(family_key)
+
+
+def get_refresh_token_store() -> RefreshTokenStore:
+    """The store configured by ``REFRESH_TOKEN_STORE``."""
+    stores = {
+        "memory": MemoryRefreshTokenStore,
+        "redis": RedisRefreshTokenStore,
+    }
+    return stores[config.REFRESH_TOKEN_STORE]()
+
+
+refresh_token_store = get_refresh_token_store()
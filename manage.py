@@ -0,0 +1,100 @@
+"""
+Maintenance commands that run against the configured database
+
+Usage:
+    python manage.py [COMMAND]
+
+Commands:
+    recount-judgements : Repair the like/dislike counters of all recipes
+    import-recipes     : Import recipes from an NDJSON file
+    compact-swipes     : Fold the swipes of finished swipe sessions into summaries
+"""
+
+import asyncio
+
+import click
+
+from app.recipe.repository.recipe import RecipeRepository
+from app.recipe.services.recipe_import import RecipeImportService
+from app.swipe_session.services.swipe_session import SwipeSessionService
+from app.user.exceptions.user import UserNotFoundException
+from core.config import config
+from core.db import session, standalone_session
+from core.helpers.ndjson import iter_file
+
+
+@click.group()
+def cli():
+    """Maintenance commands."""
+
+
+@cli.command("recount-judgements")
+def recount_judgements():
+    """
+    Recalculate the like and dislike counters of every recipe from its judgements.
+
+    Only recipes whose counters drifted are written to.
+    """
+
+    @standalone_session
+    async def _recount():
+        repaired = await RecipeRepository().recount_judgements()
+        await session.commit()
+        click.echo(f"Repaired the counters of {repaired} recipe(s).")
+
+    asyncio.run(_recount())
+
+
+@cli.command("import-recipes")
+@click.argument("file", type=click.File("rb"))
+@click.option("--creator-id", type=int, required=True, help="ID of the creating user.")
+@click.option("--chunk-size", type=int, default=config.RECIPE_IMPORT_CHUNK_SIZE)
+def import_recipes(file, creator_id, chunk_size):
+    """
+    Import recipes from FILE, one JSON recipe per line ("-" for stdin).
+
+    Records that can't be imported are reported and skipped.
+    """
+
+    @standalone_session
+    async def _import():
+        try:
+            result = await RecipeImportService().import_ndjson(
+                iter_file(file), creator_id, chunk_size
+            )
+        except UserNotFoundException as exc:
+            raise click.ClickException(exc.message) from exc
+        for error in result["errors"]:
+            click.echo(f"line {error['line']}: {error['error']}", err=True)
+        click.echo(
+            f"Imported {result['imported']} recipe(s), "
+            f"skipped {len(result['errors'])} record(s)."
+        )
+
+    asyncio.run(_import())
+
+
+@cli.command("compact-swipes")
+@click.option("--batch-size", type=int, default=config.SWIPE_COMPACTION_BATCH_SIZE)
+def compact_swipes(batch_size):
+    """
+    Fold the swipes of every completed or cancelled swipe session into its
+    summary and delete them.
+
+    Sessions are compacted and committed BATCH_SIZE at a time.
+    """
+
+    @standalone_session
+    async def _compact():
+        service = SwipeSessionService()
+        total = 0
+        while compacted := await service.compact_finished_swipe_sessions(batch_size):
+            await session.commit()
+            total += compacted
+        click.echo(f"Compacted {total} swipe session(s).")
+
+    asyncio.run(_compact())
+
+
+if __name__ == "__main__":
+    cli()
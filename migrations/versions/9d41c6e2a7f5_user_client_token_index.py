@@ -0,0 +1,33 @@
+"""user client token covering index
+
+Revision ID: 9d41c6e2a7f5
+Revises: 7e2f4a9b1c83
+Create Date: 2023-07-13 10:41:52.604117
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "9d41c6e2a7f5"
+down_revision = "7e2f4a9b1c83"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # The unique index replaces the unique constraint, and includes the id so a
+    # login by client token is an index-only scan.
+    op.drop_constraint("user_client_token_key", "user", type_="unique")
+    op.create_index(
+        "ix_user_client_token",
+        "user",
+        ["client_token"],
+        unique=True,
+        postgresql_include=["id"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_user_client_token", table_name="user")
+    op.create_unique_constraint("user_client_token_key", "user", ["client_token"])